@@ -1,15 +1,21 @@
 from chessboard_pieces      import *
 from chessboard_scoreboard  import Scoreboard
 from chessboard_history     import History
-from chessboard_mini        import MiniChessboard
-from typing                 import Literal, Union
+from chessboard_fen         import POSITION_CACHE, STARTING_FEN, build_fen, template_piece
+from chessboard_state       import BoardState, CASTLING_RIGHTS
+from chessboard_index       import PieceIndex, PIECE_IDENTS, position_key
+from chessboard_render      import TerminalRenderer, clear_screen
+from chessboard_mate        import find_mate
+from chessboard_move        import *
+from typing                 import Iterator, Literal, Union
 from prettytable            import PrettyTable
-import os
 
 # SOME IMPORTANT VARIABLES
 MAKE_RECORD_OF_MOVES_IN_OTHER_FILE = True   # Enables file recording
 MOVES_HISTORY_PATH = 'moves_his.txt'        # Default file path
+REVIEW_FINISHED_GAMES = False               # Blunder report of every finished game, next to the history file (see `chessboard_review`)
 USER_COLOR_CHOICE  = 'white'                # user's color choice to compete with chess bot # 2nd option: 'black'
+ANALYSIS_SETTINGS  = {'lines': 3, 'depth': 4, 'move_time': 3.0}  # `--mpv` command: ranked moves, max. depth, seconds
 PLAYER_NAMES = { 
     'white': "Magnus Carlsen",
     'black': "Hikaru Nakamura"
@@ -31,7 +37,8 @@ class ChessBoard:
     
     def __init__(self, board_notation='default',
              have_history: bool = True,
-             have_score_board: bool = True):
+             have_score_board: bool = True,
+             trusted: bool = False):
         """ 
         ### Initialize the chessboard with a given board notation. ###
 
@@ -43,6 +50,8 @@ class ChessBoard:
             - Other notations: The board will be initialized based on the given notation 
                 (e.g., RNBQKBq1/PPP4P/3P2P1/5P2/2b1p3/8/pppp1ppp/rnb1k1nr for a custom configuration, 
                 or 8/8/8/8/8/8/8/8 for a completely empty board).
+            - Full FEN: A standard six-field FEN (uppercase = White) is loaded with `setup_fen()`
+                (e.g., rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1).
             
         `have_history (bool, optional)`: Determines whether to maintain a history of moves.
             - If True, moves will be stored as tuples of the form `(start_position, end_position)`.
@@ -51,30 +60,34 @@ class ChessBoard:
         `have_score_board (bool, optional)`: Determines whether to maintain a scoreboard.
             - If True, the scoreboard will track captured pieces and the capture scores for each player.
             - Defaults to True.
+
+        `trusted (bool, optional)`: Fast mode for replays and engines, moves are applied without computing
+            the check decoration (`+`) of the returned notation.
+            - Defaults to False.
         """
         self.board = [[] for _ in range(8)]
         self.have_history = have_history
         self.have_score_board = have_score_board
-        self.setup_notation(notations=board_notation)
+        self.trusted = trusted
+        self.renderer = TerminalRenderer()
+        if ' ' in board_notation.strip():
+            self.setup_fen(board_notation)
+        else:
+            self.setup_notation(notations=board_notation)
 
     def print_board(self):
-        """#### Print Chessboard Current State"""
-        print(f"{f'[{PLAYER_NAMES[self.player_turn][0].upper()}]' if UI_SETTINGS["Player's Name On Corner"] else '   '}|a||b||c||d||e||f||g||h|")
+        """#### Print Chessboard Current State
+        The frame goes through `self.renderer`: one write per frame, and only the squares
+        that changed since the previous frame are redrawn.
+        """
+        header = f"{f'[{PLAYER_NAMES[self.player_turn][0].upper()}]' if UI_SETTINGS["Player's Name On Corner"] else '   '}|a||b||c||d||e||f||g||h|"
         if not UI_SETTINGS["Display Colored Board"]:
-            for i, row in enumerate(self.board):
-                row_str = "".join(str(piece) for piece in row)
-                print(f"{8 - i}--{row_str}")
+            cells = [[str(piece) for piece in row] for row in self.board]
         else:
-            for i in range(8):
-                print(f"{8 - i}--", end="")
-                for j in range(8):
-                    if (i + j) % 2 == 0:
-                        # Dark square
-                        print(f"\033[48;2;{40+R};{40+G};{40+B}m\033[38;2;255;255;255m{self.board[i][j]}\033[0m", end="")
-                    else:
-                        # Light square
-                        print(f"\033[48;2;{100+R};{100+G};{100+B}m\033[38;2;255;255;255m{self.board[i][j]}\033[0m", end="")
-                print()
+            dark = f"\033[48;2;{40+R};{40+G};{40+B}m\033[38;2;255;255;255m"
+            light = f"\033[48;2;{100+R};{100+G};{100+B}m\033[38;2;255;255;255m"
+            cells = [[f"{dark if (i + j) % 2 == 0 else light}{self.board[i][j]}\033[0m" for j in range(8)] for i in range(8)]
+        self.renderer.draw(header, cells)
     
     def change_player_turn(self):
         """
@@ -97,13 +110,15 @@ class ChessBoard:
         Behavior:
             - Updates the board to reflect the placement of all pieces in the list.
             - Assumes all pieces have valid and non-conflicting positions.
+            - Keeps `self.pieces` (the per-color piece index) in step, in O(1) per piece.
         """
         for piece in lst:
             col = ord(piece.position[0]) - ord('a')
             row = 8 - int(piece.position[1])
+            self.pieces.place(piece, self.board[row][col])
             self.board[row][col] = piece
     
-    def apply_history(self, mv_list: list, print_each_state=False, make_record=False):
+    def apply_history(self, mv_list: list, print_each_state=False, make_record=False, validate=False):
         """
         Apply History of Moves
 
@@ -117,6 +132,8 @@ class ChessBoard:
             after applying each move. Defaults to `False`.
             - `make_record (bool, optional)`: If `True`, adds the applied moves to the game's history record. 
             Defaults to `False`.
+            - `validate (bool, optional)`: If `True`, each move is checked with `is_legal()` first, and the
+            replay stops at the first illegal one (reported like a failing move). Defaults to `False`.
 
         Behavior:
             - Updates `self.board` for each move in `mv_list`.
@@ -143,12 +160,15 @@ class ChessBoard:
         """
 
         for mv in mv_list:
+            if validate and not self.is_legal(mv[0], mv[1][:2], mv[1][2:] or None):
+                print("ERR0R_REP0RT: Illegal move", mv, self.history)
+                break
             try:
                 note, d_n, a_n, m_t = self + mv
             except:
                 print("ERR0R_REP0RT:",self.history)
             if print_each_state:
-                self.clear_term()
+                self.renderer.invalidate() # The previous state's note, scores and prompt are below the board
                 self.print_board()
                 print(note)
                 self.score_board.print()
@@ -231,14 +251,14 @@ class ChessBoard:
             for j, not_ in enumerate(notation):
                 # Place Black pieces
                 if not_.isupper():
-                    row.append(piece_classes[not_](color='b', position=f"{chr(ord('a') + j)}{8 - i}"))
+                    row.append(piece_classes[not_](color='b', position=f"{chr(ord('a') + len(row))}{8 - i}"))
                 # Place White pieces
                 elif not_.islower():
-                    row.append(piece_classes[not_.upper()](color='w', position=f"{chr(ord('a') + j)}{8 - i}"))
+                    row.append(piece_classes[not_.upper()](color='w', position=f"{chr(ord('a') + len(row))}{8 - i}"))
                 # Place Empty pieces (e.g., '8' represents 8 empty squares)
                 elif not_.isdigit():
                     for c in range(int(not_)):
-                        row.append(Empty(f"{chr(ord('a') + j)}{8 - i}"))
+                        row.append(Empty(f"{chr(ord('a') + len(row))}{8 - i}"))
             
             # Ensure the row has exactly 8 columns
             while len(row) < 8:
@@ -246,6 +266,118 @@ class ChessBoard:
             
             self.board[i] = row  # Place the row in the board
 
+        self.pieces = PieceIndex.from_rows(self.board)
+        # Fresh setup: every King/Rook still on its home square keeps its castling right
+        self.state = BoardState(castling=self.castling_from_placement())
+        self._undo_stack = []  # `push()` records, only valid for the pieces of this setup
+        self.start_fen = self.fen  # Position the history is played from (see `launch_chess_game()`)
+
+    def castling_from_placement(self) -> int:
+        """#### Castling rights bitmask allowed by the King/Rook placement alone (pieces assumed unmoved)"""
+        rights = 0
+        for color, rank in (('white', '1'), ('black', '8')):
+            king = self.piece_at(f"e{rank}")
+            if isinstance(king, King) and king.color == color:
+                for file, side in (('h', 'K'), ('a', 'Q')):
+                    rook = self.piece_at(f"{file}{rank}")
+                    if isinstance(rook, Rook) and rook.color == color:
+                        rights |= CASTLING_RIGHTS[(color, side)]
+        return rights
+
+    def setup_fen(self, fen: str = STARTING_FEN):
+        """
+        Set Up Chess Board Using a Full FEN
+
+        Unlike `setup_notation`, all six FEN fields are restored: piece placement, side to move,
+        castling rights, en passant target square, halfmove clock and fullmove number.
+
+        Args:
+            - `fen (str, optional)`: Standard FEN, where uppercase letters are **White** pieces.
+            Defaults to the standard starting position.
+
+        Behavior:
+            - The parsed position comes from `POSITION_CACHE`, so a repeated FEN is never parsed twice.
+            - Raises `ValueError` for a malformed FEN.
+            - `fen` is kept as `self.start_fen`, the position the game history starts from.
+
+        Example:
+            ```python
+            board = ChessBoard()
+            board.setup_fen('rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2')
+            print(board.fen) # Same string back
+            ```
+        """
+        snapshot = POSITION_CACHE.get(fen)
+        self.board = snapshot.build_rows()
+        self.pieces = snapshot.index.copy()
+        self.player_turn = snapshot.turn
+        self._undo_stack = []
+        self.state = BoardState.from_fen_fields(snapshot.castling, snapshot.en_passant,
+                                                snapshot.halfmove_clock, snapshot.fullmove_number)
+        self.start_fen = fen
+
+    @property
+    def fen(self) -> str:
+        """
+        Full Six-Field FEN of the Current Position
+
+        Returns:
+            - `str`: Standard FEN (uppercase = White), e.g. `rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1`.
+            Loading it back with `setup_fen()` gives the same position, rights and clocks.
+        """
+        return build_fen(self.board_notation.swapcase(), self.player_turn, self.state.castling_fen,
+                         self.state.en_passant, self.state.halfmove_clock, self.state.fullmove_number)
+
+    @property
+    def position_key(self) -> int:
+        """#### Zobrist hash of the position (placement, side to move, castling rights, en passant), the transposition-table key"""
+        return position_key(self.pieces.key, self.player_turn, self.state.castling, self.state.en_passant)
+
+    def copy(self) -> 'ChessBoard':
+        """#### Independent copy of the current position (no history, no score board, trusted), used by bots"""
+        return ChessBoard(self.fen, have_history=False, have_score_board=False, trusted=True)
+
+    def check_suffix(self, checked_color: Literal['white', 'black']) -> str:
+        """#### `'+'` when the king of `checked_color` is in check, `''` otherwise (always `''` on a `trusted` board)"""
+        if self.trusted:
+            return ''
+        king = self.pieces.king(checked_color)
+        return '+' if king and self.is_square_attacked(king, 'white' if checked_color == 'black' else 'black') else ''
+
+    def find_mate(self, max_moves: int, checks_only: bool = True) -> Union[list, None]:
+        """Forced Checkmate for the Player to Move (puzzle mode)
+
+        Unlike `check_board`, which only detects a mate once it is on the board, this searches for one
+        (see `chessboard_mate.MateSolver`). The board is left untouched.
+
+        #### Args:
+        - max_moves (int): Longest mate to look for (mate-in-N, counted in moves of the player to move)
+        - checks_only (bool, [optional]): Only try checking moves for the attacker. Defaults to True.
+
+        #### Returns:
+        - list | None: Mating line as `(from, to)` tuples (e.g. `[('g8', 'f7')]`), or None
+        """
+        return find_mate(self, max_moves, checks_only)
+
+    def analyse(self, lines: int = 3, depth: int = 4, move_time: Union[float, None] = None, bot=None) -> list:
+        """Multi-PV Analysis: the Best Moves of the Player to Move, Ranked
+
+        Runs `chessboard_bot.ChessBot.analyse()`: one search whose lines share a transposition table, rather
+        than one search per move. The board is left untouched.
+
+        #### Args:
+        - lines (int, [optional]): Number of moves to rank. Defaults to 3.
+        - depth (int, [optional]): Maximum depth in plies. Defaults to 4.
+        - move_time (float, [optional]): Time budget of the whole analysis in seconds (the last completed depth is returned)
+        - bot (ChessBot, [optional]): Engine to use instead (e.g. to keep its transposition table between calls)
+
+        #### Returns:
+        - list[SearchResult]: Best first; `move`, `score` (pawns, for the player to move) and `pv` of each line
+        """
+        from chessboard_bot import ChessBot
+        bot = bot or ChessBot(depth=depth, move_time=move_time)
+        return bot.analyse(self, lines)
+
     def setup_pieces(self, **cord_piece_pairs):
         """### Purpose of setup_pieces
         The function allows you to set up a customized board layout by placing specific pieces at specified coordinates. This is especially useful in scenarios such as:
@@ -397,7 +529,7 @@ class ChessBoard:
             return sorted(set(normal)), sorted(set(attack)), sorted(set(special))
 
     def is_mv_safe_for_king(self, cords: tuple[str] = tuple()) -> bool:
-        """Try the given move in imaginary chess board and returns true flse
+        """Whether the king is safe after the given move (of the piece on `cords[0]`), or now when no move is given
 
         #### Args:
         - cords (tuple[str], optional): Tuple of coordinate to check or Empty to check based on current state of Chessboard. Defaults to tuple().
@@ -405,14 +537,26 @@ class ChessBoard:
         #### Returns:
         - bool: is king safe or not
         """
-        return MiniChessboard(board_not=self.board_notation).is_king_safe(self.player_turn, cords)
+        if not cords:
+            king = self.pieces.king(self.player_turn)
+            return king is None or not self.is_square_attacked(king, 'white' if self.player_turn == 'black' else 'black')
+        frm, to = cords[0], cords[1][:2]
+        piece = self.piece_at(frm)
+        en_passant = isinstance(piece, Pawn) and frm[0] != to[0] and isinstance(self.piece_at(to), Empty)
+        return self.is_king_safe_after(frm, to, f"{to[0]}{frm[1]}" if en_passant else to)
+
+    def is_square_attacked(self, square: str, by_color: Literal['white', 'black']) -> bool:
+        """Whether any piece of `by_color` attacks `square` (a handful of lookups, see `chessboard_pieces.is_square_attacked`)"""
+        return is_square_attacked(self.board, square, by_color)
                   
-    def get_valid_mv(self,  position: str, deco: bool = True) -> list[str]:
+    def get_valid_mv(self,  position: str, deco: bool = True, kind: Literal['all', 'captures', 'quiets'] = 'all') -> list[str]:
         """Generate `list of All Valid Moves` with some `Decorations`
         
         #### Args:
         - position (str): Postion of piece whose moves are reqiured
         - deco (bool, [optional]): Add `Decorations`. Defaults to True.
+        - kind (str, [optional]): `'captures'` (captures, en passant and promotions), `'quiets'` (everything else)
+          or `'all'`. Only the requested kind is generated and checked for king safety. Defaults to 'all'.
 
         #### Decorations:
         -  __   : For Normal moves    [Eg. e4  ]
@@ -420,85 +564,190 @@ class ChessBoard:
         - |__|  : For Castling moves  [Eg. |g1|]
         -  __'  : For EnPassing moves [Eg. <d5>]
         #### Returns:
-        - list[str]: List of all moves
+        - list[str]: List of all moves (a promotion square is listed once, whatever the choice)
+        """
+        return [format_destination(move, deco) for move in self.move_codes(position, kind)
+                if not is_promotion(move) or promotion_letter(move) == 'Q']
+
+    def move_codes(self, position: str, kind: Literal['all', 'captures', 'quiets'] = 'all') -> list[int]:
+        """Legal Moves of one Piece as 16-bit codes (see `chessboard_move` and `iter_move_codes`)"""
+        return list(self.iter_move_codes(position, kind))
+
+    def iter_move_codes(self, position: str, kind: Literal['all', 'captures', 'quiets'] = 'all') -> Iterator[int]:
+        """Legal Moves of one Piece as 16-bit codes, lazily: king safety is only checked for the moves consumed
+
+        #### Args:
+        - position (str): Postion of the piece (or the piece itself)
+        - kind (str, [optional]): `'captures'` (captures, en passant and promotions), `'quiets'` (everything else)
+          or `'all'`. Only the requested kind is generated and checked for king safety. Defaults to 'all'.
+
+        #### Yields:
+        - int: Encoded moves, promotions once per choice (Q, R, N, B)
         """
         if any(isinstance(position, kind) for kind in [Pawn, Knight, Bishop, Rook, Queen, King]):
             position = position.position
 
+        piece = self.piece_at(position)
         C, N = ord(position[0]), int(position[1])
+        frm = square_index(position)
+        captures, quiets = kind != 'quiets', kind != 'captures'
+        is_pawn = isinstance(piece, Pawn)
         
-        moves_lst = []
-        for cons_steps in self.piece_at(position).steps:
+        for cons_steps in piece.steps:
             for step in cons_steps:
                 new_c = chr(C + step[0])
                 new_n = N + step[1]
                 if  1 <= new_n <= 8 and  'a' <= new_c <= 'h':
-                    if isinstance(self.piece_at(f"{new_c}{new_n}"), Empty):
-                        if self.is_mv_safe_for_king((position, f"{new_c}{new_n}")):
-                            if isinstance(self.piece_at(position), Pawn):
-                                if new_c == chr(C):
-                                    moves_lst.append(f"{new_c}{new_n}")
-                                continue
-                            moves_lst.append(f"{new_c}{new_n}")
-                    elif self.piece_at(f"{new_c}{new_n}").color !=  self.piece_at(position).color:
-                        if isinstance(self.piece_at(position), Pawn) and new_c == chr(C):
-                            continue
-                        if self.is_mv_safe_for_king((position, f"{new_c}{new_n}")):
-                            moves_lst.append(f"<{new_c}{new_n}>" if  deco else f"{new_c}{new_n}")
+                    target = self.piece_at(f"{new_c}{new_n}")
+                    if isinstance(target, Empty):
+                        if is_pawn and new_c != chr(C):
+                            continue # Pawns only move diagonally to capture
+                        noisy = is_pawn and new_n in (1, 8) # Promotions are searched with the captures
+                        if (captures if noisy else quiets) and self.is_mv_safe_for_king((position, f"{new_c}{new_n}")):
+                            if noisy:
+                                yield from (encode_move(frm, f"{new_c}{new_n}", PROMOTION | p) for p in PROMOTION_ORDER)
+                            else:
+                                yield encode_move(frm, f"{new_c}{new_n}", DOUBLE_PAWN_PUSH if is_pawn and abs(step[1]) == 2 else QUIET)
+                    elif target.color != piece.color:
+                        if is_pawn and new_c == chr(C):
+                            break # Pawns cannot capture (or jump) straight ahead
+                        if captures and self.is_mv_safe_for_king((position, f"{new_c}{new_n}")):
+                            if is_pawn and new_n in (1, 8):
+                                yield from (encode_move(frm, f"{new_c}{new_n}", PROMOTION | CAPTURE | p) for p in PROMOTION_ORDER)
+                            else:
+                                yield encode_move(frm, f"{new_c}{new_n}", CAPTURE)
                         break
                     else:
                         break
         # Adds  castling moves FOR  KING ONLY
-        if isinstance(self.piece_at(position), King):
-            # Check if the king has not moved
-            if not self.piece_at(position).is_king_moved:
-                
-                # Queenside castling (left side of the board for white)
-                for i in range(-3, 0, 1):
-                    new_c = chr(C + i)
-                    if isinstance(self.piece_at(f"{new_c}{N}"), Empty):
-                        if f"{new_c}{N}" in MiniChessboard(board_not=self.board_notation).get_pseudo_legal_mvs(target_player=-self.piece_at(position)):
-                            break
-                        continue
-                    else:
-                        break
-                else:
-                    if isinstance(self.piece_at(f"{chr(C - 4)}{N}"), Rook) and not self.piece_at(f"{chr(C - 4)}{N}").is_rook_moved:
-                        moves_lst.append(f"|{chr(C - 2)}{N}|" if  deco else f"{new_c}{new_n}")
-                
-                # Kingside castling (right side of the board for white)
-                for i in range(1, 3):
-                    new_c = chr(C + i)
-                    if isinstance(self.piece_at(f"{new_c}{N}"), Empty):
-                        if f"{new_c}{N}" in MiniChessboard(board_not=self.board_notation).get_pseudo_legal_mvs(target_player=-self.piece_at(position)):
-                            break
-                        continue
-                    else:
-                        break
-                else:
-                    # Check if the rook on the kingside has not moved and is in the correct position
-                    if isinstance(self.piece_at(f"{chr(C + 3)}{N}"), Rook) and not self.piece_at(f"{chr(C + 3)}{N}").is_rook_moved:
-                        moves_lst.append(f"|{chr(C + 2)}{N}|" if  deco else f"{new_c}{new_n}")
-
-        if isinstance(self.piece_at(position), Pawn):
-            player = self.piece_at(position).color
+        if quiets and isinstance(piece, King):
+            for side in ('Q', 'K'):
+                code = self.castling_move(position, piece.color, side)
+                if code is not None:
+                    yield code
+
+        if captures and is_pawn:
+            player = piece.color
             (from_num, to_num) = ("5", "6") if player == "white" else ("4", "3")
             
-            if self.piece_at(position).position[1] == from_num:
-                for dir in [-1, 1]:
-                    new_c = chr(C + dir)
-                    adjacent_piece = self.piece_at(f"{new_c}{from_num}")
-                    if adjacent_piece.ident:
-                        if adjacent_piece.color != player and isinstance(adjacent_piece, Pawn) and adjacent_piece.is_in_doip:
-                            if isinstance(self.piece_at(f"{new_c}{to_num}"), Empty):
-                                if self.is_mv_safe_for_king((position, f"{new_c}{new_n}")):
-                                    moves_lst.append(f"{new_c}{new_n}'" if  deco else f"{new_c}{new_n}")
-
-        for move in moves_lst:
-            mv= self.filter_mv(move)
-            if not self.is_mv_safe_for_king((position,mv)):
-                moves_lst.remove(move)
-        return moves_lst
+            # En passant target square comes from the board state (square behind a pawn that just made a double step)
+            target = self.state.en_passant
+            if position[1] == from_num and target and target[1] == to_num and abs(ord(target[0]) - C) == 1:
+                victim = self.piece_at(f"{target[0]}{position[1]}") # The pawn that made the double step
+                if isinstance(self.piece_at(target), Empty) and isinstance(victim, Pawn) and victim.color != player:
+                    if self.is_mv_safe_for_king((position, target)):
+                        yield encode_move(frm, target, EN_PASSANT)
+
+    def castling_move(self, position: str, color: Literal['white', 'black'], side: Literal['K', 'Q']) -> Union[int, None]:
+        """Encoded castling move of the king on `position` towards `side`, or None when it is not allowed
+
+        Needs the castling right, the king on its home square and not in check, the rook in the corner,
+        the squares between them empty, and the squares the king crosses and lands on not attacked.
+        """
+        if position != ('e1' if color == 'white' else 'e8') or not self.state.can_castle(color, side):
+            return None
+        C, N = ord(position[0]), position[1]
+        direction = 1 if side == 'K' else -1
+        if not isinstance(self.piece_at(f"{chr(C + (3 if side == 'K' else -4))}{N}"), Rook):
+            return None
+        between = [f"{chr(C + direction * i)}{N}" for i in range(1, 3 if side == 'K' else 4)]
+        if not all(isinstance(self.piece_at(square), Empty) for square in between):
+            return None
+        enemy = 'white' if color == 'black' else 'black'
+        if any(self.is_square_attacked(square, enemy) for square in (position, *between[:2])):
+            return None
+        return encode_move(position, f"{chr(C + 2 * direction)}{N}", KING_CASTLE if side == 'K' else QUEEN_CASTLE)
+
+    def legal_move_code(self, frm: str, to: str, promotion: str = None) -> Union[int, None]:
+        """Encoded move `frm -> to` of the side to move if it is legal, checking this one move only
+
+        Geometry, blockers, special-move conditions (double step, en passant, castling, promotion choice)
+        and king safety are checked for this move alone: no other move is generated.
+
+        #### Args:
+        - frm (str), to (str): Squares (e.g. 'e2', 'e4')
+        - promotion (str, [optional]): 'Q', 'R', 'B' or 'N' for a pawn reaching the last rank (defaults to 'Q'),
+          must be left out for any other move
+
+        #### Returns:
+        - int | None: The move (see `chessboard_move`), None when it is illegal
+        """
+        if frm not in SQUARE_INDEX or to not in SQUARE_INDEX or frm == to:
+            return None
+        piece, target = self.piece_at(frm), self.piece_at(to)
+        if isinstance(piece, Empty) or piece.color != self.player_turn or target.color == piece.color:
+            return None
+        dc, dn = ord(to[0]) - ord(frm[0]), int(to[1]) - int(frm[1])
+        flags, captured = (QUIET if isinstance(target, Empty) else CAPTURE), to
+
+        if isinstance(piece, Pawn):
+            step = 1 if piece.color == 'white' else -1
+            if dc == 0 and isinstance(target, Empty):
+                if dn == 2 * step and frm[1] == ('2' if step == 1 else '7') and isinstance(self.piece_at(f"{frm[0]}{int(frm[1]) + step}"), Empty):
+                    flags = DOUBLE_PAWN_PUSH
+                elif dn != step:
+                    return None
+            elif abs(dc) == 1 and dn == step:
+                if isinstance(target, Empty):  # Only en passant captures onto an empty square
+                    captured = f"{to[0]}{frm[1]}"
+                    victim = self.piece_at(captured)
+                    if to != self.state.en_passant or not (isinstance(victim, Pawn) and victim.color != piece.color):
+                        return None
+                    flags = EN_PASSANT
+            else:
+                return None
+            if to[1] in '18':
+                choice = (promotion or 'Q').strip(' =').upper()
+                if choice not in PROMOTION_PIECES:
+                    return None
+                flags |= PROMOTION | PROMOTION_PIECES.index(choice)
+            elif promotion:
+                return None
+        elif promotion:
+            return None
+        elif isinstance(piece, Knight):
+            if {abs(dc), abs(dn)} != {1, 2}:
+                return None
+        elif isinstance(piece, King):
+            if dn == 0 and abs(dc) == 2:
+                return self.castling_move(frm, piece.color, 'K' if dc > 0 else 'Q')
+            if max(abs(dc), abs(dn)) != 1:
+                return None
+        else:  # Sliders: along a ray, nothing in between
+            straight, diagonal = dc == 0 or dn == 0, abs(dc) == abs(dn)
+            if not ((straight and isinstance(piece, (Rook, Queen))) or (diagonal and isinstance(piece, (Bishop, Queen)))):
+                return None
+            sc, sn = (dc > 0) - (dc < 0), (dn > 0) - (dn < 0)
+            for i in range(1, max(abs(dc), abs(dn))):
+                if not isinstance(self.piece_at(f"{chr(ord(frm[0]) + sc * i)}{int(frm[1]) + sn * i}"), Empty):
+                    return None
+
+        if not self.is_king_safe_after(frm, to, captured):
+            return None
+        return encode_move(frm, to, flags)
+
+    def is_legal(self, frm: str, to: str, promotion: str = None) -> bool:
+        """Whether `frm -> to` is a legal move for the side to move (see `legal_move_code`)"""
+        return self.legal_move_code(frm, to, promotion) is not None
+
+    def is_king_safe_after(self, frm: str, to: str, captured: str = None) -> bool:
+        """Whether the king of the piece on `frm` is safe once it moved to `to` (and `captured` was removed)
+
+        The move is made on the rows in place, without updating anything else, for one `attackers_of()`
+        look from the king square, then taken back.
+        """
+        mover = self.piece_at(frm)
+        squares = {frm, to, captured or to}
+        saved = [(8 - int(square[1]), ord(square[0]) - ord('a'), self.piece_at(square)) for square in squares]
+        try:
+            for row, col, _ in saved:
+                self.board[row][col] = template_piece('', f"{chr(ord('a') + col)}{8 - row}")
+            self.board[8 - int(to[1])][ord(to[0]) - ord('a')] = mover
+            king = to if isinstance(mover, King) else self.pieces.king(mover.color)
+            return king is None or not self.is_square_attacked(king, -mover)
+        finally:
+            for row, col, piece in saved:
+                self.board[row][col] = piece
 
     def n(self, cord:  str) -> str:
         """`Notation of an Piece`
@@ -518,6 +767,22 @@ class ChessBoard:
         elif isinstance(pc, Queen): return "Q"
         elif isinstance(pc, King): return "K"
     
+    def indexed_squares(self, prop: Union[str, list, tuple]) -> Union[list[str], None]:
+        """Squares of the pieces matching `prop` read from `self.pieces`, in `a1, a2, ..., h8` order
+
+        #### Returns:
+        - list[str]: When `prop` is made of at most one color and one piece type (e.g. `'white'`, `['King', 'black']`)
+        - None: For any other property (symbols, ...), which needs a board scan
+        """
+        props = prop if isinstance(prop, (tuple, list)) else (prop,)
+        colors = [p for p in props if p in ('white', 'black')]
+        idents = [p for p in props if p in PIECE_IDENTS]
+        if not props or len(colors) > 1 or len(idents) > 1 or len(colors) + len(idents) != len(props):
+            return None
+        ident = idents[0] if idents else None
+        squares = [square for color in (colors or ('white', 'black')) for square in self.pieces.squares(color, ident)]
+        return sorted(squares) if not colors else squares
+
     def find_all_piece(self, prop: Union[str, list, tuple]=['King', 'black'], first_occurence: bool = False) ->\
         list[Union[Pawn, Knight, Bishop, Rook, Queen, King, Empty, None_Piece]]:
         """Returns All the list of `Pieces` on Chessboard that satisfies Given Properties
@@ -525,6 +790,11 @@ class ChessBoard:
         - prop: Property(ies) of Pieces
         - first_occurence(bool, [Optional]): To Return Piece on it's first occurence otherwise list
         """
+        squares = self.indexed_squares(prop)
+        if squares is not None:  # Colors/types only: read the piece index, no 64-square scan
+            pieces = [self.piece_at(square) for square in squares]
+            return (pieces[0] if pieces else []) if first_occurence else pieces
+
         lst = []
         for i in range(0, 8):
             for j in range(1, 9):
@@ -546,11 +816,6 @@ class ChessBoard:
                         lst.append(self.piece_at(f"{c}{n}"))
         return lst
         
-    def reset_pawns(self, new_pos: str):
-        for pawn in self.find_all_piece("Pawn"):
-            if pawn.position != new_pos:
-                pawn + "x"
-                
     def __add__(self, cords: tuple[str, str]) -> str:
         """
         Make Moves Using the '+' Operator
@@ -577,7 +842,7 @@ class ChessBoard:
         Side Effects:
         - Updates the board state by moving the pieces.
         - Adjusts internal attributes like the piece's position and history if `self.have_history` is enabled.
-        - Handles pawn promotion and resetting en passant flags for pawns.
+        - Handles pawn promotion and updates `self.state` (castling rights, en passant square, clocks) in O(1).
         - Updates the score board (if enabled) when pieces are captured.
 
         Examples:
@@ -598,10 +863,10 @@ class ChessBoard:
             - This method assumes the existence of several helper methods and attributes:
                 - `piece_at()`: Retrieves the piece at a given position.
                 - `place_pieces()`: Places or replaces pieces on the board.
-                - `reset_pawns()`: Resets pawn-specific attributes.
+                - `self.state`: `BoardState` record of castling rights, en passant square and clocks.
                 - `self.history`: Tracks move history if enabled.
                 - `self.have_score_board`: Checks whether a scoring system is active.
-                - `MiniChessboard`: Used to validate king safety.
+                - `is_square_attacked()`: Used for the check suffix.
         """
 
         prev, new_pos = cords
@@ -631,51 +896,50 @@ class ChessBoard:
                 else: note=''
                 a_n, m_t = f"Px{new_pos} ={choice}", "Attack & Promotion"
             
-            self.reset_pawns(new_pos)
-            a_n += '+' if not MiniChessboard(board_not=self.board_notation).is_king_safe() else ''
+            self.state.update(prev, new_pos, 'Pawn', piece_f.color, not isinstance(piece_t, Empty))
+            a_n += self.check_suffix(-piece_f)
             return note, d_n, a_n, m_t
 
         # Handle en passant
         if isinstance(piece_f, Pawn):
             from_num, to_num = ("5", "6") if piece_f.color == "white" else ("4", "3")
-            if piece_f.position[1] == from_num and new_pos[1] == to_num:
-                for dir in [-1, 1]:
-                    adj_pos = f"{chr(ord(prev[0]) + dir)}{from_num}"
-                    adjacent_piece = self.piece_at(adj_pos)
-                    if isinstance(adjacent_piece, Pawn) and adjacent_piece.is_in_doip:
-                        m_t = "In Passing"
-                        self.place_pieces([Empty(adj_pos), Empty(prev)])
-                        piece_f + new_pos
-                        self.place_pieces([piece_f])
-                        if self.have_score_board: self.score_board + adjacent_piece
-
-                        if self.have_history is True: self.history + cords
-                        self.reset_pawns(new_pos)
-                        d_n, a_n = f"{self.n(piece_f.position)}{prev} ~ {self.n(piece_t.position)}{new_pos}", f"{prev[0]}x{new_pos} e.p."
-                        a_n += '+' if not MiniChessboard(board_not=self.board_notation).is_king_safe() else ''
-                        return f"En passant: {piece_f.symbol} moved to {new_pos}.", d_n, a_n, m_t
+            if piece_f.position[1] == from_num and new_pos == self.state.en_passant:
+                adj_pos = f"{new_pos[0]}{from_num}"
+                adjacent_piece = self.piece_at(adj_pos)
+                if isinstance(adjacent_piece, Pawn):
+                    m_t = "In Passing"
+                    self.place_pieces([Empty(adj_pos), Empty(prev)])
+                    piece_f + new_pos
+                    self.place_pieces([piece_f])
+                    if self.have_score_board: self.score_board + adjacent_piece
+
+                    if self.have_history is True: self.history + cords
+                    self.state.update(prev, new_pos, 'Pawn', piece_f.color, True)
+                    d_n, a_n = f"{self.n(piece_f.position)}{prev} ~ {self.n(piece_t.position)}{new_pos}", f"{prev[0]}x{new_pos} e.p."
+                    a_n += self.check_suffix(-piece_f)
+                    return f"En passant: {piece_f.symbol} moved to {new_pos}.", d_n, a_n, m_t
 
         # Handle castling
-        if isinstance(piece_f, King) and not piece_f.is_king_moved:
+        if isinstance(piece_f, King):
             C_prev, C_new = ord(prev[0]), ord(new_pos[0])
             if abs(C_new - C_prev) == 2:  # Castling move
                 if C_new > C_prev:  # Kingside
-                    a_n, m_t = "O-O", "K-Side Castling"
+                    a_n, m_t, side = "O-O", "K-Side Castling", 'K'
                     rook_pos, new_rook_pos = f"{chr(C_prev + 3)}{prev[1]}", f"{chr(C_new - 1)}{new_pos[1]}"
                 else:  # Queenside
-                    a_n, m_t = "O-O-O", "Q-Side Castling"
+                    a_n, m_t, side = "O-O-O", "Q-Side Castling", 'Q'
                     rook_pos, new_rook_pos = f"{chr(C_prev - 4)}{prev[1]}", f"{chr(C_new + 1)}{new_pos[1]}"
 
                 rook_piece = self.piece_at(rook_pos)
-                if isinstance(rook_piece, Rook) and not rook_piece.is_rook_moved:
+                if isinstance(rook_piece, Rook) and self.state.can_castle(piece_f.color, side):
                     self.place_pieces([Empty(prev), Empty(rook_pos)])
                     piece_f + new_pos
                     rook_piece + new_rook_pos
                     self.place_pieces([piece_f, rook_piece])
                     
-                    self.reset_pawns(new_pos)
+                    self.state.update(prev, new_pos, 'King', piece_f.color, False)
                     if self.have_history is True: self.history + cords
-                    a_n += '+' if not MiniChessboard(board_not=self.board_notation).is_king_safe() else ''
+                    a_n += self.check_suffix(-piece_f)
                     return f"King castled to {new_pos} with rook at {new_rook_pos}.", d_n, a_n, m_t
 
         # Normal move
@@ -706,8 +970,8 @@ class ChessBoard:
                 else:
                     if self.have_history is True: self.history + cords
 
-                self.reset_pawns(new_pos)
-                a_n += '+' if not MiniChessboard(board_not=self.board_notation).is_king_safe() else ''
+                self.state.update(prev, new_pos, piece_f.ident, piece_f.color, not isinstance(piece_t, Empty))
+                a_n += self.check_suffix(-piece_f)
                 return note, d_n, a_n, m_t
             else:
                 return "You cannot capture your own pieces."
@@ -747,6 +1011,7 @@ class ChessBoard:
                 print(f"|{bgRed}INVALID_INPUT:{r+bgYel} Square notation should be a letter (a-h) followed by a number (1-8).{r}|")
             if '--' in frm or all(f in "--cmd" for f in frm):
                 print(f"\n|{bgGrn}Do you mean {bgYel}'--cmd'?{r}|")
+            self.renderer.invalidate() # Error lines may scroll the board, repaint it on the next frame
                 
     def get_destinations(self) -> tuple[str]:
         """Get `To square` from User and also `From square` coodinates using `.get_from_position()` method
@@ -763,13 +1028,8 @@ class ChessBoard:
         if "--cmd" == from_sq:
             return from_sq
         
-        valid_moves = self.get_valid_mv(from_sq)
-        note = f"|{bgGrn}Recommended Moves for {self.piece_at(from_sq).ident} [{from_sq},{self.piece_at(from_sq).symbol[1]} ]:{r+bgYel} {', '.join(valid_moves)} {r}|"
-        
-        valid_moves = self.filter_moves(valid_moves, True)
-        
         while True:
-            to_sq_with_choice = ""
+            to_sq_with_choice, choice = "", None
             to_sq = input("Enter the square to move the piece `to`: ").strip()
             if to_sq == "--cmd":
                 return to_sq
@@ -783,6 +1043,7 @@ class ChessBoard:
 
                 if choice not in ["Q", "R", "B", "N"]:
                     print(f"|{bgRed}INVALID_INPUT:{r+bgYel} Invalid choice. Please choose one of the following: Q, R, B, N.{r}|\nFor example: {to_sq}=Q")
+                    self.renderer.invalidate()
                     continue
 
             # Validate that the input is in the correct form (e.g., "e4")
@@ -791,14 +1052,17 @@ class ChessBoard:
 
                 if column.isalpha() and 'a' <= column <= 'h':
                     if row.isdigit() and 1 <= int(row) <= 8:
-                        # If valid, check if it's one of the recommended moves
-                        if to_sq in valid_moves:
+                        # If valid, check this one move (the recommended moves are only listed on a mistake)
+                        if self.is_legal(from_sq, to_sq, choice if isinstance(self.piece_at(from_sq), Pawn) and to_sq[1] in '18' else None):
                             if "=" in to_sq_with_choice:
                                 return (from_sq, to_sq_with_choice)
+                            if isinstance(self.piece_at(from_sq), Pawn) and to_sq[1] in '18':
+                                self.renderer.invalidate() # The promotion menu can be asked again and again
+                                return (from_sq, f"{to_sq} ={self.ask_promotion(self.piece_at(from_sq).color)}")
                             return (from_sq, to_sq)
                         else:
                             print(f"|{bgRed}INVALID_MOVE:{r+bgYel} Choose another destination square from the recommended moves.{r}|")
-                            print(note)
+                            print(f"|{bgGrn}Recommended Moves for {self.piece_at(from_sq).ident} [{from_sq},{self.piece_at(from_sq).symbol[1]} ]:{r+bgYel} {', '.join(self.get_valid_mv(from_sq))} {r}|")
                     else:
                         print(f"|{bgRed}INVALID_INPUT:{r+bgYel} Invalid row number (must be between 1 and 8).{r}|")
                 else:
@@ -811,7 +1075,75 @@ class ChessBoard:
                 
             if '--' in to_sq or all(f in "--cmd" for f in to_sq):
                 print(f"\n|{bgGrn}Do you mean {bgYel}'--cmd'?{r}|")
+            self.renderer.invalidate()
                 
+    @staticmethod
+    def ask_promotion(color: Literal['white', 'black']) -> str:
+        """Ask the User which piece a pawn reaching its last rank becomes
+        (asked by the UI before the move, applying a move never prompts)
+
+        #### Returns:
+        - str: 'Q', 'N', 'R' or 'B'
+        """
+        print('Your Pawn has reached its last rank! Promote it now.\nEnter a number to promote [1 - 4]')
+        choices = ['Q', 'N', 'R', 'B']
+        symbols = [PIECE_SYMBOLS[REPRESENT_PIECE_WITH][f"{ident}{color[0]}"] for ident in ('Queen', 'Knight', 'Rook', 'Bishop')]
+        while True:
+            print(*list(f"[{i+1} => {symbols[i][1]} ] " for i in range(4)))
+            choice_no = input('>>>> ')
+            if choice_no.isdigit():
+                choice_no = int(choice_no)
+                if 1 <= choice_no <= 4:
+                    return choices[choice_no - 1]
+                else:
+                    print("Invalid Number! Please choose a number between 1 and 4.")
+            else:
+                print("Invalid input! Please enter a number.")
+
+    def attackers_of(self, square: str, color: Literal['white', 'black'], ignore: Union[set, tuple] = ()) -> list:
+        """Pieces of `color` attacking `square`, least valuable first
+
+        Looks outward from `square` along the rook/bishop rays and the knight, pawn and king offsets,
+        so only a handful of squares are visited (no move generation, pins are ignored).
+
+        #### Args:
+        - square (str): Target square (e.g. 'e4')
+        - color (str): Color of the attackers
+        - ignore (set, [optional]): Squares treated as empty (x-rays in the static exchange evaluation)
+
+        #### Returns:
+        - list: Attacking pieces sorted by `cap_score`
+        """
+        C, N = ord(square[0]), int(square[1])
+        attackers = []
+
+        def piece_on(dc, dn):
+            c, n = C + dc, N + dn
+            if ord('a') <= c <= ord('h') and 1 <= n <= 8:
+                return self.board[8 - n][c - ord('a')]
+            return None
+
+        pawn_dn = -1 if color == 'white' else 1  # White pawns attack upwards, from the rank below
+        for offsets, kind in ((KNIGHT_OFFSETS, Knight), (KING_OFFSETS, King), (((-1, pawn_dn), (1, pawn_dn)), Pawn)):
+            for dc, dn in offsets:
+                piece = piece_on(dc, dn)
+                if isinstance(piece, kind) and piece.color == color and piece.position not in ignore:
+                    attackers.append(piece)
+
+        for directions, kinds in ((ORTHOGONAL_DIRECTIONS, (Rook, Queen)), (DIAGONAL_DIRECTIONS, (Bishop, Queen))):
+            for dc, dn in directions:
+                for distance in range(1, 8):
+                    piece = piece_on(dc * distance, dn * distance)
+                    if piece is None:
+                        break
+                    if isinstance(piece, Empty) or piece.position in ignore:
+                        continue
+                    if isinstance(piece, kinds) and piece.color == color:
+                        attackers.append(piece)
+                    break
+
+        return sorted(attackers, key=lambda piece: piece.cap_score)
+
     def find_all_cords(self, prop: Union[str, list, tuple]=['King', 'black'], first_occurence: bool = False) -> list[str]:
         """Returns All the list of `Coordinate` of pieces on Chessboard that satisfies Given Properties
         #### Args:
@@ -820,6 +1152,18 @@ class ChessBoard:
         #### Returns:
         - `List[str]` on True OR `str` on False of `first_occurence`
         """
+        squares = self.indexed_squares(prop)
+        if squares is not None:  # Colors/types only: read the piece index, no 64-square scan
+            if first_occurence:
+                return squares[0] if squares else []
+            lst = []
+            for square in squares:
+                if square[1] in '18' and isinstance(self.piece_at(square), Pawn):
+                    lst.extend(f"{square}{choice}" for choice in [' =Q', ' =B', ' =N', ' =R'])
+                else:
+                    lst.append(square)
+            return lst
+
         lst = []
         for i in range(0, 8):
             for j in range(1, 9):
@@ -850,29 +1194,91 @@ class ChessBoard:
                             lst.append(f"{c}{n}")
         return lst
         
-    def pair_of_all_mvs(self, target_player: Literal["b", "w"] = "w") -> set:
+    def pair_of_all_mvs(self, target_player: Literal["b", "w"] = "w", kind: Literal['all', 'captures', 'quiets'] = 'all') -> list:
         """Get all the posible/valid coordinates of targeted player in tuple form 
         it also includes pawn promotion with every choice
 
         #### Args:
         - target_player (Literal[&quot;b&quot;, &quot;w&quot;], optional): 'W' for white anf 'b' for black. Defaults to "w".
+        - kind (str, optional): Only `'captures'` or only `'quiets'` (see `get_valid_mv`). Defaults to 'all'.
 
         #### Returns:
-        - set: all the posible/valid coordinates of targeted player
+        - list: all the posible/valid coordinates of targeted player, e.g. `('e2', 'e4')`, `('e7', 'e8 =Q')`
         """
-        pairs = set(
-                [(pos, self.filter_mv(move)) for pos in self.find_all_cords("black" if target_player == "b" or target_player == "black"  else "white") for move in self.get_valid_mv(pos)],
-        )
-        pairs = sorted(pairs)
-        new_pairs = []
-        for pair in pairs:
-            if isinstance(self.piece_at(pair[0]), Pawn) and pair[1][1] in '18':
-                for choice in [" =Q", " =R", ' =K', ' =B']:
-                    pairs_w_choice = (pair[0], pair[1] + choice)
-                    new_pairs.append(pairs_w_choice)
-            else:
-                new_pairs.append(pair)
-        return new_pairs
+        return [move_to_tuple(move) for move in self.generate_moves(target_player, kind)]
+
+    def generate_moves(self, target_player: Literal["b", "w"] = "w", kind: Literal['all', 'captures', 'quiets'] = 'all') -> list[int]:
+        """All legal moves of a player as 16-bit codes (see `move_codes`), in board order
+
+        #### Args:
+        - target_player (str, optional): 'w'/'white' or 'b'/'black'. Defaults to "w".
+        - kind (str, optional): Only `'captures'` or only `'quiets'`. Defaults to 'all'.
+        """
+        return list(self.iter_moves(target_player, kind))
+
+    def iter_moves(self, target_player: Literal["b", "w"] = "w", kind: Literal['all', 'captures', 'quiets'] = 'all',
+                   first: tuple = ()) -> Iterator[int]:
+        """Legal moves of a player as 16-bit codes, generated lazily one piece at a time
+
+        #### Args:
+        - target_player (str, optional): 'w'/'white' or 'b'/'black'. Defaults to "w".
+        - kind (str, optional): Only `'captures'` or only `'quiets'`. Defaults to 'all'.
+        - first (tuple, optional): Piece types whose moves are generated first (e.g. `('King',)`),
+          the other pieces follow in board order
+        """
+        color = "black" if target_player == "b" or target_player == "black" else "white"
+        for ident in first:
+            for pos in self.pieces.squares(color, ident):
+                yield from self.iter_move_codes(pos, kind)
+        for pos in self.find_all_cords(color):
+            if self.piece_at(pos).ident not in first:
+                yield from self.iter_move_codes(pos, kind)
+
+    def legal_move_status(self, target_player: Literal["b", "w"] = None) -> tuple[bool, bool]:
+        """Whether a player has any legal move, and whether it is in check, without generating the move list
+
+        Stops at the first legal move found. In check the king is tried first (most check evasions are
+        king moves), otherwise the long-range pieces, which almost always have a move.
+
+        #### Returns:
+        - tuple[bool, bool]: `(has_legal_move, in_check)`. `(False, True)` is checkmate, `(False, False)` stalemate.
+        """
+        color = "black" if (target_player or self.player_turn) in ("b", "black") else "white"
+        king = self.pieces.king(color)
+        in_check = king is not None and self.is_square_attacked(king, 'white' if color == 'black' else 'black')
+        first = ('King', 'Knight', 'Queen') if in_check else ('Queen', 'Rook', 'Knight', 'Bishop')
+        return next(self.iter_moves(color, first=first), None) is not None, in_check
+
+    def has_legal_move(self, target_player: Literal["b", "w"] = None) -> bool:
+        """Whether a player (default: the side to move) has at least one legal move (see `legal_move_status`)"""
+        return self.legal_move_status(target_player)[0]
+
+    def push(self, move: int):
+        """Play an encoded move and pass the turn, remembering what `pop()` needs to take it back
+        (no FEN round trip, used by the search). Returns what `__add__` returns."""
+        frm, to, flags = square_name(move_from(move)), square_name(move_to(move)), move_flags(move)
+        captured_sq = f"{to[0]}{frm[1]}" if flags == EN_PASSANT else to
+        self._undo_stack.append((move, self.piece_at(frm), self.piece_at(captured_sq), self.state.copy(), self.player_turn))
+        outcome = self + move_to_tuple(move)
+        self.change_player_turn()
+        return outcome
+
+    def pop(self) -> int:
+        """Take back the last `push()`. Returns the encoded move."""
+        move, moved, captured, state, turn = self._undo_stack.pop()
+        frm, to, flags = square_name(move_from(move)), square_name(move_to(move)), move_flags(move)
+        self.place_pieces([Empty(to)])
+        moved.position = frm
+        self.place_pieces([moved, captured])
+        if flags in (KING_CASTLE, QUEEN_CASTLE):
+            rook_from, rook_to = (f"h{frm[1]}", f"f{frm[1]}") if flags == KING_CASTLE else (f"a{frm[1]}", f"d{frm[1]}")
+            rook = self.piece_at(rook_to)
+            rook.position = rook_from
+            self.place_pieces([Empty(rook_to), rook])
+        if self.have_history is True:
+            self.history - 1
+        self.state, self.player_turn = state, turn
+        return move
         
     def check_board(self) -> tuple[bool, str]:
         """
@@ -880,12 +1286,30 @@ class ChessBoard:
         #### Returns:
         - tuple[bool, str]: A tuple indicating if the game should continue (True/False) and a message.
         """
-        if not self.pair_of_all_mvs(self.player_turn[0]):
+        has_move, in_check = self.legal_move_status(self.player_turn)
+        if not has_move:
+            if not in_check:
+                return False, 'GAME_DRAW: Stalemate, no legal move for the side to move.'
             return False, f"MATCH_OVER: Our Winner is {'Black' if self.player_turn == 'white' else 'White'}".title()
         
         black_king = bool(self.find_all_cords(["King", "black"]))
         white_king = bool(self.find_all_cords(["King", "white"]))
 
+        # Check for insufficient material draw
+        if self.insufficient_material():
+            return False, 'GAME_DRAW: Insufficient material for either side to win.'
+
+        # Check if one side has won
+        if black_king and not white_king:
+            return False, 'GAME_OVER: Black wins.'
+        elif white_king and not black_king:
+            return False, 'GAME_OVER: White wins.'
+
+        # Otherwise, the game continues
+        return True, f'Now it\'s {self.player_turn.title()}\'s turn.'
+
+    def insufficient_material(self) -> bool:
+        """#### Whether the pieces left match one of the draw conditions of `check_board()` (no move generation)"""
         # Get all the remaining pieces on the board
         pieces_left = {item.symbol for row in self.board for item in row}
 
@@ -900,28 +1324,17 @@ class ChessBoard:
             {"[_]", "[♚]", "[♔]", "[♘]", "[♙]"},  # Kings, knight, and white pawn
             {"[_]", "[♚]", "[♔]", "[♘]", "[♟︎]"},  # Kings, knight, and black pawn
         ]
-        # Check for insufficient material draw
-        if any(pieces_left == condition for condition in insufficient_material):
-            return False, 'GAME_DRAW: Insufficient material for either side to win.'
-
-        # Check if one side has won
-        if black_king and not white_king:
-            return False, 'GAME_OVER: Black wins.'
-        elif white_king and not black_king:
-            return False, 'GAME_OVER: White wins.'
-
-        # Otherwise, the game continues
-        return True, f'Now it\'s {self.player_turn.title()}\'s turn.'
+        return any(pieces_left == condition for condition in insufficient_material)
     
     @staticmethod
     def clear_term():
-        """#### Clear Terminal"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """#### Clear Terminal (ANSI sequences, no subprocess)"""
+        clear_screen()
     
     def reset_game(self):
-        self.setup_notation()
-        self.history.moves = []
         self.player_turn = 'white'
+        self.setup_notation()
+        self.history.clear()
         self.score_board.reset()
         self.no_turns = 0
         self.tabular_history.clear_rows()
@@ -962,6 +1375,7 @@ class ChessBoard:
             --bn    : Show the current board notation.
             --mvs   : Display all possible moves for the current player.
             --mve   : Display all possible moves for the opponent.
+            --mpv   : Rank the best moves for the current player, with scores and lines (`ANALYSIS_SETTINGS`).
             ---     : Check if the current player is in checkmate and declare a winner if so.
 
         Behavior:
@@ -1006,6 +1420,7 @@ class ChessBoard:
             print(" --bn   => Show the current board notation.")
             print(" --mvs  => Display all possible moves for the current player.")
             print(" --mve  => Display all possible moves for the opponent.")
+            print(" --mpv  => Rank the best moves for the current player, with scores and lines.")
             print(" ---    => Check if the current player is in checkmate and declare a winner if so.")
 
             command = input("\nEnter command: ").lower()
@@ -1053,9 +1468,16 @@ class ChessBoard:
                     print(self.pair_of_all_mvs("b" if self.player_turn[0] == "w" else 'w'))
                     input("[Press Enter to continue...]")
 
+                case "--mpv":
+                    for rank, line in enumerate(self.analyse(**ANALYSIS_SETTINGS), 1):
+                        pv = ' '.join(f"{frm}-{to.replace(' ', '')}" for frm, to in line.pv)
+                        print(f"{rank}. {line.move[0]}-{line.move[1]:<6} {line.score:+7.2f}  (depth {line.depth})  {pv}")
+                    input("[Press Enter to continue...]")
+
                 case "---":
-                    if not self.pair_of_all_mvs(self.player_turn):
-                        print(f"CHECKMATE: {"White" if self.player_turn[0] == 'b' else "Black"} wins!")
+                    has_move, in_check = self.legal_move_status(self.player_turn)
+                    if not has_move:
+                        print(f"CHECKMATE: {"White" if self.player_turn[0] == 'b' else "Black"} wins!" if in_check else "STALEMATE: Draw!")
                         game_flag=False
                         break
                     else:
@@ -1069,25 +1491,40 @@ class ChessBoard:
 
         return game_flag
     
-    def launch_chess_game(self):
+    def launch_chess_game(self, bot=None, ponder: bool = True, review: bool = REVIEW_FINISHED_GAMES):
         """
         Run All the functions in such a manner to run a Chess Match between 2 players(Users)
+
+        #### Args:
+        - bot (ChessBot | MCTSBot, [optional]): Plays the side that is not `USER_COLOR_CHOICE` instead of a second user
+        - ponder (bool, [optional]): While the user types a move, a `ChessBot` searches the reply it expects
+          (`chessboard_bot.Ponderer`), and answers at once when it guessed right. Defaults to True.
+        - review (bool, [optional]): Once the game ends, tag its blunders and mistakes in worker processes and append
+          the report next to `MOVES_HISTORY_PATH` (`chessboard_review.review_in_background`). The call returns
+          without waiting for it. Defaults to `REVIEW_FINISHED_GAMES`.
         """
+        ponderer = None
+        if bot is not None and ponder:
+            from chessboard_bot import ChessBot, Ponderer
+            ponderer = Ponderer(bot) if isinstance(bot, ChessBot) else None
         game_flag, message1 = self.check_board()
         while self.check_board()[0]:
             if not game_flag: 
                 print(message1)
                 break
-            self.clear_term()
-            print(message1, end='   ')
-            input("[Press Enter to continue...]\n")
-
-            self.clear_term()
-            self.print_board()
+            self.print_board() # Redraws only the squares changed by the last move
             self.score_board.print()
+            print(message1)
             
-            cords = self.get_destinations()
+            if bot is not None and self.player_turn != USER_COLOR_CHOICE:
+                result = ponderer.reply(self) if ponderer else bot.search(self)
+                cords = result.move
+            else:
+                result = None
+                cords = self.get_destinations()
             if cords == "--cmd":
+                if ponderer:
+                    ponderer.stop() # Commands may undo or reset the position
                 t = self.open_cmd()
                 game_flag, message1 = self.check_board()
                 game_flag &= t
@@ -1107,11 +1544,24 @@ class ChessBoard:
 
             self.change_player_turn()
             game_flag, message1 = self.check_board()
+            if ponderer and result is not None and game_flag:
+                ponderer.start(self, result.pv) # Thinks on the user's time
             
+        if ponderer:
+            ponderer.stop()
+        if hasattr(bot, 'close'):
+            bot.close() # E.g. the process pool of an `MCTSBot` with workers (started again if the bot plays on)
         if (MAKE_RECORD_OF_MOVES_IN_OTHER_FILE and self.have_history):
             with open(MOVES_HISTORY_PATH, '+a') as f:
                 f.writelines(f'\n{self.history}\n')
             print(message1)
+        if review and self.have_history and len(self.history):
+            from chessboard_review import review_in_background, review_path
+            try:
+                review_in_background(self.history, MOVES_HISTORY_PATH, fen=self.start_fen)
+                print(f"Reviewing the game in the background, report: {review_path(MOVES_HISTORY_PATH)}")
+            except (ValueError, OSError) as error: # The game is over anyway, a review that cannot start is only reported
+                print(f"REVIEW_FAILED: {error}")
 
     # For Bots
     def set_of_all_mvs(self, target_player: Literal["b", "w"] = "w") -> set:
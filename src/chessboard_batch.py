@@ -0,0 +1,142 @@
+from chessboard_     import ChessBoard
+from chessboard_move import move_to_uci
+from concurrent.futures import ProcessPoolExecutor
+from collections     import deque
+from typing          import Iterator, NamedTuple, TextIO
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+
+BATCH_CHUNK_SIZE = 256  # Positions sent to a worker at once
+_worker_board = None    # One reusable board per process (positions are loaded with `setup_fen`)
+
+def iter_fens(path: str) -> Iterator[str]:
+    """
+    #### FEN lines of a newline-delimited file, read through `mmap`
+    Only one line is decoded at a time, so huge files never get loaded into memory. Blank lines
+    and `#` comments are skipped, and so is anything after the FEN on a line (e.g. EPD operations after `;`).
+    Bytes that are not ASCII are replaced by U+FFFD, so such a line becomes an error record and not the end of the batch.
+    """
+    with open(path, 'rb') as file:
+        if not file.seek(0, 2):
+            return  # mmap cannot map an empty file
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for raw in iter(mapped.readline, b''):
+                line = raw.split(b';', 1)[0].strip()
+                if line and not line.startswith(b'#'):
+                    yield line.decode('ascii', errors='replace')
+
+def legal_moves(fen: str) -> dict:
+    """
+    #### Legal moves of one position, as a JSON-ready record
+    #### Returns:
+    - dict: `{'fen': ..., 'moves': ['e2e4', 'e7e8q', ...]}`, or `{'fen': ..., 'error': ...}` for an invalid FEN
+    """
+    global _worker_board
+    if _worker_board is None:
+        _worker_board = ChessBoard(have_history=False, have_score_board=False)
+    try:
+        _worker_board.setup_fen(fen)
+    except (ValueError, KeyError) as error:
+        return {'fen': fen, 'error': str(error)}
+    moves = _worker_board.generate_moves(_worker_board.player_turn)
+    return {'fen': fen, 'moves': [move_to_uci(mv) for mv in moves]}
+
+def _legal_moves_chunk(fens: list[str]) -> list[dict]:
+    return [legal_moves(fen) for fen in fens]
+
+def _chunks(fens: Iterator[str], size: int) -> Iterator[list[str]]:
+    chunk = []
+    for fen in fens:
+        chunk.append(fen)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class BatchReport(NamedTuple):
+    """
+    ### Summary of `batch_legal_moves()`
+    - `positions [int]`: Records written
+    - `errors [int]`: Invalid FENs among them
+    - `seconds [float]`: Wall time
+    """
+    positions: int
+    errors: int
+    seconds: float
+
+    @property
+    def positions_per_second(self) -> float:
+        return self.positions / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.positions} positions ({self.errors} invalid) in {self.seconds:.1f}s ({self.positions_per_second:.0f} positions/s)"
+
+
+def batch_legal_moves(path: str, out: TextIO = None, workers: int | None = None,
+                      chunk_size: int = BATCH_CHUNK_SIZE) -> BatchReport:
+    """
+    ### Legal Moves of Every Position of a FEN File
+
+    The file is read through `mmap` and the positions are sent to a process pool in chunks.
+    At most two chunks per worker are in flight, so memory stays bounded however big the file is.
+    Records are written to `out` in input order, one JSON object per line (see `legal_moves()`).
+
+    #### Args:
+    - path (str): Newline-delimited FEN file
+    - out (TextIO): Output stream. Defaults to `sys.stdout`.
+    - workers (int | None): Worker processes (`None` = one per CPU, `0` = no pool, everything in this process)
+    - chunk_size (int): Positions per task
+
+    #### Returns:
+    - BatchReport: Positions, invalid FENs and throughput
+    """
+    out = out or sys.stdout
+    positions = errors = 0
+    start = time.perf_counter()
+
+    def write(records: list[dict]):
+        nonlocal positions, errors
+        for record in records:
+            out.write(json.dumps(record) + '\n')
+            errors += 'error' in record
+        positions += len(records)
+
+    chunks = _chunks(iter_fens(path), chunk_size)
+    if workers == 0:
+        for chunk in chunks:
+            write(_legal_moves_chunk(chunk))
+    else:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight = deque()
+            for chunk in chunks:
+                in_flight.append(pool.submit(_legal_moves_chunk, chunk))
+                if len(in_flight) >= 2 * workers:
+                    write(in_flight.popleft().result())
+            while in_flight:
+                write(in_flight.popleft().result())
+    out.flush()
+    return BatchReport(positions, errors, time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Legal moves of every position of a newline-delimited FEN file (JSON lines).')
+    parser.add_argument('fens', help='Input file, one FEN per line')
+    parser.add_argument('--out', help='Output file (default: stdout)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (0 = single process)')
+    parser.add_argument('--chunk-size', type=int, default=BATCH_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    out = open(args.out, 'w') if args.out else sys.stdout
+    try:
+        report = batch_legal_moves(args.fens, out, args.workers, args.chunk_size)
+    finally:
+        if args.out:
+            out.close()
+    print(report, file=sys.stderr)  # e.g. python chessboard_batch.py positions.fen --out moves.jsonl
@@ -0,0 +1,631 @@
+from chessboard_pieces import *
+from chessboard_move   import *
+from chessboard_cache  import EVAL_CACHE, PAWN_CACHE, EvalCache, TranspositionTable, EXACT, LOWER, UPPER
+from typing            import NamedTuple, Optional
+import threading
+import time
+
+MATE_SCORE = 10_000  # Score of a checkmate (minus the plies needed to deliver it)
+
+# Pawn-structure terms, in pawns
+DOUBLED_PAWN  = -0.2                                # Per extra pawn on a file
+ISOLATED_PAWN = -0.15                               # No friendly pawn on the neighbouring files
+PASSED_PAWN   = (0.05, 0.1, 0.2, 0.35, 0.6, 1.0)    # No enemy pawn ahead on its file or the neighbouring ones, by rank (2nd to 7th)
+
+def evaluate(board, cache: Optional[EvalCache] = EVAL_CACHE) -> float:
+    """
+    ### Static Evaluation of a Chessboard
+    #### Material (`cap_score`) plus positional value (`PIECE_SQUARE_TABLES`) of every piece, plus `pawn_structure()`.
+    #### Args:
+    - cache (EvalCache | None): Scores by placement hash (`board.pieces.key`), shared by default. None to always compute.
+    #### Returns:
+    - float: Score from White's point of view (positive = White is better), in pawns
+    """
+    if cache is None:
+        return evaluate_pieces(board) + pawn_structure(board.pieces)
+    key = board.pieces.key
+    score = cache.get(key)
+    if score is None:
+        score = evaluate_pieces(board) + pawn_structure(board.pieces)
+        cache.put(key, score)
+    return score
+
+def evaluate_pieces(board) -> float:
+    """#### `evaluate()` without the cache: one pass over the 64 squares"""
+    score = 0.0
+    for row in board.board:
+        for piece in row:
+            if piece.color == 'white':
+                score += piece.cap_score + repr_piece.eval_position(piece)
+            elif piece.color == 'black':
+                score -= piece.cap_score + repr_piece.eval_position(piece)
+    return score
+
+
+def pawn_structure(pieces, cache: Optional[EvalCache] = PAWN_CACHE) -> float:
+    """
+    #### Doubled, isolated and passed pawns from White's point of view, read from `cache` by `pieces.pawn_key`
+    #### (only the pawn squares of the `PieceIndex` are looked at, and only when the structure is new)
+    """
+    score = cache.get(pieces.pawn_key) if cache is not None else None
+    if score is None:
+        score = evaluate_pawns(pieces.squares('white', 'Pawn'), pieces.squares('black', 'Pawn'))
+        if cache is not None:
+            cache.put(pieces.pawn_key, score)
+    return score
+
+def evaluate_pawns(white: list[str], black: list[str]) -> float:
+    """#### Pawn-structure terms of two lists of pawn squares (White's point of view)"""
+    score = 0.0
+    for own, enemy, sign in ((white, black, 1), (black, white, -1)):
+        files = [square[0] for square in own]
+        for file in set(files):
+            score += sign * DOUBLED_PAWN * (files.count(file) - 1)
+        for square in own:
+            file, rank = ord(square[0]), int(square[1])
+            if chr(file - 1) not in files and chr(file + 1) not in files:
+                score += sign * ISOLATED_PAWN
+            if not any(abs(ord(other[0]) - file) <= 1 and (int(other[1]) - rank) * sign > 0 for other in enemy):
+                score += sign * PASSED_PAWN[rank - 2 if sign == 1 else 7 - rank]
+    return score
+
+
+def static_exchange(board, move: int) -> int:
+    """
+    ### Static Exchange Evaluation (SEE) of a capture
+    #### Plays out every capture on the target square, least valuable attacker first, using
+    #### `board.attackers_of()` (x-rays included) and `cap_score` values. Either side may stop capturing.
+    #### Args:
+    - move (int): Encoded capture (see `chessboard_move`)
+    #### Returns:
+    - int: Material won by the moving side (negative = losing capture)
+    """
+    frm, to = square_name(move_from(move)), square_name(move_to(move))
+    attacker, victim = board.piece_at(frm), board.piece_at(to)
+    gains = [Pawn.cap_score if move_flags(move) == EN_PASSANT else victim.cap_score]
+    on_square, side, removed = attacker.cap_score, -attacker, {frm}
+
+    while True:
+        attackers = board.attackers_of(to, side, ignore=removed)
+        if not attackers:
+            break
+        gains.append(on_square - gains[-1])
+        on_square = attackers[0].cap_score
+        removed.add(attackers[0].position)
+        side = 'white' if side == 'black' else 'black'
+
+    for i in range(len(gains) - 1, 0, -1):
+        gains[i - 1] = -max(-gains[i - 1], gains[i])
+    return gains[0]
+
+
+class SearchResult(NamedTuple):
+    """
+    ### Result of `ChessBot.search()`
+    - `move [tuple[str, str]]`: Best move found, in `(from, to)` form accepted by `ChessBoard.__add__`
+    - `score [float]`: Evaluation of that move for the side to move (in pawns)
+    - `depth [int]`: Last fully searched depth
+    - `nodes [int]`: Nodes visited (playouts for `chessboard_mcts.MCTSBot`)
+    - `pv [list]`: Principal variation, starting with `move`
+    - `elapsed [float]`: Seconds spent
+    - `iterations [tuple]`: Nodes spent on each completed iteration of the iterative deepening (depth 1 first)
+    """
+    move: Optional[tuple]
+    score: float
+    depth: int
+    nodes: int
+    pv: list
+    elapsed: float
+    iterations: tuple = ()
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def effective_branching_factor(self) -> float:
+        """#### Average growth of the tree per extra ply (geometric mean of the iteration-to-iteration node ratios)"""
+        if len(self.iterations) < 2 or not self.iterations[0]:
+            return 0.0
+        return (self.iterations[-1] / self.iterations[0]) ** (1 / (len(self.iterations) - 1))
+
+    @property
+    def depth_per_second(self) -> float:
+        return self.depth / self.elapsed if self.elapsed else 0.0
+
+
+class MoveOrderer:
+    """
+    ### Move Ordering for the Alpha-Beta Search
+
+    #### Moves are tried in this order (best cut-off candidates first) :-
+    - `Captures/Promotions`: Most Valuable Victim - Least Valuable Attacker, from `cap_score`
+    - `Killer moves`: Quiet moves that caused a beta cut-off at the same ply (2 per ply)
+    - `Quiet moves`: By the history table (cut-offs weighted by `depth * depth`)
+    """
+    PROMOTION_VALUES = {'Q': Queen.cap_score, 'R': Rook.cap_score, 'B': Bishop.cap_score, 'N': Knight.cap_score}
+
+    def __init__(self):
+        self.killers: dict[int, list[int]] = {}  # Encoded moves (see `chessboard_move`)
+        self.history: dict[int, int] = {}
+
+    def capture_score(self, board, mv: int) -> int:
+        """#### MVV-LVA score of a capture or promotion (higher is tried first)"""
+        attacker = board.piece_at(square_name(move_from(mv)))
+        victim = Pawn if move_flags(mv) == EN_PASSANT else board.piece_at(square_name(move_to(mv)))
+        score = victim.cap_score * 100 - attacker.cap_score
+        if is_promotion(mv):
+            score += self.PROMOTION_VALUES[promotion_letter(mv)] * 100
+        return score
+
+    def order_captures(self, board, moves: list[int]) -> list[int]:
+        return sorted(moves, key=lambda mv: self.capture_score(board, mv), reverse=True)
+
+    def order_quiets(self, moves: list[int], ply: int) -> list[int]:
+        killers = self.killers.get(ply, [])
+        return sorted(moves, key=lambda mv: (mv in killers, self.history.get(mv, 0)), reverse=True)
+
+    def record_cutoff(self, mv: int, ply: int, depth: int):
+        """#### Remember a quiet move that refuted the position (killer + history)"""
+        killers = self.killers.setdefault(ply, [])
+        if mv not in killers:
+            killers.insert(0, mv)
+            del killers[2:]
+        self.history[mv] = self.history.get(mv, 0) + depth * depth
+
+
+class _SearchAborted(Exception):
+    """Raised inside the search when the node or time budget is exhausted"""
+
+
+class ChessBot:
+    """
+    ### Alpha-Beta Chess Bot (Minimax with pruning)
+
+    #### Searches with iterative deepening up to `depth` plies, using `evaluate()` at the leaves.
+
+    ##### Args :-
+    - `depth [int= 2]`: Maximum search depth in plies
+    - `max_nodes [int | None]`: Node budget per move (the last completed depth is played when it runs out).
+      After a ponder hit it counts from the hit, the nodes searched while pondering are free.
+    - `move_time [float | None]`: Time budget per move, in seconds
+    - `move_ordering [bool= True]`: Staged generation (captures before quiet moves) ordered by `MoveOrderer`.
+      When False, moves are searched in plain `generate_moves` order (for comparing node counts).
+    - `quiescence [bool= True]`: At the leaves, keep searching captures and promotions until the position is quiet.
+      Captures that lose material according to `static_exchange()` are pruned.
+    - `null_move [bool= True]`: Null-move pruning. The side to move passes, and if a search reduced by
+      `NULL_MOVE_REDUCTION` plies still fails high, the node is cut. Never tried in check, twice in a row,
+      or when the side has only king and pawns (zugzwang).
+    - `late_move_reductions [bool= True]`: Quiet moves after the first `LMR_FULL_MOVES` are searched one ply
+      shallower with a null window, and re-searched at full depth when they fail high.
+    - `eval_cache [EvalCache | None]`: Cache of `evaluate()`. Defaults to the process-wide `EVAL_CACHE`, None disables it.
+    - `transposition_table [bool= True]`: Keep a `TranspositionTable` (`self.table`) of scores and best moves. It lives as
+      long as the bot, so later iterations, later moves and pondering (`Ponderer`) start from what was already searched.
+
+    ##### Methods :-
+    - `search(board)`: Returns a `SearchResult` for the side to move, the given board is left untouched
+    - `choose_move(board)`: Only the move of `search(board)`
+    - `analyse(board, lines=3)`: Multi-PV, the best `lines` moves with their scores and principal variations
+    - `stop()`: Make a search running on another thread return (with its last completed depth)
+    """
+    name = 'alphabeta'
+    NULL_MOVE_REDUCTION = 2  # R: the null-move search is `depth - 1 - R` plies deep
+    LMR_FULL_MOVES = 3       # Moves searched at full depth before reductions start
+    REDUCTION_DEPTH = 3      # Min. remaining depth for null moves and reductions
+
+    def __init__(self, depth: int = 2, max_nodes: Optional[int] = None, move_time: Optional[float] = None,
+                 move_ordering: bool = True, quiescence: bool = True, null_move: bool = True,
+                 late_move_reductions: bool = True, eval_cache: Optional[EvalCache] = EVAL_CACHE,
+                 transposition_table: bool = True):
+        self.depth = depth
+        self.max_nodes = max_nodes
+        self.move_time = move_time
+        self.move_ordering = move_ordering
+        self.quiescence = quiescence
+        self.null_move = null_move
+        self.late_move_reductions = late_move_reductions
+        self.eval_cache = eval_cache
+        self.table = TranspositionTable() if transposition_table else None
+        self.orderer = MoveOrderer()
+        self.nodes = 0
+        self._node_base = 0  # `nodes` when the budget started (the ponder hit, see `_ponderhit()`)
+        self._deadline = None
+        self._stop = threading.Event()
+        self._excluded = frozenset()  # Root moves left out (lines already found by `analyse()`)
+        self._pondering = False  # No budget while set (see `Ponderer`), only `stop()` ends the search
+        self._pv_move = None
+        self._pv_code = None
+
+    def search(self, board) -> SearchResult:
+        work = board.copy()
+        self.nodes = self._node_base = 0
+        self.orderer = MoveOrderer()
+        start = time.perf_counter()
+        self._deadline = start + self.move_time if self.move_time and not self._pondering else None
+        try:
+            return self._iterate(board, work, start)
+        finally:
+            self._pondering = False
+            self._stop.clear()
+
+    def _iterate(self, board, work, start: float) -> SearchResult:
+        best = SearchResult(None, 0.0, 0, 0, [], 0.0)
+        iterations = []
+        self._pv_code = None
+        for depth in range(1, self.depth + 1):
+            self._pv_move = self._pv_code  # Best move of the previous iteration is searched first at the root
+            nodes_before = self.nodes
+            try:
+                score, pv = self._negamax(work, depth, -MATE_SCORE - 1, MATE_SCORE + 1, 0)
+            except _SearchAborted:
+                break
+            iterations.append(self.nodes - nodes_before)
+            self._pv_code = pv[0] if pv else None
+            pv = [move_to_tuple(mv) for mv in pv]
+            best = SearchResult(pv[0] if pv else None, score, depth, self.nodes, pv, time.perf_counter() - start, tuple(iterations))
+            if abs(score) >= MATE_SCORE - 100:
+                break  # Forced mate found, deeper search cannot improve it
+
+        if best.move is None:  # Budget ran out before depth 1 completed: any legal move
+            moves = board.pair_of_all_mvs(board.player_turn)
+            best = SearchResult(moves[0] if moves else None, 0.0, 0, self.nodes, moves[:1], time.perf_counter() - start)
+        return best._replace(nodes=self.nodes, elapsed=time.perf_counter() - start)
+
+    def choose_move(self, board) -> Optional[tuple]:
+        return self.search(board).move
+
+    def analyse(self, board, lines: int = 3) -> list[SearchResult]:
+        """
+        #### Multi-PV analysis: the best `lines` moves of the side to move, best first, one `SearchResult` each
+        #### Each iteration searches the root once per line, leaving out the moves of the lines found before it.
+        #### The lines share the transposition table, so the 2nd line mostly reads what the 1st one searched
+        #### instead of starting over. `move_time` and `max_nodes` cover the whole analysis, and the lines of
+        #### the last completed depth are returned (fewer when there are fewer legal moves).
+        """
+        if lines < 1:
+            raise ValueError(f"lines must be at least 1, got {lines}")
+        work = board.copy()
+        self.nodes = self._node_base = 0
+        self.orderer = MoveOrderer()
+        start = time.perf_counter()
+        self._deadline = start + self.move_time if self.move_time else None
+
+        best, previous = [], []
+        try:
+            for depth in range(1, self.depth + 1):
+                found, self._excluded = [], frozenset()
+                try:
+                    for line in range(lines):
+                        self._pv_move = previous[line] if line < len(previous) else None
+                        score, pv = self._negamax(work, depth, -MATE_SCORE - 1, MATE_SCORE + 1, 0)
+                        if not pv:
+                            break  # Every legal move already has its line
+                        self._excluded |= {pv[0]}
+                        found.append((score, pv))
+                except _SearchAborted:
+                    break
+                found.sort(key=lambda line: line[0], reverse=True)
+                previous = [pv[0] for _, pv in found]
+                elapsed = time.perf_counter() - start
+                best = [SearchResult(move_to_tuple(pv[0]), score, depth, self.nodes, [move_to_tuple(mv) for mv in pv], elapsed)
+                        for score, pv in found]
+        finally:
+            self._excluded = frozenset()
+            self._stop.clear()
+        return best
+
+    def stop(self):
+        self._stop.set()
+
+    def _ponderhit(self):
+        """#### The pondered position was reached: from now on the normal budget applies"""
+        self._deadline = time.perf_counter() + self.move_time if self.move_time else None
+        self._node_base = self.nodes
+        self._pondering = False
+
+    def _check_budget(self):
+        if self._stop.is_set():
+            raise _SearchAborted
+        if self._pondering:
+            return
+        if self.max_nodes and self.nodes - self._node_base >= self.max_nodes:
+            raise _SearchAborted
+        if self._deadline and time.perf_counter() >= self._deadline:
+            raise _SearchAborted
+
+    def _negamax(self, board, depth: int, alpha: float, beta: float, ply: int, allow_null: bool = True) -> tuple[float, list]:
+        self.nodes += 1
+        self._check_budget()
+
+        if depth == 0:
+            if self.quiescence:
+                return self._quiesce(board, alpha, beta, ply)
+            score = evaluate(board, self.eval_cache)
+            return (score if board.player_turn == 'white' else -score), []
+        if board.state.halfmove_clock >= 100:
+            return 0.0, []
+
+        key = board.position_key if self.table is not None else None
+        entry = self.table.get(key) if key is not None else None
+        tt_move = entry[3] if entry else 0
+        if entry and ply > 0 and entry[0] >= depth:
+            _, bound, score, _ = entry
+            score = self._score_from_table(score, ply)
+            if bound == EXACT or (bound == LOWER and score >= beta) or (bound == UPPER and score <= alpha):
+                return score, ([tt_move] if tt_move else [])
+        alpha_orig = alpha
+
+        reducible = ply > 0 and depth >= self.REDUCTION_DEPTH and (self.null_move or self.late_move_reductions)
+        in_check = reducible and not board.is_mv_safe_for_king()
+
+        if self.null_move and reducible and allow_null and not in_check and self._has_pieces(board, board.player_turn):
+            # Pass the turn: if the opponent still cannot get below beta, a real move will not either
+            en_passant = board.state.en_passant
+            board.state.en_passant = None
+            board.change_player_turn()
+            score, _ = self._negamax(board, depth - 1 - self.NULL_MOVE_REDUCTION, -beta, -beta + 1, ply + 1, allow_null=False)
+            board.change_player_turn()
+            board.state.en_passant = en_passant
+            if -score >= beta:
+                return beta, []
+
+        best_score, best_pv = -MATE_SCORE - 1, []
+        searched = 0
+        for stage, moves in self._staged_moves(board, ply, tt_move):
+            for mv in moves:
+                board.push(mv)
+                if (self.late_move_reductions and reducible and not in_check and stage in ('quiets', 'all')
+                        and searched >= self.LMR_FULL_MOVES and not is_promotion(mv) and mv not in self.orderer.killers.get(ply, ())):
+                    score, pv = self._negamax(board, depth - 2, -alpha - 1, -alpha, ply + 1)
+                    score = -score
+                    if score > alpha:  # Fail high: the reduction was wrong, search again at full depth
+                        score, pv = self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
+                        score = -score
+                else:
+                    score, pv = self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
+                    score = -score
+                board.pop()
+                searched += 1
+
+                if score > best_score:
+                    best_score, best_pv = score, [mv] + pv
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    if stage == 'quiets':
+                        self.orderer.record_cutoff(mv, ply, depth)
+                    self._store(key, depth, ply, LOWER, best_score, best_pv)
+                    return best_score, best_pv  # Cut-off: later stages are never generated
+
+        if not searched:
+            # Checkmate (prefer the quickest one) or stalemate
+            return (-(MATE_SCORE - ply) if not board.is_mv_safe_for_king() else 0.0), []
+        self._store(key, depth, ply, UPPER if best_score <= alpha_orig else EXACT, best_score, best_pv)
+        return best_score, best_pv
+
+    def _store(self, key: Optional[int], depth: int, ply: int, bound: int, score: float, pv: list):
+        if key is not None and not (ply == 0 and self._excluded):  # The best of some root moves is not the root's score
+            self.table.put(key, depth, bound, self._score_to_table(score, ply), pv[0] if pv else 0)
+
+    @staticmethod
+    def _score_to_table(score: float, ply: int) -> float:
+        """#### Mate scores are stored as distance from the stored position, not from the root"""
+        if score >= MATE_SCORE - 100:
+            return score + ply
+        if score <= -(MATE_SCORE - 100):
+            return score - ply
+        return score
+
+    @staticmethod
+    def _score_from_table(score: float, ply: int) -> float:
+        if score >= MATE_SCORE - 100:
+            return score - ply
+        if score <= -(MATE_SCORE - 100):
+            return score + ply
+        return score
+
+    def _quiesce(self, board, alpha: float, beta: float, ply: int) -> tuple[float, list]:
+        """#### Quiescence search: captures and (queen) promotions only, losing captures pruned by SEE"""
+        stand_pat = evaluate(board, self.eval_cache)
+        stand_pat = stand_pat if board.player_turn == 'white' else -stand_pat
+        if stand_pat >= beta:
+            return stand_pat, []
+        alpha = max(alpha, stand_pat)
+
+        best_score, best_pv = stand_pat, []
+        for mv in self.orderer.order_captures(board, board.generate_moves(board.player_turn, kind='captures')):
+            if is_promotion(mv):
+                if promotion_letter(mv) != 'Q':
+                    continue  # Under-promotions are never quiescence material
+            elif static_exchange(board, mv) < 0:
+                continue
+            self.nodes += 1
+            self._check_budget()
+            board.push(mv)
+            score, pv = self._quiesce(board, -beta, -alpha, ply + 1)
+            score = -score
+            board.pop()
+
+            if score > best_score:
+                best_score, best_pv = score, [mv] + pv
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+        return best_score, best_pv
+
+    @staticmethod
+    def _has_pieces(board, color: str) -> bool:
+        """#### Whether `color` has anything besides king and pawns (null moves are unsafe in pawn endings)"""
+        return board.pieces.count(color) > board.pieces.count(color, 'King') + board.pieces.count(color, 'Pawn')
+
+    def _staged_moves(self, board, ply: int, tt_move: int = 0):
+        """
+        #### Yields `(stage, moves)`; each stage is only generated once the previous one is searched
+        #### (the previous iteration's best move at the root, else the transposition-table move, is tried first)
+        """
+        excluded = self._excluded if ply == 0 else ()
+        if not self.move_ordering:
+            yield 'all', [mv for mv in board.generate_moves(board.player_turn) if mv not in excluded]
+            return
+        pv_move = (self._pv_move if ply == 0 else None) or tt_move
+        if pv_move in excluded:
+            pv_move = None
+        if pv_move:
+            yield 'pv', [pv_move]
+        captures = self.orderer.order_captures(board, board.generate_moves(board.player_turn, kind='captures'))
+        yield 'captures', [mv for mv in captures if mv != pv_move and mv not in excluded]
+        quiets = self.orderer.order_quiets(board.generate_moves(board.player_turn, kind='quiets'), ply)
+        yield 'quiets', [mv for mv in quiets if mv != pv_move and mv not in excluded]
+
+
+class Ponderer:
+    """
+    ### Searching on the Opponent's Time (pondering)
+
+    #### After the bot moved, `start()` guesses the opponent's reply (2nd move of the bot's principal variation,
+    #### else the transposition-table move) and searches the position after it on a background thread, while the
+    #### opponent thinks (e.g. while `input()` waits for a human). Once the opponent moved, `reply()` :-
+    - `Ponder hit` (the guess was played): lets that search go on under the bot's normal budget, counted from now,
+      and returns its result. The reply is usually deeper than a fresh search and almost immediate.
+    - `Ponder miss`: stops the background search and runs a normal one. The transposition table and the evaluation
+      caches keep everything the pondering stored.
+
+    ##### Args :-
+    - `bot [ChessBot]`: Engine used for pondering and for the replies (the two never run at the same time)
+
+    ##### Methods :-
+    - `start(board, pv=())`: Ponder on `board` (the bot's move already played, `pv` the `SearchResult.pv` of that move).
+      Returns the expected reply `(from, to)`, or None when there is nothing to ponder on.
+    - `reply(board)`: `SearchResult` for `board`, the position after the opponent's move
+    - `stop()`: Abandon pondering (game over, undo, bot shut down)
+    - `hits`, `misses`: Counters
+    """
+    def __init__(self, bot: ChessBot):
+        self.bot = bot
+        self.guess: Optional[tuple] = None
+        self.hits = self.misses = 0
+        self._thread: Optional[threading.Thread] = None
+        self._key: Optional[int] = None  # `position_key` after the guess
+        self._result: Optional[SearchResult] = None
+
+    @property
+    def pondering(self) -> bool:
+        return self._thread is not None
+
+    def predict(self, board, pv: list = ()) -> Optional[int]:
+        """#### Expected reply on `board` (move code): 2nd move of `pv` if still legal, else the transposition-table move"""
+        if len(pv) >= 2:
+            frm, to = pv[1]
+            code = board.legal_move_code(frm, to[:2], to[2:].strip(' =') or None)
+            if code is not None:
+                return code
+        entry = self.bot.table.get(board.position_key) if self.bot.table is not None else None
+        return entry[3] if entry and entry[3] else None
+
+    def start(self, board, pv: list = ()) -> Optional[tuple]:
+        self.stop()
+        guess = self.predict(board, pv)
+        if guess is None:
+            return None
+        work = board.copy()  # Copied here: `board` keeps changing on the caller's thread
+        work.push(guess)
+        self.guess, self._key, self._result = move_to_tuple(guess), work.position_key, None
+        self.bot._pondering = True  # Before the thread starts, so that an early `reply()` cannot be missed
+        self._thread = threading.Thread(target=self._run, args=(work,), name='ponder', daemon=True)
+        self._thread.start()
+        return self.guess
+
+    def _run(self, board):
+        self._result = self.bot.search(board)
+
+    def reply(self, board) -> SearchResult:
+        if self._thread is not None and board.position_key == self._key:
+            self.hits += 1
+            self.bot._ponderhit()
+            self._thread.join()
+            result = self._result
+            self._thread = self.guess = self._key = None
+            return result
+        if self._thread is not None:
+            self.misses += 1
+        self.stop()
+        return self.bot.search(board)
+
+    def stop(self):
+        if self._thread is not None:
+            self.bot.stop()
+            self._thread.join()
+            self.bot._stop.clear()
+        self.bot._pondering = False
+        self._thread = self.guess = self._key = None
+
+    def __repr__(self) -> str:
+        return f"Ponderer(guess={self.guess}, hits={self.hits}, misses={self.misses})"
+
+# Examples Usage
+if __name__ == '__main__':
+    from chessboard_ import ChessBoard
+
+    board = ChessBoard('r1bqkbnr/pppp1ppp/2n5/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 2 3', have_history=False, have_score_board=False)
+    result = ChessBot(depth=2).search(board)
+    print(result.move, result.score, f"[{result.nodes} nodes in {result.elapsed:.1f}s]") # -> ('h5', 'f7') (Scholar's mate)
+
+    # Node counts at equal depth, with and without move ordering
+    board = ChessBoard('r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5', have_history=False, have_score_board=False)
+    for ordering in (False, True):
+        result = ChessBot(depth=3, move_ordering=ordering).search(board)
+        print(f"move_ordering={ordering}: {result.move} {result.nodes} nodes in {result.elapsed:.1f}s")
+
+    # Without quiescence, depth 1 grabs the pawn on d5 and loses the queen to ...cxd5
+    board = ChessBoard('4k3/8/2p5/3p4/8/8/3Q4/4K3 w - - 0 1', have_history=False, have_score_board=False)
+    for depth, quiescence in ((1, False), (3, False), (1, True)):
+        result = ChessBot(depth=depth, quiescence=quiescence).search(board)
+        print(f"depth={depth} quiescence={quiescence}: {result.move} {result.score:+.1f} {result.nodes} nodes in {result.elapsed:.1f}s")
+
+    # Effective branching factor and speed, with and without null-move pruning / late-move reductions
+    board = ChessBoard('r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5', have_history=False, have_score_board=False)
+    for null_move, reductions in ((False, False), (True, False), (False, True), (True, True)):
+        result = ChessBot(depth=4, null_move=null_move, late_move_reductions=reductions).search(board)
+        print(f"null_move={null_move} late_move_reductions={reductions}: {result.move} {result.nodes} nodes "
+              f"EBF {result.effective_branching_factor:.2f}, {result.depth_per_second:.2f} depth/s") # EBF 7.5 -> 3.7
+
+    # Evaluation cache: a hit is ~50x cheaper than `evaluate()` (see `chessboard_cache`), but evaluation is only ~12%
+    # of the search time, so the three timings stay within ~15% of each other (less than the noise of a single run)
+    from chessboard_cache import EVAL_CACHE
+    for label, cache in (('no cache', None), ('cache, 1st', EVAL_CACHE), ('cache, 2nd', EVAL_CACHE)):
+        result = ChessBot(depth=4, eval_cache=cache).search(board)
+        print(f"{label}: {result.move} {result.nodes} nodes in {result.elapsed:.2f}s")
+    print(EVAL_CACHE) # Hit rate of the two cached searches
+
+    # Pawn structure: the pawn table is hit whenever the pawns did not move, so its hit rate follows the share
+    # of pawn moves in the tree: ~80% in the middlegame position above, ~40% in a pawn ending (no slot is replaced)
+    from chessboard_cache import PAWN_CACHE
+    ending = ChessBoard('4k3/pp3ppp/8/3P4/8/8/PP3P1P/4K3 w - - 0 1', have_history=False, have_score_board=False)
+    print(f"{pawn_structure(ending.pieces):+.2f}") # Passed d5 (+0.35), isolated d5, f2 and h2 -> -0.10
+    for position in (board, ending):
+        EVAL_CACHE.clear()
+        PAWN_CACHE.clear()
+        ChessBot(depth=3).search(position)
+        print(PAWN_CACHE) # hit_rate=80.9%, then 41.1%
+
+    # Pondering: the bot searches the expected reply while the opponent "thinks" for a second
+    board = ChessBoard('r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5', have_history=False, have_score_board=False)
+    ponderer = Ponderer(ChessBot(depth=4, move_time=2.0))
+    result = ponderer.reply(board)
+    board.push(board.legal_move_code(*result.move))
+    guess = ponderer.start(board, result.pv)
+    time.sleep(1.0)  # The human types a move
+    board.push(board.legal_move_code(*guess))
+    start = time.perf_counter()
+    result = ponderer.reply(board)
+    print(f"ponder hit on {guess}: {result.move} depth {result.depth}, latency {time.perf_counter() - start:.2f}s") # Near 0s
+    board.push(board.legal_move_code(*result.move))
+    ponderer.start(board, result.pv)
+    time.sleep(1.0)
+    board.push(next(mv for mv in board.generate_moves(board.player_turn) if move_to_tuple(mv) != ponderer.guess))
+    result = ponderer.reply(board)
+    print(f"ponder miss: {result.move} depth {result.depth} in {result.elapsed:.2f}s", ponderer, ponderer.bot.table)
+
+    # Multi-PV: the three best moves with their lines, in one search sharing the transposition table
+    board = ChessBoard('r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5', have_history=False, have_score_board=False)
+    for rank, line in enumerate(ChessBot(depth=4).analyse(board, lines=3), 1):
+        print(f"{rank}. {line.move} {line.score:+.2f} depth {line.depth}: {line.pv}")
@@ -0,0 +1,192 @@
+from array  import array
+from typing import Optional
+import threading
+
+EVAL_CACHE_BYTES = 4 * 2**20  # Memory cap of the shared `EVAL_CACHE` (4 MiB = 262144 slots)
+PAWN_CACHE_BYTES = 2**20      # Memory cap of the shared `PAWN_CACHE` (pawn structures repeat a lot more than positions)
+TT_BYTES         = 4 * 2**20  # Memory cap of a bot's `TranspositionTable` (4 MiB = 131072 slots)
+
+# Kind of score stored in the `TranspositionTable`
+EXACT = 0  # Searched with the full window: the true score (at that depth)
+LOWER = 1  # Failed high (beta cut-off): the true score is at least this
+UPPER = 2  # Failed low (no move raised alpha): the true score is at most this
+
+class EvalCache:
+    """
+    ### Fixed-Size Evaluation Cache keyed by Position Hash
+
+    #### Direct-mapped table: the score of a position with hash `key` lives in slot `key & (size - 1)`.
+    #### Keys and scores are kept in two flat arrays (16 bytes per slot, nothing is allocated per entry),
+    #### so the memory used is fixed when the cache is created.
+    - `Replacement`: always-replace, a new position takes the slot of whatever was stored there
+    - `Collisions`: the full key is stored and compared, a different position never returns a stale score
+    - `Threads`: one lock around every read and write, the cache can be shared by several boards and bots
+    - `Cost`: a probe, lock included, costs 1-2% of the evaluation it saves (see the example). Evaluation is only
+      ~12% of a search though (move generation is most of it), which bounds what a search gains from the cache.
+
+    ##### Args :-
+    - `max_bytes [int]`: Memory cap, rounded down to a power-of-two number of slots. Defaults to `EVAL_CACHE_BYTES`.
+
+    ##### Methods :-
+    - `get(key)`: Cached score, or None
+    - `put(key, score)`: Store a score
+    - `clear()`: Empty every slot and reset the counters
+    - `hits`, `misses`, `hit_rate`, `stores`, `replaced`: Counters for tuning the size
+    """
+    SLOT_BYTES = 16  # 8-byte key + 8-byte score
+
+    def __init__(self, max_bytes: int = EVAL_CACHE_BYTES):
+        slots = max_bytes // self.SLOT_BYTES
+        if slots < 1:
+            raise ValueError(f"EvalCache needs at least {self.SLOT_BYTES} bytes, got {max_bytes}")
+        self.size = 1 << (slots.bit_length() - 1)
+        self._mask = self.size - 1
+        self._keys = array('q', bytes(8 * self.size))
+        self._scores = array('d', bytes(8 * self.size))
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.stores = self.replaced = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.SLOT_BYTES
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: int) -> Optional[float]:
+        slot = key & self._mask
+        with self._lock:
+            if self._keys[slot] == key:
+                self.hits += 1
+                return self._scores[slot]
+            self.misses += 1
+            return None
+
+    def put(self, key: int, score: float):
+        slot = key & self._mask
+        with self._lock:
+            if self._keys[slot] not in (0, key):
+                self.replaced += 1
+            self._keys[slot] = key
+            self._scores[slot] = score
+            self.stores += 1
+
+    def clear(self):
+        with self._lock:
+            self._keys = array('q', bytes(8 * self.size))
+            self._scores = array('d', bytes(8 * self.size))
+            self.hits = self.misses = self.stores = self.replaced = 0
+
+    def __repr__(self) -> str:
+        return (f"EvalCache(slots={self.size}, {self.nbytes // 1024} KiB, hits={self.hits}, misses={self.misses}, "
+                f"hit_rate={self.hit_rate:.1%}, replaced={self.replaced})")
+
+
+class TranspositionTable:
+    """
+    ### Fixed-Size Table of Search Results keyed by Position Hash
+
+    #### Direct-mapped like `EvalCache` (slot `key & (size - 1)`, flat arrays, fixed memory), but each slot holds
+    #### what a search learnt about a position: `(depth, bound, score, move)`. A later search (next iteration,
+    #### next move, pondering, other lines of a multi-PV analysis) reads it back to cut the node or to try `move` first.
+    - `bound`: `EXACT`, `LOWER` (fail high) or `UPPER` (fail low)
+    - `move`: 16-bit code of the best move found (`chessboard_move`), 0 when none
+    - `Replacement`: a different position always takes the slot, the same position keeps its deepest result
+    - `Threads`: one lock around every read and write, like `EvalCache`
+
+    ##### Args :-
+    - `max_bytes [int]`: Memory cap, rounded down to a power-of-two number of slots. Defaults to `TT_BYTES`.
+
+    ##### Methods :-
+    - `get(key)`: `(depth, bound, score, move)`, or None
+    - `put(key, depth, bound, score, move)`: Store a result
+    - `clear()`: Empty every slot and reset the counters
+    - `hits`, `misses`, `hit_rate`, `stores`, `replaced`: Counters for tuning the size
+    """
+    SLOT_BYTES = 32  # 8-byte key + 8-byte score + 2-byte move + depth + bound, rounded up
+
+    def __init__(self, max_bytes: int = TT_BYTES):
+        slots = max_bytes // self.SLOT_BYTES
+        if slots < 1:
+            raise ValueError(f"TranspositionTable needs at least {self.SLOT_BYTES} bytes, got {max_bytes}")
+        self.size = 1 << (slots.bit_length() - 1)
+        self._mask = self.size - 1
+        self._lock = threading.Lock()
+        self._allocate()
+
+    def _allocate(self):
+        self._keys = array('q', bytes(8 * self.size))
+        self._scores = array('d', bytes(8 * self.size))
+        self._moves = array('H', bytes(2 * self.size))
+        self._depths = array('b', bytes(self.size))
+        self._bounds = array('B', bytes(self.size))
+        self.hits = self.misses = self.stores = self.replaced = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.SLOT_BYTES
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: int) -> Optional[tuple[int, int, float, int]]:
+        slot = key & self._mask
+        with self._lock:
+            if self._keys[slot] == key:
+                self.hits += 1
+                return self._depths[slot], self._bounds[slot], self._scores[slot], self._moves[slot]
+            self.misses += 1
+            return None
+
+    def put(self, key: int, depth: int, bound: int, score: float, move: int = 0):
+        slot = key & self._mask
+        with self._lock:
+            stored = self._keys[slot]
+            if stored == key and self._depths[slot] > depth:
+                return  # Keep the deeper result of the same position
+            if stored not in (0, key):
+                self.replaced += 1
+            self._keys[slot] = key
+            self._depths[slot] = depth
+            self._bounds[slot] = bound
+            self._scores[slot] = score
+            self._moves[slot] = move
+            self.stores += 1
+
+    def clear(self):
+        with self._lock:
+            self._allocate()
+
+    def __repr__(self) -> str:
+        return (f"TranspositionTable(slots={self.size}, {self.nbytes // 1024} KiB, hits={self.hits}, misses={self.misses}, "
+                f"hit_rate={self.hit_rate:.1%}, replaced={self.replaced})")
+
+EVAL_CACHE = EvalCache()
+PAWN_CACHE = EvalCache(PAWN_CACHE_BYTES)  # Pawn-structure terms keyed by `PieceIndex.pawn_key`
+
+# Examples Usage
+if __name__ == '__main__':
+    cache = EvalCache(max_bytes=1024)  # 64 slots
+    cache.put(0x1234, 0.5)
+    print(cache.get(0x1234), cache.get(0x1234 + 64)) # -> 0.5 None (same slot, other position)
+    cache.put(0x1234 + 64, -1.25)                      # Always-replace
+    print(cache.get(0x1234), cache)                    # -> None EvalCache(slots=64, 1 KiB, hits=1, misses=2, hit_rate=33.3%, replaced=1)
+
+    table = TranspositionTable(max_bytes=1024)         # 32 slots
+    table.put(0x1234, 4, EXACT, 0.5, 0x31c)
+    table.put(0x1234, 2, LOWER, 0.9)                   # Shallower result of the same position: kept out
+    print(table.get(0x1234))                           # -> (4, 0, 0.5, 796)
+
+    # A probe (lock included) against the evaluation it saves
+    import timeit
+    from chessboard_     import ChessBoard
+    from chessboard_bot  import evaluate
+    board = ChessBoard('r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5', have_history=False, have_score_board=False)
+    cache = EvalCache()
+    evaluate(board, cache)
+    for label, probe in (('evaluate()', None), ('cache hit', cache)):
+        print(f"{label}: {timeit.timeit(lambda: evaluate(board, probe), number=10000) * 100:.2f} us") # e.g. 30 us, then 0.6 us
@@ -0,0 +1,192 @@
+from chessboard_pieces import *
+from chessboard_index  import PieceIndex
+from collections       import OrderedDict
+from typing            import Literal, NamedTuple
+import threading
+
+# Standard FEN of the initial position (uppercase = White, as in every other chess tool)
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+POSITION_CACHE_SIZE = 2048  # Max. number of snapshots kept by `POSITION_CACHE`
+
+PIECE_CLASSES = {"K": King, "Q": Queen, "N": Knight, "B": Bishop, "R": Rook, "P": Pawn}
+PIECE_LETTERS = {cls.ident: letter for letter, cls in PIECE_CLASSES.items()}
+
+# Interned template pieces, shared by every snapshot. They must NEVER be mutated:
+# `ChessBoard` clones them and `MiniChessboard` copies a piece before moving it.
+_TEMPLATES: dict[tuple[str, str], Union[Pawn, Knight, Bishop, Rook, Queen, King, Empty]] = {}
+
+def template_piece(letter: str, square: str) -> Union[Pawn, Knight, Bishop, Rook, Queen, King, Empty]:
+    """#### Returns the shared (interned) piece for a standard FEN letter on a square
+    - `letter`: FEN letter (`'P'` = white pawn, `'p'` = black pawn) or `''` for an Empty square
+    """
+    key = (letter, square)
+    piece = _TEMPLATES.get(key)
+    if piece is None:
+        if letter:
+            piece = PIECE_CLASSES[letter.upper()]('w' if letter.isupper() else 'b', square)
+        else:
+            piece = Empty(square)
+        _TEMPLATES[key] = piece
+    return piece
+
+def clone_piece(piece: Union[Pawn, Knight, Bishop, Rook, Queen, King, Empty]) -> Union[Pawn, Knight, Bishop, Rook, Queen, King, Empty]:
+    """#### Fresh (mutable) copy of a template piece"""
+    if isinstance(piece, Empty):
+        return Empty(piece.position)
+    return type(piece)(piece.color[0], piece.position)
+
+
+class PositionSnapshot(NamedTuple):
+    """
+    ### Immutable, fully parsed FEN position
+
+    #### Fields :-
+    - `placement [str]`: Piece placement field in standard FEN (uppercase = White)
+    - `turn ['white', 'black']`: Side to move
+    - `castling [str]`: Castling availability (`'KQkq'`, `'Kq'`, `'-'`, ...)
+    - `en_passant [str]`: En passant target square (`'e3'`) or `'-'`
+    - `halfmove_clock [int]`: Plies since the last capture or pawn move
+    - `fullmove_number [int]`: Starts at 1, incremented after Black's move
+    - `rows [tuple]`: 8 tuples of interned template pieces (rank 8 first), ready to be placed
+    - `index [PieceIndex]`: Squares of the pieces, `copy()` it before placing anything
+    """
+    placement: str
+    turn: Literal['white', 'black']
+    castling: str
+    en_passant: str
+    halfmove_clock: int
+    fullmove_number: int
+    rows: tuple
+    index: PieceIndex
+
+    @property
+    def fen(self) -> str:
+        return build_fen(self.placement, self.turn, self.castling, self.en_passant, self.halfmove_clock, self.fullmove_number)
+
+    @property
+    def board_notation(self) -> str:
+        """#### Placement in this project's notation (uppercase = Black)"""
+        return self.placement.swapcase()
+
+    def build_rows(self) -> list[list[Union[Pawn, Knight, Bishop, Rook, Queen, King, Empty]]]:
+        """#### Fresh, mutable piece rows (used by `ChessBoard`, which moves its piece objects)"""
+        return [[clone_piece(piece) for piece in row] for row in self.rows]
+
+
+def build_fen(placement: str, turn: str, castling: str = '-', en_passant: str = '-',
+              halfmove_clock: int = 0, fullmove_number: int = 1) -> str:
+    """#### Joins the six FEN fields into one string"""
+    return f"{placement} {turn[0]} {castling or '-'} {en_passant or '-'} {halfmove_clock} {fullmove_number}"
+
+def parse_fen(fen: str) -> PositionSnapshot:
+    """
+    ### Parse a FEN string into a `PositionSnapshot`
+
+    #### Args:
+    - fen (str): Standard FEN. The two clock fields are optional (EPD style) and default to `0 1`.
+
+    #### Raises:
+    - ValueError: On any malformed field, or a pawn on the first or last rank
+    """
+    fields = fen.split()
+    if len(fields) not in (4, 6):
+        raise ValueError(f"FEN must have 4 or 6 fields, got {len(fields)}: {fen!r}")
+    placement, turn, castling, en_passant = fields[:4]
+    halfmove, fullmove = fields[4:] if len(fields) == 6 else ('0', '1')
+
+    ranks = placement.split('/')
+    if len(ranks) != 8:
+        raise ValueError(f"FEN placement must have 8 ranks: {placement!r}")
+    rows = []
+    for i, rank in enumerate(ranks):
+        row = []
+        for char in rank:
+            if char.isdigit():
+                start = len(row)
+                row.extend(template_piece('', f"{chr(ord('a') + start + k)}{8 - i}") for k in range(int(char)))
+            elif char.upper() in PIECE_CLASSES:
+                if char in 'Pp' and i in (0, 7):
+                    raise ValueError(f"Pawn on rank {8 - i} in FEN: {fen!r}")
+                row.append(template_piece(char, f"{chr(ord('a') + len(row))}{8 - i}"))
+            else:
+                raise ValueError(f"Unknown piece letter {char!r} in FEN: {fen!r}")
+        if len(row) != 8:
+            raise ValueError(f"FEN rank {8 - i} does not describe 8 squares: {rank!r}")
+        rows.append(tuple(row))
+
+    if turn not in ('w', 'b'):
+        raise ValueError(f"FEN side to move must be 'w' or 'b': {turn!r}")
+    if castling != '-' and (not castling or any(c not in 'KQkq' for c in castling)):
+        raise ValueError(f"Invalid FEN castling field: {castling!r}")
+    if en_passant != '-':
+        if not (len(en_passant) == 2 and 'a' <= en_passant[0] <= 'h' and en_passant[1] == ('6' if turn == 'w' else '3')):
+            raise ValueError(f"Invalid FEN en passant field for {'White' if turn == 'w' else 'Black'} to move: {en_passant!r}")
+        # The pawn that just made the double step stands behind the square, which it crossed from its start square
+        file, step = ord(en_passant[0]) - ord('a'), 1 if turn == 'w' else -1
+        pawn = rows[8 - int(en_passant[1]) + step][file]
+        crossed = (rows[8 - int(en_passant[1])][file], rows[8 - int(en_passant[1]) - step][file])
+        if not (isinstance(pawn, Pawn) and pawn.color == ('black' if turn == 'w' else 'white')) \
+                or not all(isinstance(square, Empty) for square in crossed):
+            raise ValueError(f"FEN en passant square {en_passant} does not follow a pawn double step: {fen!r}")
+    if not (halfmove.isdigit() and fullmove.isdigit()):
+        raise ValueError(f"FEN clocks must be integers: {halfmove!r} {fullmove!r}")
+
+    return PositionSnapshot(placement, 'white' if turn == 'w' else 'black', castling, en_passant,
+                            int(halfmove), int(fullmove), tuple(rows), PieceIndex.from_rows(rows))
+
+
+class PositionCache:
+    """
+    ### Bounded LRU cache of `PositionSnapshot`s keyed by FEN
+
+    Repeated setups of the same position (puzzles, replays, king-safety trials) skip both the parsing
+    and the piece allocation, because snapshots only reference interned template pieces.
+
+    #### Methods :-
+    - `get(fen)`: Snapshot of `fen`, parsed on the first request only
+    - `clear()`: Drop every snapshot and reset the counters
+    """
+    def __init__(self, maxsize: int = POSITION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._snapshots: OrderedDict[str, PositionSnapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fen: str) -> PositionSnapshot:
+        with self._lock:
+            snapshot = self._snapshots.get(fen)
+            if snapshot is not None:
+                self._snapshots.move_to_end(fen)
+                self.hits += 1
+                return snapshot
+        snapshot = parse_fen(fen)
+        with self._lock:
+            self.misses += 1
+            self._snapshots[fen] = snapshot
+            if len(self._snapshots) > self.maxsize:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def clear(self):
+        with self._lock:
+            self._snapshots.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __repr__(self) -> str:
+        return f"PositionCache(size={len(self)}/{self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+POSITION_CACHE = PositionCache()
+
+# Examples Usage
+if __name__ == '__main__':
+    snap = POSITION_CACHE.get(STARTING_FEN)
+    print(snap.fen)             # -> rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1
+    print(snap.board_notation)  # -> RNBQKBNR/PPPPPPPP/8/8/8/8/pppppppp/rnbqkbnr (this project's notation)
+    print(snap.rows[7][4].define_coor()) # -> ('King', 'white', '[♔]')
+
+    POSITION_CACHE.get(STARTING_FEN) # Served from the cache
+    print(POSITION_CACHE)       # -> PositionCache(size=1/2048, hits=1, misses=1)
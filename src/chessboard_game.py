@@ -0,0 +1,138 @@
+from chessboard_pieces import *
+from chessboard_     import ChessBoard
+from chessboard_move import *
+from chessboard_fen  import STARTING_FEN
+from typing          import Literal, NamedTuple, Optional
+
+# Values of `GameState.status()`
+ONGOING               = 'ongoing'
+CHECKMATE             = 'checkmate'
+STALEMATE             = 'stalemate'
+INSUFFICIENT_MATERIAL = 'insufficient_material'
+FIFTY_MOVE_RULE       = 'fifty_move_rule'
+
+PROMOTION_CHOICES = ('Q', 'R', 'N', 'B')
+
+
+class MoveResult(NamedTuple):
+    """
+    ### Outcome of `GameState.apply()`
+    - `ok [bool]`: Whether the move was legal and played
+    - `move [tuple]`: `(from, to)` as played (`('e7', 'e8 =Q')` for promotions) or as given when rejected
+    - `notation [str]`: Short notation (e.g. `'Nf3'`, `'Pxd5'`, `'O-O'`), `''` when rejected
+    - `kind [str]`: `'Normal'`, `'Attack'`, `'Promotion'`, `'Attack & Promotion'`, `'In Passing'`,
+      `'K-Side Castling'`, `'Q-Side Castling'` or `'Invalid'`
+    - `captured [str | None]`: `ident` of the captured piece
+    - `error [str]`: Why the move was rejected
+    """
+    ok: bool
+    move: tuple
+    notation: str = ''
+    kind: str = 'Invalid'
+    captured: Optional[str] = None
+    error: str = ''
+
+
+class GameState:
+    """
+    ### Headless Game API (no console I/O, no prompts)
+
+    #### Wraps a `ChessBoard` without history, score board or display, for workers, servers and benchmarks :-
+    - `apply(move)`: Validate and play a move, returns a `MoveResult` (never raises on illegal input)
+    - `legal_moves()`: Every legal `(from, to)` of the side to move, promotions with each choice
+    - `status()`: `ONGOING`, `CHECKMATE`, `STALEMATE`, `INSUFFICIENT_MATERIAL` or `FIFTY_MOVE_RULE`
+    - `winner()`: `'white'`/`'black'` after a checkmate, otherwise None
+    - `undo()`: Take back the last move
+
+    ##### Args :-
+    - `fen [str]`: Starting position. Defaults to `STARTING_FEN`.
+    - `decorate [bool= False]`: Compute the check suffix (`+`) of `MoveResult.notation` (costs a king-safety test per move)
+    """
+    def __init__(self, fen: str = STARTING_FEN, decorate: bool = False):
+        self.board = ChessBoard(fen, have_history=False, have_score_board=False, trusted=not decorate)
+        self.moves: list[tuple] = []
+
+    @property
+    def fen(self) -> str:
+        return self.board.fen
+
+    @property
+    def turn(self) -> Literal['white', 'black']:
+        return self.board.player_turn
+
+    def legal_moves(self) -> list[tuple]:
+        return [move_to_tuple(mv) for mv in self.board.generate_moves(self.turn)]
+
+    def apply(self, move: tuple) -> MoveResult:
+        """
+        #### Play `(from, to)` for the side to move
+        - A promotion choice may be given as `'e8 =Q'`, `'e8=Q'` or `'e8q'`; without one the pawn becomes a Queen.
+          Any other move with a choice is rejected.
+        """
+        board = self.board
+        try:
+            frm, to = (part.strip().lower() for part in move)
+            square, choice = to[:2], to[2:].strip(' =').upper()
+        except (TypeError, ValueError, AttributeError):
+            return MoveResult(False, move, error=f"Not a (from, to) pair: {move!r}")
+
+        piece = board.piece_at(frm) if frm in SQUARE_INDEX else None
+        if piece is None or isinstance(piece, Empty):
+            return MoveResult(False, move, error=f"No piece on {frm!r}")
+        if piece.color != self.turn:
+            return MoveResult(False, move, error=f"The piece on {frm} is not {self.turn}'s")
+        promotes = isinstance(piece, Pawn) and square[1:] in ('1', '8')
+        if promotes and choice and choice not in PROMOTION_CHOICES:
+            return MoveResult(False, move, error=f"Invalid promotion choice {choice!r}")
+        if choice and not promotes:
+            return MoveResult(False, move, error=f"{frm}-{square} is not a promotion, unexpected choice {choice!r}")
+        code = board.legal_move_code(frm, square, choice if promotes else None)
+        if code is None:
+            return MoveResult(False, move, error=f"Illegal move {frm}-{square}")
+
+        target = board.piece_at(f"{square[0]}{frm[1]}" if move_flags(code) == EN_PASSANT else square)
+        _, _, notation, kind = board.push(code)
+        played = move_to_tuple(code)
+        self.moves.append(played)
+        return MoveResult(True, played, notation, kind, None if isinstance(target, Empty) else target.ident)
+
+    def undo(self) -> bool:
+        """#### Take back the last move. Returns False when there is nothing to undo."""
+        if not self.moves:
+            return False
+        self.board.pop()
+        self.moves.pop()
+        return True
+
+    def in_check(self) -> bool:
+        return not self.board.is_mv_safe_for_king()
+
+    def status(self) -> str:
+        board = self.board
+        has_move, in_check = board.legal_move_status(self.turn)
+        if not has_move:
+            return CHECKMATE if in_check else STALEMATE
+        if board.insufficient_material():  # Not `check_board()`: it would run `legal_move_status()` again
+            return INSUFFICIENT_MATERIAL
+        if board.state.halfmove_clock >= 100:
+            return FIFTY_MOVE_RULE
+        return ONGOING
+
+    def winner(self) -> Optional[Literal['white', 'black']]:
+        if self.status() == CHECKMATE:
+            return 'white' if self.turn == 'black' else 'black'
+        return None
+
+    def __repr__(self) -> str:
+        return f"GameState({self.fen!r})"
+
+# Examples Usage
+if __name__ == '__main__':
+    game = GameState()
+    for move in [('f2', 'f3'), ('e7', 'e5'), ('g2', 'g4'), ('e2', 'e5'), ('d8', 'h4')]:
+        print(game.apply(move))
+    print(game.status(), game.winner()) # -> checkmate black
+
+    game = GameState('8/P6k/8/8/8/8/8/K7 w - - 0 1')
+    print(game.apply(('a7', 'a8')).notation) # Promotes to a Queen, no prompt -> Pa8 =Q
+    print(game.fen)
@@ -1,19 +1,98 @@
+from array           import array
+from chessboard_move import PROMOTION, PROMOTION_PIECES, encode_move, move_to_tuple
+from typing          import Iterator, Union
+
+def _encode(move: tuple[str, str]) -> int:
+  """#### `('e2', 'e4')` / `('e7', 'e8 =Q')` as a 16-bit code (see `chessboard_move`)"""
+  try:
+    frm, to = move
+    square, choice = to[:2], to[2:].strip(' =')
+    flags = PROMOTION | PROMOTION_PIECES.index(choice) if choice else 0
+    return encode_move(frm, square, flags)
+  except (KeyError, TypeError, ValueError):
+    raise ValueError(f"Not a (from, to) move: {move!r}") from None
+
+
+class HistoryView:
+  """
+  ### Read-only Slice of a `History` (no copy)
+  #### Indexes into the live store, so it follows later changes of the history it was taken from.
+  """
+  def __init__(self, codes: array, indexes: range):
+    self._codes = codes
+    self._indexes = indexes
+
+  def __len__(self) -> int:
+    return len(self._indexes)
+
+  def __getitem__(self, index: Union[int, slice]):
+    if isinstance(index, slice):
+      return HistoryView(self._codes, self._indexes[index])
+    return move_to_tuple(self._codes[self._indexes[index]])
+
+  def __iter__(self) -> Iterator[tuple[str, str]]:
+    codes = self._codes
+    return (move_to_tuple(codes[i]) for i in self._indexes)
+
+  def __repr__(self) -> str:
+    return str(list(self))
+
+
 class History:
-  def __init__(self):
-    self.moves = []
-    
+  """
+  ### Moves of a Game, 2 bytes each
+  #### Stored as 16-bit codes in an `array('H')` and decoded back to `(from, to)` tuples on the way out,
+  #### so long archives cost no per-move tuple or string.
+  - `history + ('e2', 'e4')`: Append a move (`('e7', 'e8 =Q')` for promotions)
+  - `history - n`: Drop the last `n` moves (in place), returns the remaining moves as a list
+  - `history[i]`, `history[a:b]`: A move, or a `HistoryView` (no copy)
+  - `bytes(history)` / `History.from_bytes()`: Compact storage of whole games
+  """
+  def __init__(self, moves: list = ()):
+    self.codes = array('H', map(_encode, moves))
+
+  @classmethod
+  def from_bytes(cls, data: bytes) -> 'History':
+    history = cls()
+    history.codes.frombytes(data)
+    return history
+
+  def __bytes__(self) -> bytes:
+    return self.codes.tobytes()
+
+  @property
+  def moves(self) -> list[tuple[str, str]]:
+    """#### Decoded copy of every move (assigning a list of moves replaces the whole history)"""
+    return list(self)
+
+  @moves.setter
+  def moves(self, moves: list):
+    self.codes[:] = array('H', map(_encode, moves))  # In place: views taken before follow
+
+  def clear(self):
+    del self.codes[:]
+
   def __add__(self, move: tuple[str, str]):
-    self.moves.append(move)
-  
+    self.codes.append(_encode(move))
+
+  def __sub__(self, other: int) -> list[tuple[str, str]]:
+    if other > 0:
+      del self.codes[-other:]
+    return self.moves
+
+  def __len__(self) -> int:
+    return len(self.codes)
+
+  def __getitem__(self, index: Union[int, slice]):
+    if isinstance(index, slice):
+      return HistoryView(self.codes, range(len(self.codes))[index])
+    return move_to_tuple(self.codes[index])
+
+  def __iter__(self) -> Iterator[tuple[str, str]]:
+    return map(move_to_tuple, self.codes)
+
   def __repr__(self) -> str:
     return str(self.moves)
-  
-  def __iter__(self):
-    return iter(self.moves)
-  
-  def __sub__(self, other: int):
-    self.moves = self.moves[:-other]
-    return self.moves
 
 if __name__ == "__main__":
   his = History()
@@ -23,9 +102,12 @@ if __name__ == "__main__":
   his + ('d7', "d5")
   his + ('e2', "e4")
   his + ('d7', "d5")
-  
+
   print(his)
   his - 2
   print(his)
-  
-  
\ No newline at end of file
+  print(his[1:3], len(his)) # -> [('d7', 'd5'), ('e2', 'e4')] 4
+
+  his + ('b7', 'b8 =N')
+  print(his[-1], len(bytes(his))) # -> ('b7', 'b8 =N') 10
+  print(list(History.from_bytes(bytes(his))) == list(his)) # -> True
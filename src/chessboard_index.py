@@ -0,0 +1,101 @@
+from typing import Iterable, Literal, Optional
+import random
+
+PIECE_IDENTS = ('King', 'Queen', 'Rook', 'Bishop', 'Knight', 'Pawn')
+
+# Zobrist keys: one random 63-bit number per (color, piece type, square), fixed seed so keys are stable across runs
+_RANDOM = random.Random(0x5EED)
+ZOBRIST_KEYS = {(color, ident): {f"{file}{rank}": _RANDOM.getrandbits(63) for file in 'abcdefgh' for rank in '12345678'}
+                for color in ('white', 'black') for ident in PIECE_IDENTS}
+# Keys of the rest of the position (see `position_key()`): black to move, castling rights bitmask, en passant file
+SIDE_KEY        = _RANDOM.getrandbits(63)
+CASTLING_KEYS   = [0] + [_RANDOM.getrandbits(63) for _ in range(15)]
+EN_PASSANT_KEYS = {file: _RANDOM.getrandbits(63) for file in 'abcdefgh'}
+
+def position_key(placement_key: int, turn: str, castling: int, en_passant: Optional[str]) -> int:
+    """#### Zobrist hash of a whole position: placement (`PieceIndex.key`), side to move, castling rights and en passant file"""
+    key = placement_key ^ CASTLING_KEYS[castling]
+    if turn == 'black':
+        key ^= SIDE_KEY
+    if en_passant:
+        key ^= EN_PASSANT_KEYS[en_passant[0]]
+    return key
+
+class PieceIndex:
+    """
+    ### Per-Color, Per-Type Squares of the Pieces on a Board
+
+    #### Kept in step with the board by `place()` (O(1) per placed piece), so questions like
+    #### "where are White's pieces" or "where is the black king" never scan the 64 squares :-
+    - `squares(color, ident=None)`: Squares of a side's pieces (of one type), in `a1, a2, ..., h8` order
+    - `king(color)`: Square of the king, or None
+    - `count(color, ident=None)`: Number of pieces
+    - `key [int]`: Zobrist hash of the placement (XOR of `ZOBRIST_KEYS`), equal for equal placements
+    - `pawn_key [int]`: Same hash over the pawns only, it changes on pawn moves, pawn captures and promotions
+
+    ##### Empty squares are never indexed (`Empty.color` is None).
+    """
+    __slots__ = ('_squares', 'key', 'pawn_key')
+
+    def __init__(self, pieces: Iterable = ()):
+        self._squares = {color: {ident: set() for ident in PIECE_IDENTS} for color in ('white', 'black')}
+        self.key = self.pawn_key = 0
+        for piece in pieces:
+            if piece.color:
+                self._squares[piece.color][piece.ident].add(piece.position)
+                self.key ^= ZOBRIST_KEYS[piece.color, piece.ident][piece.position]
+                if piece.ident == 'Pawn':
+                    self.pawn_key ^= ZOBRIST_KEYS[piece.color, 'Pawn'][piece.position]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable) -> 'PieceIndex':
+        """#### Index of the pieces of a board (8 rows of pieces), used after a full setup"""
+        return cls(piece for row in rows for piece in row)
+
+    def copy(self) -> 'PieceIndex':
+        index = PieceIndex.__new__(PieceIndex)
+        index._squares = {color: {ident: set(squares) for ident, squares in kinds.items()}
+                          for color, kinds in self._squares.items()}
+        index.key, index.pawn_key = self.key, self.pawn_key
+        return index
+
+    def place(self, piece, replaced):
+        """#### `piece` was put on `piece.position`, where `replaced` stood (either may be `Empty`)"""
+        square = piece.position
+        if replaced.color:
+            self._squares[replaced.color][replaced.ident].discard(square)
+            zobrist = ZOBRIST_KEYS[replaced.color, replaced.ident][square]
+            self.key ^= zobrist
+            if replaced.ident == 'Pawn':
+                self.pawn_key ^= zobrist
+        if piece.color:
+            self._squares[piece.color][piece.ident].add(square)
+            zobrist = ZOBRIST_KEYS[piece.color, piece.ident][square]
+            self.key ^= zobrist
+            if piece.ident == 'Pawn':
+                self.pawn_key ^= zobrist
+
+    def squares(self, color: Literal['white', 'black'], ident: Optional[str] = None) -> list[str]:
+        kinds = self._squares[color]
+        if ident is not None:
+            return sorted(kinds[ident])
+        return sorted(square for squares in kinds.values() for square in squares)
+
+    def king(self, color: Literal['white', 'black']) -> Optional[str]:
+        for square in self._squares[color]['King']:
+            return square
+        return None
+
+    def count(self, color: Literal['white', 'black'], ident: Optional[str] = None) -> int:
+        kinds = self._squares[color]
+        return len(kinds[ident]) if ident is not None else sum(map(len, kinds.values()))
+
+    def __repr__(self) -> str:
+        return f"PieceIndex(white={self.squares('white')}, black={self.squares('black')})"
+
+# Examples Usage
+if __name__ == '__main__':
+    from chessboard_fen import POSITION_CACHE
+
+    index = PieceIndex.from_rows(POSITION_CACHE.get('4k3/8/8/3p4/8/8/8/R3K3 w Q - 0 1').rows)
+    print(index.squares('white'), index.king('black'), index.count('black')) # -> ['a1', 'e1'] e8 2
@@ -0,0 +1,131 @@
+from chessboard_pieces import *
+from chessboard_move   import *
+from typing            import Literal, Optional
+import time
+
+def in_check(board, color: Literal['white', 'black']) -> bool:
+    """#### Whether the king of `color` is attacked (looks outward from the king with `board.is_square_attacked()`)"""
+    king = board.pieces.king(color)
+    return king is not None and board.is_square_attacked(king, 'white' if color == 'black' else 'black')
+
+
+class MateSolver:
+    """
+    ### Depth-First Mate-in-N Solver
+
+    #### Only forcing moves are tried for the attacker, every legal reply for the defender :-
+    - `Attacker`: Checking moves only (`checks_only=True`), so mate-in-3/4 puzzles stay tiny trees.
+      Puzzles with a quiet key move need `checks_only=False`.
+    - `Defender`: All legal moves. A single defence that escapes refutes the attacking move.
+    - `Hash table`: `(position, moves left)` -> mating line or `None`, so transpositions are solved once
+
+    ##### Args :-
+    - `checks_only [bool= True]`: Restrict the attacker to checking moves
+
+    ##### Properties :-
+    - `nodes [int]`: Positions visited by the last `solve()`
+    - `table [dict]`: The hash table, lines as encoded moves (kept between calls, `clear()` empties it)
+    """
+    def __init__(self, checks_only: bool = True):
+        self.checks_only = checks_only
+        self.nodes = 0
+        self.table: dict[tuple[str, int], Optional[list]] = {}
+
+    def clear(self):
+        self.table.clear()
+
+    def solve(self, board, max_moves: int) -> Optional[list]:
+        """
+        #### Shortest forced mate for the side to move, within `max_moves` of its moves
+        #### Returns:
+        - list | None: Mating line `[attacker move, defence, ..., mating move]` as `(from, to)` tuples,
+          the longest defence chosen at every step. `None` when no mate was found.
+        """
+        work = board.copy()
+        self.nodes = 0
+        for moves in range(1, max_moves + 1):
+            line = self._attack(work, moves)
+            if line is not None:
+                return [move_to_tuple(mv) for mv in line]
+        return None
+
+    @staticmethod
+    def _key(board) -> str:
+        return ' '.join(board.fen.split()[:4])  # Clocks do not change the tactics
+
+    def _attack(self, board, moves: int) -> Optional[list]:
+        """#### Attacker to move: some move must mate within `moves`"""
+        key = (self._key(board), moves)
+        if key in self.table:
+            return self.table[key]
+        self.nodes += 1
+
+        attacker = board.player_turn
+        defender = 'white' if attacker == 'black' else 'black'
+        line = None
+        for mv in board.generate_moves(attacker):
+            if promotion_letter(mv) in ('R', 'B'):
+                continue  # Rook/bishop promotions only matter against stalemate, never for mating
+            board.push(mv)
+            if not self.checks_only or in_check(board, defender):
+                defence = self._defend(board, moves)
+                if defence is not None:
+                    line = [mv] + defence
+            board.pop()
+            if line is not None:
+                break
+
+        self.table[key] = line
+        return line
+
+    def _defend(self, board, moves: int) -> Optional[list]:
+        """#### Defender to move, after the attacker used one of its `moves`: every reply must lose"""
+        self.nodes += 1
+        replies = board.generate_moves(board.player_turn)
+        if not replies:
+            return [] if in_check(board, board.player_turn) else None  # Checkmate, or stalemate
+        if moves == 1:
+            return None
+
+        longest = None
+        for mv in replies:
+            board.push(mv)
+            line = self._attack(board, moves - 1)
+            board.pop()
+            if line is None:
+                return None  # This defence holds
+            if longest is None or len(line) + 1 > len(longest):
+                longest = [mv] + line
+        return longest
+
+
+def find_mate(board, max_moves: int, checks_only: bool = True) -> Optional[list]:
+    """
+    ### Find a Forced Checkmate for the side to move
+    #### Args:
+    - board (ChessBoard): Position to solve (left untouched)
+    - max_moves (int): Longest mate to look for, in moves of the attacker (mate-in-N)
+    - checks_only (bool): Only consider checking moves for the attacker (see `MateSolver`)
+    #### Returns:
+    - list | None: Mating line as `(from, to)` tuples, or `None`
+    """
+    return MateSolver(checks_only).solve(board, max_moves)
+
+# Examples Usage
+if __name__ == '__main__':
+    from chessboard_ import ChessBoard
+
+    # The mission of `chessboard_.py`: mate in 1
+    board = ChessBoard('rnbqkbQ1/ppp4p/3p2p1/5p2/2B1P3/8/PPPP1PPP/RNB1K1NR w KQq - 0 7', have_history=False, have_score_board=False)
+    print(find_mate(board, 1)) # -> [('g8', 'f7')]
+
+    # Mate in 3 with a queen sacrifice: 1.Qxh8+ Kxh8 2.Bf6+ Qg7 3.Re8#
+    board = ChessBoard('r1b3kr/ppp1Bp1p/1b6/n2P4/2p3q1/2Q2N2/P4PPP/RN2R1K1 w - - 1 0', have_history=False, have_score_board=False)
+    solver = MateSolver()
+    start = time.perf_counter()
+    line = solver.solve(board, 3)
+    print(line, f"[{solver.nodes} nodes in {time.perf_counter() - start:.2f}s]")
+
+    # Quiet key move (1.Ra7!): invisible to the checks-only search
+    board = ChessBoard('4k3/8/8/8/8/8/R7/1R4K1 w - - 0 1', have_history=False, have_score_board=False)
+    print(find_mate(board, 2), find_mate(board, 2, checks_only=False)) # -> None [('a2', 'a7'), ('e8', 'f8'), ('b1', 'b8')]
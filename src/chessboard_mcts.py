@@ -0,0 +1,233 @@
+from chessboard_     import ChessBoard
+from chessboard_bot  import SearchResult, evaluate
+from chessboard_move import move_to_tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing          import Optional
+import math
+import multiprocessing
+import random
+import time
+
+UCT_EXPLORATION      = 1.4   # C of UCT: higher explores more, lower follows the best average
+PLAYOUT_PLIES        = 40    # Playouts longer than this stop and are scored by `evaluate()`
+PLAYOUT_CAPTURE_RATE = 0.5   # Light policy: chance of looking for a capture first
+WIN_SCALE            = 4.0   # Pawns of advantage worth ~91% (logistic): `evaluate()` <-> win probability
+
+def win_probability(score: float) -> float:
+    """#### Expected result (0 to 1) of an advantage of `score` pawns"""
+    return 1 / (1 + 10 ** (-score / WIN_SCALE))
+
+def win_to_score(probability: float) -> float:
+    """#### Inverse of `win_probability()`, in pawns (a certain win or loss is capped at +/- 16)"""
+    probability = min(max(probability, 1e-4), 1 - 1e-4)
+    return WIN_SCALE * math.log10(probability / (1 - probability))
+
+
+class _Node:
+    """#### Tree node: statistics of the move leading to it, from the point of view of the player who made it"""
+    __slots__ = ('move', 'parent', 'children', 'untried', 'visits', 'value')
+
+    def __init__(self, move: int = 0, parent: Optional['_Node'] = None):
+        self.move = move
+        self.parent = parent
+        self.children: list['_Node'] = []
+        self.untried: Optional[list[int]] = None  # Generated on the first visit
+        self.visits = 0
+        self.value = 0.0
+
+    def select(self, exploration: float) -> '_Node':
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.value / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+
+def random_move(board, rng: random.Random) -> Optional[int]:
+    """
+    #### Light playout policy: a random move of a random piece, a capture first with `PLAYOUT_CAPTURE_RATE`
+    #### The pieces are tried in random order and only until one has a legal move, so a ply usually costs
+    #### the moves of a piece or two instead of the whole move list.
+    """
+    squares = board.pieces.squares(board.player_turn)
+    rng.shuffle(squares)
+    for kind in (('captures', 'all') if rng.random() < PLAYOUT_CAPTURE_RATE else ('all',)):
+        for square in squares:
+            moves = board.move_codes(square, kind)
+            if moves:
+                return rng.choice(moves)
+    return None
+
+def playout(board, rng: random.Random, max_plies: int = PLAYOUT_PLIES) -> float:
+    """
+    #### Play `random_move()` until `check_board()` ends the game or `max_plies` are played.
+    #### The board is restored afterwards.
+    #### Returns:
+    - float: Result for the side to move at the start, 1 = win, 0.5 = draw, 0 = loss (`evaluate()` after `max_plies`)
+    """
+    mover, plies = board.player_turn, 0
+    try:
+        while True:
+            running, message = board.check_board()
+            if not running:
+                lowered = message.lower()
+                if 'draw' in lowered:
+                    return 0.5
+                return 1.0 if ('black' in lowered) == (mover == 'black') else 0.0
+            if board.state.halfmove_clock >= 100:
+                return 0.5
+            if plies >= max_plies:
+                white = win_probability(evaluate(board))
+                return white if mover == 'white' else 1 - white
+            board.push(random_move(board, rng))
+            plies += 1
+    finally:
+        for _ in range(plies):
+            board.pop()
+
+def search_tree(fen: str, playouts: int, move_time: Optional[float] = None, exploration: float = UCT_EXPLORATION,
+                playout_plies: int = PLAYOUT_PLIES, seed: Optional[int] = None) -> tuple[dict, list, int, int]:
+    """
+    ### One UCT Tree from a Position (the unit of work of a process)
+
+    #### Args:
+    - fen (str): Root position
+    - playouts (int): Playouts to run (stops earlier when `move_time` seconds are spent)
+    - exploration, playout_plies: See `UCT_EXPLORATION`, `PLAYOUT_PLIES`
+    - seed (int | None): Seed of the playout policy
+
+    #### Returns:
+    - tuple: (`{move code: (visits, value)}` of the root moves, most visited line (codes), deepest node, playouts run)
+    """
+    rng = random.Random(seed)
+    board = ChessBoard(fen, have_history=False, have_score_board=False, trusted=True)
+    root = _Node()
+    deadline = time.perf_counter() + move_time if move_time else None
+    deepest = done = 0
+    while done < playouts and not (deadline and time.perf_counter() >= deadline):
+        node, pushed = root, 0
+        # Selection: UCT down to a node with untried moves (or with no move at all)
+        while node.untried == [] and node.children:
+            node = node.select(exploration)
+            board.push(node.move)
+            pushed += 1
+        # Expansion: one new child
+        if node.untried is None:
+            node.untried = board.generate_moves(board.player_turn)
+            rng.shuffle(node.untried)
+        if node.untried:
+            child = _Node(node.untried.pop(), node)
+            node.children.append(child)
+            board.push(child.move)
+            pushed += 1
+            node = child
+        deepest = max(deepest, pushed)
+        # Simulation, then back-propagation (each node scores for the player who moved into it)
+        value = 1 - playout(board, rng, playout_plies)
+        while node is not None:
+            node.visits += 1
+            node.value += value
+            value = 1 - value
+            node = node.parent
+        for _ in range(pushed):
+            board.pop()
+        done += 1
+
+    pv, node = [], root
+    while node.children:
+        node = max(node.children, key=lambda child: child.visits)
+        pv.append(node.move)
+    return {child.move: (child.visits, child.value) for child in root.children}, pv, deepest, done
+
+
+class MCTSBot:
+    """
+    ### Monte Carlo Tree Search Bot (UCT)
+
+    #### A second engine type for experiments, used like `ChessBot` (`search()`, `choose_move()`).
+    #### Each playout walks the tree by UCT, adds one node, and finishes the game with the light policy of
+    #### `random_move()` (termination by `check_board()`). The most visited root move is played.
+    #### With `workers`, the playouts are split over a process pool (root parallelization): every process
+    #### grows its own tree from the root, and the visits and values of the root moves are summed.
+
+    ##### Args :-
+    - `playouts [int= 400]`: Playouts per move (all processes together)
+    - `move_time [float | None]`: Time budget per move, in seconds (whichever of the two runs out first)
+    - `workers [int= 0]`: Processes (0 = the playouts run in this process)
+    - `exploration [float]`: UCT constant. Defaults to `UCT_EXPLORATION`.
+    - `playout_plies [int]`: Playout length before `evaluate()` decides. Defaults to `PLAYOUT_PLIES`.
+    - `seed [int | None]`: Seed of the playouts (each process gets `seed + i`), None for a random one
+
+    ##### Methods :-
+    - `search(board)`: `SearchResult` of the side to move. `nodes` counts playouts (`nodes_per_second` = playouts/s),
+      `depth` is the deepest tree node and `score` the win rate of the move, in pawns (`win_to_score()`).
+    - `choose_move(board)`: Only the move of `search(board)`
+    - `close()`: Shut the process pool down
+    """
+    name = 'mcts'
+
+    def __init__(self, playouts: int = 400, move_time: Optional[float] = None, workers: int = 0,
+                 exploration: float = UCT_EXPLORATION, playout_plies: int = PLAYOUT_PLIES, seed: Optional[int] = None):
+        if playouts < 1:
+            raise ValueError(f"MCTSBot needs at least 1 playout, got {playouts}")
+        self.playouts = playouts
+        self.move_time = move_time
+        self.workers = workers
+        self.exploration = exploration
+        self.playout_plies = playout_plies
+        self.seed = seed
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def search(self, board) -> SearchResult:
+        start = time.perf_counter()
+        fen = board.fen
+        args = (self.move_time, self.exploration, self.playout_plies)
+        if not self.workers:
+            trees = [search_tree(fen, self.playouts, *args, self.seed)]
+        else:
+            if self._pool is None:  # Fresh interpreters, like the other pools started from a live game
+                self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+            # The remainder goes to the first workers, so the shares add up to `playouts` exactly
+            shares = [self.playouts // self.workers + (i < self.playouts % self.workers) for i in range(self.workers)]
+            shares = [share for share in shares if share]
+            seeds = [None if self.seed is None else self.seed + i for i in range(len(shares))]
+            trees = list(self._pool.map(search_tree, [fen] * len(shares), shares,
+                                        *([arg] * len(shares) for arg in args), seeds))
+
+        stats: dict[int, list] = {}
+        for moves, _, _, _ in trees:
+            for move, (visits, value) in moves.items():
+                total = stats.setdefault(move, [0, 0.0])
+                total[0] += visits
+                total[1] += value
+        playouts = sum(tree[3] for tree in trees)
+        depth = max(tree[2] for tree in trees)
+        elapsed = time.perf_counter() - start
+        if not stats:  # Game over on the board
+            return SearchResult(None, 0.0, 0, playouts, [], elapsed)
+
+        best = max(stats, key=lambda move: stats[move][0])
+        visits, value = stats[best]
+        pv = max((tree[1] for tree in trees if tree[1] and tree[1][0] == best), key=len, default=[best])
+        return SearchResult(move_to_tuple(best), win_to_score(value / visits), depth, playouts,
+                            [move_to_tuple(mv) for mv in pv], elapsed)
+
+    def choose_move(self, board) -> Optional[tuple]:
+        return self.search(board).move
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+# Examples Usage
+if __name__ == '__main__':
+    board = ChessBoard('r1bqkbnr/pppp1ppp/2n5/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 2 3', have_history=False, have_score_board=False)
+    result = MCTSBot(playouts=300, seed=1).search(board)
+    print(result.move, f"{result.score:+.2f}", f"{result.nodes} playouts, {result.nodes_per_second:.0f} playouts/s") # -> ('h5', 'f7')
+
+    # Root parallelization: the same number of playouts split over processes
+    for workers in (0, 2):
+        bot = MCTSBot(playouts=400, workers=workers, seed=1)
+        bot.search(board) # Starts the pool
+        result = bot.search(board)
+        print(f"workers={workers}: {result.move} {result.nodes} playouts in {result.elapsed:.2f}s, {result.nodes_per_second:.0f} playouts/s")
+        bot.close()
@@ -1,4 +1,7 @@
 from chessboard_pieces import *
+from chessboard_fen import POSITION_CACHE, PositionSnapshot
+from chessboard_index import PieceIndex
+from copy import copy
 import numpy as np
 
 class MiniChessboard:
@@ -17,6 +20,19 @@ class MiniChessboard:
       while len(row) < 8:
         row.append(Empty(f"{chr(len(row) + ord('a'))}{8 - i}"))
       self.board.append(row)
+    self.pieces = PieceIndex.from_rows(self.board)
+
+  @classmethod
+  def from_snapshot(cls, snapshot: PositionSnapshot) -> 'MiniChessboard':
+    """Imaginary board sharing the (immutable) pieces of a cached snapshot, no parsing or allocation"""
+    mini = cls.__new__(cls)
+    mini.board = [list(row) for row in snapshot.rows]
+    mini.pieces = snapshot.index.copy()
+    return mini
+
+  @classmethod
+  def from_fen(cls, fen: str) -> 'MiniChessboard':
+    return cls.from_snapshot(POSITION_CACHE.get(fen))
 
   def print_board(self):
     print("   |a||b||c||d||e||f||g||h|")
@@ -27,7 +43,9 @@ class MiniChessboard:
     return self.board[8 - int(cord[1])][ord(cord[0]) - ord('a')]
 
   def place_piece(self, piece):
-    self.board[8 - int(piece.position[1])][ord(piece.position[0]) - ord('a')] = piece
+    row, col = 8 - int(piece.position[1]), ord(piece.position[0]) - ord('a')
+    self.pieces.place(piece, self.board[row][col])
+    self.board[row][col] = piece
 
   def __add__(self, moves: list[tuple[str]]):
     if isinstance(moves, list):
@@ -35,51 +53,42 @@ class MiniChessboard:
         self + move
       return
     frm, to = moves 
-    piece = self.piece_at(frm)
+    piece = copy(self.piece_at(frm)) # pieces may be shared with a snapshot, never move them in place
     self.place_piece(Empty(frm))
-    promoted = piece + to #+ " =Q" if isinstance(self.piece_at(frm), Pawn) and to in "18" else ""
+    promoted = piece + to
     self.place_piece(promoted or piece)
 
   def is_king_safe(self, king_turn="black", move=tuple()) -> bool:
     if move:
         self + [move]
 
-    for row in self.board:
-        for piece in row:
-            if piece.color == king_turn and isinstance(piece, King):
-                king_pos = piece.position
-                opponent_moves = self.get_valid_mvs("white" if king_turn == "black" else "black")
-                return king_pos not in opponent_moves
+    king_pos = self.pieces.king(king_turn)
+    if king_pos is None:
+        return True  # King not found
+    return not self.is_square_attacked(king_pos, "white" if king_turn == "black" else "black")
 
-    return True  # King not found or not in check
+  def is_square_attacked(self, square: str, by_color: Literal['white', 'black']) -> bool:
+    return is_square_attacked(self.board, square, by_color)
   
   def get_pseudo_legal_mvs(self, target_player: str='black') -> set:
     moves = set()
-    for row in self.board:
-      for piece in row:
-        if piece.color == target_player:
-          for steps in piece.steps:
-            pos = piece.position
-            for dx, dy in steps:
-              new_c = chr(ord(pos[0]) + dx)
-              new_r = int(pos[1]) + dy
-              if 'a' <= new_c <= 'h' and 1 <= new_r <= 8:
-                target_pos = f"{new_c}{new_r}"
-                if isinstance(piece, Pawn) and new_c == pos[0]: continue
-                moves.add(target_pos)
-                if not isinstance(self.piece_at(target_pos), Empty): break
+    for square in self.pieces.squares(target_player):
+      piece = self.piece_at(square)
+      for steps in piece.steps:
+        pos = piece.position
+        for dx, dy in steps:
+          new_c = chr(ord(pos[0]) + dx)
+          new_r = int(pos[1]) + dy
+          if 'a' <= new_c <= 'h' and 1 <= new_r <= 8:
+            target_pos = f"{new_c}{new_r}"
+            if isinstance(piece, Pawn) and new_c == pos[0]: continue
+            moves.add(target_pos)
+            if not isinstance(self.piece_at(target_pos), Empty): break
     return moves
   
   def get_valid_mvs(self, turn: Literal['white', 'black']): #
     moves_lst = []
-    postions_of_target_player = []
-    for i in range(0, 8):
-      for j in range(1, 9):
-        c = chr(ord('a') + i)
-        if self.piece_at(f"{c}{j}").color == turn:
-          postions_of_target_player.append(f"{c}{j}")
-          
-    for position in postions_of_target_player:
+    for position in self.pieces.squares(turn):
       C, N = ord(position[0]), int(position[1])
       
       for consecutive_steps in self.piece_at(position).steps:
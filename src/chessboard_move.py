@@ -0,0 +1,84 @@
+from typing import Union
+
+# 16-bit move encoding: bits 0-5 from square, bits 6-11 to square, bits 12-15 flags
+# Squares are numbered a1 = 0, b1 = 1, ..., h8 = 63
+QUIET            = 0
+DOUBLE_PAWN_PUSH = 1
+KING_CASTLE      = 2
+QUEEN_CASTLE     = 3
+CAPTURE          = 4
+EN_PASSANT       = 5
+PROMOTION        = 8   # + promotion piece (0-3); + CAPTURE when the promotion also captures
+
+PROMOTION_PIECES = 'NBRQ'                   # Promotion piece of flags & 3
+PROMOTION_ORDER  = (3, 2, 0, 1)             # Q, R, N, B: order in which promotions are generated
+NULL_MOVE        = 0                        # a1a1, never a legal move
+
+SQUARE_NAMES = [f"{chr(ord('a') + i % 8)}{i // 8 + 1}" for i in range(64)]
+SQUARE_INDEX = {name: i for i, name in enumerate(SQUARE_NAMES)}
+
+def square_index(square: str) -> int:
+    return SQUARE_INDEX[square]
+
+def square_name(index: int) -> str:
+    return SQUARE_NAMES[index]
+
+def encode_move(frm: Union[str, int], to: Union[str, int], flags: int = QUIET) -> int:
+    """#### Pack a move into 16 bits (squares as names `'e2'` or indexes)"""
+    if isinstance(frm, str): frm = SQUARE_INDEX[frm]
+    if isinstance(to, str): to = SQUARE_INDEX[to]
+    return frm | to << 6 | flags << 12
+
+def move_from(move: int) -> int:
+    return move & 63
+
+def move_to(move: int) -> int:
+    return move >> 6 & 63
+
+def move_flags(move: int) -> int:
+    return move >> 12
+
+def is_capture(move: int) -> bool:
+    """#### Captures, en passant included (capturing promotions too)"""
+    return bool(move >> 12 & CAPTURE)
+
+def is_promotion(move: int) -> bool:
+    return bool(move >> 12 & PROMOTION)
+
+def is_castling(move: int) -> bool:
+    return move >> 12 in (KING_CASTLE, QUEEN_CASTLE)
+
+def promotion_letter(move: int) -> str:
+    """#### `'Q'`, `'R'`, `'B'`, `'N'` or `''`"""
+    return PROMOTION_PIECES[move >> 12 & 3] if move >> 12 & PROMOTION else ''
+
+def move_to_tuple(move: int) -> tuple[str, str]:
+    """#### `(from, to)` accepted by `ChessBoard.__add__` (`('e7', 'e8 =Q')` for promotions)"""
+    to = SQUARE_NAMES[move >> 6 & 63]
+    if move >> 12 & PROMOTION:
+        to += f" ={PROMOTION_PIECES[move >> 12 & 3]}"
+    return SQUARE_NAMES[move & 63], to
+
+def move_to_uci(move: int) -> str:
+    """#### Coordinate notation (`'e2e4'`, `'e7e8q'`)"""
+    return SQUARE_NAMES[move & 63] + SQUARE_NAMES[move >> 6 & 63] + promotion_letter(move).lower()
+
+def format_destination(move: int, deco: bool = True) -> str:
+    """#### Destination square as shown to the player: `e4`, `<d5>` (attack), `|g1|` (castling), `d6'` (en passant)"""
+    to = SQUARE_NAMES[move >> 6 & 63]
+    if not deco:
+        return to
+    flags = move >> 12
+    if flags == EN_PASSANT:
+        return f"{to}'"
+    if flags & CAPTURE:
+        return f"<{to}>"
+    if flags in (KING_CASTLE, QUEEN_CASTLE):
+        return f"|{to}|"
+    return to
+
+# Examples Usage
+if __name__ == '__main__':
+    move = encode_move('e7', 'd8', PROMOTION | CAPTURE | 3)
+    print(move, move_to_tuple(move), move_to_uci(move), format_destination(move)) # -> 65268 ('e7', 'd8 =Q') e7d8q <d8>
+    print(move_to_tuple(encode_move('e1', 'g1', KING_CASTLE)), format_destination(encode_move('e1', 'g1', KING_CASTLE))) # -> ('e1', 'g1') |g1|
@@ -0,0 +1,217 @@
+from chessboard_pieces import *
+from chessboard_     import ChessBoard
+from chessboard_fen  import STARTING_FEN
+from typing          import Iterator, NamedTuple, TextIO, Union
+import argparse
+import re
+import time
+
+RESULTS = ('1-0', '0-1', '1/2-1/2', '*')
+SAN_PIECES = {'N': 'Knight', 'B': 'Bishop', 'R': 'Rook', 'Q': 'Queen', 'K': 'King'}
+MAX_REPORTED_ERRORS = 100  # Messages kept by `replay_games()`, the failures past them are only counted
+
+_TAG = re.compile(r'\[(\w+)\s+"((?:[^"\\]|\\.)*)"\]')
+_COMMENT = re.compile(r'\{[^}]*\}|;[^\n]*')
+_VARIATION = re.compile(r'\([^()]*\)')  # Innermost variation, removed until none is left
+_NOISE = re.compile(r'\$\d+|\d+\.(?:\.\.)?|[!?]+')  # NAGs, move numbers, annotation glyphs
+_SAN = re.compile(r'^([NBRQK])?([a-h])?([1-8])?(x)?([a-h][1-8])(?:=?([NBRQ]))?$')
+
+
+class PgnGame(NamedTuple):
+    """
+    ### One Game of a PGN File
+    - `headers [dict]`: Tag pairs (`{'White': ..., 'Result': '1-0', ...}`)
+    - `moves [list[str]]`: Main line in SAN (`['e4', 'e5', 'Nf3', ...]`), without comments, variations or NAGs
+    - `result [str]`: `'1-0'`, `'0-1'`, `'1/2-1/2'` or `'*'`
+    """
+    headers: dict
+    moves: list
+    result: str
+
+
+def parse_movetext(text: str) -> tuple[list[str], str]:
+    """#### SAN moves and result of a movetext section (comments, variations, NAGs and move numbers dropped)"""
+    text = _COMMENT.sub(' ', text)
+    while '(' in text:
+        stripped = _VARIATION.sub(' ', text)
+        if stripped == text:
+            break  # Unbalanced parenthesis, keep what is left
+        text = stripped
+    moves, result = [], '*'
+    for token in _NOISE.sub(' ', text).split():
+        if token in RESULTS:
+            result = token
+        else:
+            moves.append(token)
+    return moves, result
+
+def _strip_comments(line: str, in_comment: bool) -> tuple[str, bool]:
+    """#### A movetext line without its `{...}` and `;` comments, and whether a `{` comment is still open at its end"""
+    text, i = [], 0
+    while i < len(line):
+        if in_comment:
+            end = line.find('}', i)
+            if end < 0:
+                break
+            text.append(' ')
+            i, in_comment = end + 1, False
+        else:
+            brace, semicolon = line.find('{', i), line.find(';', i)
+            if semicolon >= 0 and (brace < 0 or semicolon < brace):
+                text.append(line[i:semicolon])  # Comment up to the end of the line
+                break
+            if brace < 0:
+                text.append(line[i:])
+                break
+            text.append(line[i:brace])
+            i, in_comment = brace + 1, True
+    return ''.join(text).strip(), in_comment
+
+def iter_games(source: Union[str, TextIO]) -> Iterator[PgnGame]:
+    """
+    ### Stream the Games of a PGN File
+    Reads line by line and yields every game as soon as its movetext ends, so memory use depends on
+    the longest game only, not on the file size. Comments are dropped as they are read: a `{...}`
+    comment may span lines, and its lines never end the movetext (even blank or starting with `[`).
+
+    #### Args:
+    - source (str | TextIO): Path of a PGN file, or an open text stream
+    """
+    if isinstance(source, str):
+        with open(source, encoding='utf-8', errors='replace') as stream:
+            yield from iter_games(stream)
+        return
+
+    headers, movetext, in_comment = {}, [], False
+    for line in source:
+        line = line.strip()
+        if in_comment:
+            line, in_comment = _strip_comments(line, in_comment)
+            if line:
+                movetext.append(line)
+            continue
+        if movetext and (not line or line.startswith('[')):  # End of the movetext
+            yield PgnGame(headers, *parse_movetext(' '.join(movetext)))
+            headers, movetext = {}, []
+        if line.startswith('['):
+            match = _TAG.match(line)
+            if match:
+                headers[match.group(1)] = match.group(2).replace('\\"', '"')
+        elif line and not line.startswith('%'):
+            line, in_comment = _strip_comments(line, in_comment)
+            if line:
+                movetext.append(line)
+    if movetext or headers:
+        yield PgnGame(headers, *parse_movetext(' '.join(movetext)))
+
+def san_to_move(board: ChessBoard, san: str) -> tuple[str, str]:
+    """
+    ### Resolve a SAN Move against the Current Position
+    #### Looks outward from the target square with `board.attackers_of()` instead of generating every move;
+    #### legality is only checked when several pieces of the same kind can reach the square (pins).
+
+    #### Returns:
+    - tuple[str, str]: `(from, to)` as accepted by `ChessBoard.__add__` (`('e7', 'e8 =Q')` for promotions)
+    #### Raises:
+    - ValueError: Unreadable, impossible or ambiguous move
+    """
+    color = board.player_turn
+    rank = '1' if color == 'white' else '8'
+    token = san.rstrip('+#!?')
+    if token in ('O-O', '0-0'):
+        return f'e{rank}', f'g{rank}'
+    if token in ('O-O-O', '0-0-0'):
+        return f'e{rank}', f'c{rank}'
+
+    match = _SAN.match(token)
+    if not match:
+        raise ValueError(f"Unreadable SAN move: {san!r}")
+    letter, from_file, from_rank, capture, to, promotion = match.groups()
+
+    if letter is None:  # Pawn
+        step = 1 if color == 'white' else -1
+        behind = int(to[1]) - step
+        if capture:
+            frm = f"{from_file}{behind}"
+        else:
+            frm = f"{to[0]}{behind}"
+            if not isinstance(board.piece_at(frm), Pawn):
+                frm = f"{to[0]}{behind - step}"  # Double step
+        piece = board.piece_at(frm)
+        if not (isinstance(piece, Pawn) and piece.color == color):
+            raise ValueError(f"No {color} pawn can play {san!r}")
+        return frm, f"{to} ={promotion}" if promotion else to
+
+    ident = SAN_PIECES[letter]
+    candidates = [piece.position for piece in board.attackers_of(to, color)
+                  if piece.ident == ident and (from_file or piece.position[0]) == piece.position[0]
+                  and (from_rank or piece.position[1]) == piece.position[1]]
+    if len(candidates) > 1:
+        candidates = [frm for frm in candidates if board.is_mv_safe_for_king((frm, to))]
+    if len(candidates) != 1:
+        raise ValueError(f"{'Ambiguous' if candidates else 'Impossible'} move {san!r} for {color}")
+    return candidates[0], to
+
+def replay(game: PgnGame) -> ChessBoard:
+    """
+    #### Play a game's moves on a `trusted` board (no history, score board, check decoration or display)
+    #### Raises:
+    - ValueError: On the first move that cannot be played
+    """
+    board = ChessBoard(game.headers.get('FEN', STARTING_FEN), have_history=False, have_score_board=False, trusted=True)
+    for ply, san in enumerate(game.moves):
+        outcome = board + san_to_move(board, san)
+        if isinstance(outcome, str):
+            raise ValueError(f"Move {ply // 2 + 1} {san!r}: {outcome}")
+        board.change_player_turn()
+    return board
+
+
+class ReplayReport(NamedTuple):
+    """
+    ### Summary of `replay_games()`
+    - `games [int]`, `moves [int]`: Games read and plies replayed
+    - `failed [int]`: Games that could not be replayed
+    - `errors [list]`: `(game number, message)` of the first `MAX_REPORTED_ERRORS` of them
+    - `seconds [float]`: Wall time
+    """
+    games: int
+    moves: int
+    failed: int
+    errors: list
+    seconds: float
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.games} games ({self.moves} moves, {self.failed} failed) in {self.seconds:.1f}s "
+                f"({self.games_per_second:.1f} games/s)")
+
+
+def replay_games(source: Union[str, TextIO]) -> ReplayReport:
+    """#### Stream and replay every game of a PGN file (see `iter_games()` and `replay()`)"""
+    games = moves = failed = 0
+    errors = []
+    start = time.perf_counter()
+    for games, game in enumerate(iter_games(source), start=1):
+        try:
+            replay(game)
+            moves += len(game.moves)
+        except ValueError as error:
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append((games, str(error)))
+    return ReplayReport(games, moves, failed, errors, time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Stream and replay the games of a PGN file.')
+    parser.add_argument('pgn', help='PGN file')
+    args = parser.parse_args()
+
+    report = replay_games(args.pgn)
+    for number, message in report.errors[:10]:
+        print(f"Game {number}: {message}")
+    print(report)  # e.g. python chessboard_pgn.py games.pgn
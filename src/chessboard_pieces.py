@@ -10,6 +10,12 @@ PIECE_SYMBOLS = {
               'Pawnw': "[p]", 'Knightw': "[n]", 'Bishopw': "[b]", 'Rookw': "[r]", 'Queenw': "[q]", 'Kingw': "[k]"},
 }
 
+# Offsets/directions used to look outward from a square for its attackers
+KNIGHT_OFFSETS = [(2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2)]
+KING_OFFSETS = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, -1), (-1, 1)]
+ORTHOGONAL_DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)] # Rook & Queen
+DIAGONAL_DIRECTIONS = [(1, 1), (1, -1), (-1, -1), (-1, 1)]  # Bishop & Queen
+
 # Used For bots
 PIECE_SQUARE_TABLES = {
     'Pawn': [
@@ -117,22 +123,8 @@ class Pawn:
             
             n = int(new_position[1])
             if (n == 1 and self.symbol == '[♟︎]') or (n == 8 and self.symbol == '[♙]'):
-                # Pawn promotion if it reaches the last rank
-                print('Your Pawn has reached its last rank! Promote it now.\nEnter a number to promote [1 - 4]')
-                player =  "w" if n == 8 else "b"
-                choices = [Queen(player, self.position), Knight(player, self.position), Rook(player, self.position), Bishop(player, self.position)] 
-
-                while True:
-                    print(*list(f"[{i+1} => {choices[i].symbol[1]} ] " for i in range(4)))
-                    choice_no = input('>>>> ')
-                    if choice_no.isdigit():
-                        choice_no = int(choice_no)
-                        if 1 <= choice_no <= 4:
-                            return choices[choice_no - 1]
-                        else:
-                            print("Invalid Number! Please choose a number between 1 and 4.")
-                    else:
-                        print("Invalid input! Please enter a number.")
+                # Pawn reached its last rank without a choice: it becomes a Queen (UIs ask for the choice before moving)
+                return Queen("w" if n == 8 else "b", self.position)
             return None
 
     def define_coor(self) -> tuple[str, str, str]:
@@ -312,6 +304,33 @@ class None_Piece:
     def define_coor(self) -> tuple[str, str]:
         return (None, None, self.symbol)
 
+def is_square_attacked(rows: list, square: str, color: Literal['white', 'black']) -> bool:
+    """
+    #### Whether a piece of `color` attacks `square` on `rows` (8 rows of pieces, rank 8 first)
+    Looks outward from the square, first along the knight, pawn and king offsets, then to the first
+    piece of each ray, and stops at the first attacker found (no move generation, pins ignored).
+    """
+    C, N = ord(square[0]) - ord('a'), int(square[1])
+    pawn_dn = -1 if color == 'white' else 1  # White pawns attack upwards, from the rank below
+    for offsets, ident in ((KNIGHT_OFFSETS, 'Knight'), (KING_OFFSETS, 'King'), (((-1, pawn_dn), (1, pawn_dn)), 'Pawn')):
+        for dc, dn in offsets:
+            c, n = C + dc, N + dn
+            if 0 <= c < 8 and 1 <= n <= 8:
+                piece = rows[8 - n][c]
+                if piece.ident == ident and piece.color == color:
+                    return True
+    for directions, idents in ((ORTHOGONAL_DIRECTIONS, ('Rook', 'Queen')), (DIAGONAL_DIRECTIONS, ('Bishop', 'Queen'))):
+        for dc, dn in directions:
+            c, n = C + dc, N + dn
+            while 0 <= c < 8 and 1 <= n <= 8:
+                piece = rows[8 - n][c]
+                if piece.color is not None:
+                    if piece.color == color and piece.ident in idents:
+                        return True
+                    break
+                c, n = c + dc, n + dn
+    return False
+
 class repr_piece:
     """
     ### Representive Piece
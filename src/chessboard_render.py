@@ -0,0 +1,107 @@
+import shutil
+import sys
+
+# ANSI control sequences (no `os.system('clear')` subprocess)
+CLEAR_SCREEN = "\033[H\033[2J"  # Cursor home + erase whole screen
+ERASE_LINE   = "\033[K"         # Erase from the cursor to the end of the line
+ERASE_BELOW  = "\033[J"         # Erase from the cursor to the end of the screen
+
+_screen_epoch = 0  # Bumped by every `clear_screen()`, so renderers know their last frame is gone
+BOARD_ROWS = 10    # Header, 8 ranks, and the line the cursor is parked on
+ROWS_BELOW = 16    # Lines a normal turn prints under the board (scores, prompts, move note)
+
+def move_to(row: int, col: int) -> str:
+    """#### ANSI cursor addressing (1-based row and column)"""
+    return f"\033[{row};{col}H"
+
+def clear_screen(stream=None):
+    """#### Clear the terminal with ANSI sequences, in a single write"""
+    global _screen_epoch
+    stream = stream or sys.stdout
+    stream.write(CLEAR_SCREEN)
+    stream.flush()
+    _screen_epoch += 1
+
+
+class TerminalRenderer:
+    """
+    ### Double-Buffered Differential Board Renderer
+
+    #### Every frame is built in one buffer and written with a single call :-
+    - `First frame` (or after `clear_screen()` / `invalidate()`): the screen is cleared and the whole board is written
+    - `Next frames`: only the header and the squares that changed since the previous frame are rewritten,
+      using cursor addressing. The cursor is then parked below the board, erasing whatever was printed there.
+    - `Scrolling`: the addressing assumes the board is still on the top `BOARD_ROWS` lines. Terminals
+      shorter than `BOARD_ROWS + ROWS_BELOW` always get full frames, and callers that print more than
+      `ROWS_BELOW` lines between two frames (error messages, prompts repeated) call `invalidate()`.
+
+    ##### Layout (fixed at the top of the screen) :-
+    - Line 1: header (player initial + `|a||b|...|h|`)
+    - Lines 2-9: `8--` row label followed by 8 cells of `CELL_WIDTH` columns each
+
+    ##### Properties :-
+    - `squares_written [int]`: Number of squares (re)written since creation, for measuring the savings
+    """
+    CELL_WIDTH = 3   # '[♟︎]', '[P]', '[_]'
+    LABEL_WIDTH = 3  # '8--'
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.squares_written = 0
+        self._header = None
+        self._cells = None
+        self._epoch = -1
+
+    def invalidate(self):
+        """#### Forget the previous frame, the next `draw()` repaints everything"""
+        self._cells = None
+
+    @staticmethod
+    def _may_have_scrolled(stream) -> bool:
+        """#### Whether the output of a turn can push the board off its rows on this terminal"""
+        isatty = getattr(stream, 'isatty', None)
+        return bool(isatty and isatty()) and shutil.get_terminal_size().lines < BOARD_ROWS + ROWS_BELOW
+
+    def draw(self, header: str, cells: list[list[str]]):
+        """
+        #### Draw one frame
+        - header (str): First line above the board
+        - cells (list[list[str]]): 8x8 already formatted squares (rank 8 first), escapes included
+        """
+        stream = self.stream or sys.stdout
+        buffer = []
+
+        if self._cells is None or self._epoch != _screen_epoch or self._may_have_scrolled(stream):
+            buffer.append(CLEAR_SCREEN)
+            buffer.append(header + ERASE_LINE + "\n")
+            for i, row in enumerate(cells):
+                buffer.append(f"{8 - i}--" + "".join(row) + ERASE_LINE + "\n")
+            self.squares_written += 64
+        else:
+            if header != self._header:
+                buffer.append(move_to(1, 1) + header + ERASE_LINE)
+            for i, (row, old_row) in enumerate(zip(cells, self._cells)):
+                for j, (cell, old_cell) in enumerate(zip(row, old_row)):
+                    if cell != old_cell:
+                        buffer.append(move_to(i + 2, self.LABEL_WIDTH + 1 + j * self.CELL_WIDTH) + cell)
+                        self.squares_written += 1
+            buffer.append(move_to(BOARD_ROWS, 1))
+        buffer.append(ERASE_BELOW) # Drop the prompts/messages printed under the previous frame
+
+        stream.write("".join(buffer))
+        stream.flush()
+        self._header = header
+        self._cells = [list(row) for row in cells]
+        self._epoch = _screen_epoch
+
+# Examples Usage
+if __name__ == '__main__':
+    import time
+    renderer = TerminalRenderer()
+    cells = [["[_]"] * 8 for _ in range(8)]
+    cells[6][4] = "[P]"
+    renderer.draw("   |a||b||c||d||e||f||g||h|", cells)  # Full frame
+    time.sleep(1)
+    cells[6][4], cells[4][4] = "[_]", "[P]"
+    renderer.draw("   |a||b||c||d||e||f||g||h|", cells)  # Only 2 squares rewritten
+    print("Squares written:", renderer.squares_written)  # -> 66
@@ -0,0 +1,228 @@
+from chessboard_     import ChessBoard
+from chessboard_bot  import ChessBot, MATE_SCORE
+from chessboard_fen  import STARTING_FEN
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools       import repeat
+from prettytable     import PrettyTable
+from typing          import Iterable, NamedTuple, Optional
+import multiprocessing
+import os
+import threading
+import time
+
+REVIEW_DEPTH  = 3              # Search depth of every reviewed position
+MISTAKE_SWING = 1.0            # Pawns lost by a move (for the player who made it) to be tagged a mistake
+BLUNDER_SWING = 3.0            # ... to be tagged a blunder
+EVAL_CAP      = 10.0           # Evaluations are capped to +/- this many pawns before swings are measured (mates included)
+REVIEW_SUFFIX = '_review.txt'  # `moves_his.txt` -> `moves_his_review.txt`
+
+_worker_bots = None   # Per worker process: bots of depth `depth` and `depth - 1` sharing one transposition table
+_review_pool = None   # Process pool of `review_in_background()`, started by the first review and kept for the next games
+_review_workers = 0
+
+def evaluate_move(fen: str, move: tuple, depth: int = REVIEW_DEPTH) -> tuple[float, float, Optional[tuple]]:
+    """
+    #### Score of the best move and of the played `move` of one position (pawns, for the side to move), and the best move
+    #### The position is searched `depth` plies deep, the one after `move` `depth - 1` plies: both scores look
+    #### equally far ahead, so their difference is what the move cost and not an odd/even horizon effect.
+    """
+    global _worker_bots
+    if _worker_bots is None or _worker_bots[0].depth != depth:
+        _worker_bots = (ChessBot(depth=depth), ChessBot(depth=depth - 1))
+        _worker_bots[1].table = _worker_bots[0].table
+    board = ChessBoard(fen, have_history=False, have_score_board=False, trusted=True)
+    best = _worker_bots[0].search(board)
+    frm, to = move
+    board.push(board.legal_move_code(frm, to[:2], to[2:].strip(' =') or None))
+    has_move, in_check = board.legal_move_status()
+    if not has_move:
+        played = MATE_SCORE - 1 if in_check else 0.0  # Checkmate (or stalemate) on the board
+    else:
+        played = -_worker_bots[1].search(board).score
+    return best.score, played, best.move
+
+def replay(moves: Iterable[tuple], fen: str = STARTING_FEN) -> list[str]:
+    """#### FEN of every position of a game: the start, then the position after each move (`len(moves) + 1` FENs)"""
+    board = ChessBoard(fen, have_history=False, have_score_board=False, trusted=True)
+    fens = [board.fen]
+    for frm, to in moves:
+        code = board.legal_move_code(frm, to[:2], to[2:].strip(' =') or None)
+        if code is None:
+            raise ValueError(f"Illegal move {frm}-{to} after {len(fens) - 1} moves")
+        board.push(code)
+        fens.append(board.fen)
+    return fens
+
+def review_path(history_path: str) -> str:
+    """#### Report file next to a history file (`moves_his.txt` -> `moves_his_review.txt`)"""
+    return os.path.splitext(history_path)[0] + REVIEW_SUFFIX
+
+
+class MoveReview(NamedTuple):
+    """
+    ### One Reviewed Move
+    - `ply [int]`: 1 for White's first move
+    - `color [str]`: Player who made it
+    - `move [tuple]`: `(from, to)` as played
+    - `before [float]`: Evaluation with the best move (pawns, White's point of view, capped to `EVAL_CAP`)
+    - `after [float]`: Evaluation with the move played, same scale
+    - `swing [float]`: Pawns the move lost against the best one, for the player who made it
+    - `tag [str]`: `'blunder'`, `'mistake'` or `''`
+    - `best [tuple | None]`: Best move of the position before, according to the search
+    """
+    ply: int
+    color: str
+    move: tuple
+    before: float
+    after: float
+    swing: float
+    tag: str
+    best: Optional[tuple]
+
+
+class GameReview(NamedTuple):
+    """
+    ### Result of `review_game()`
+    - `moves [list[MoveReview]]`: One entry per move
+    - `positions [int]`: Positions reviewed (one per move)
+    - `seconds [float]`: Wall time
+    - `workers [int]`: Processes used
+    """
+    moves: list
+    positions: int
+    seconds: float
+    workers: int
+
+    @property
+    def blunders(self) -> list:
+        return [move for move in self.moves if move.tag == 'blunder']
+
+    @property
+    def mistakes(self) -> list:
+        return [move for move in self.moves if move.tag == 'mistake']
+
+    @property
+    def positions_per_second(self) -> float:
+        return self.positions / self.seconds if self.seconds else 0.0
+
+    def report(self) -> str:
+        """#### Annotated move table followed by a summary line, as written by `write_review()`"""
+        table = PrettyTable(['#', 'Player', 'Move', 'Eval', 'Swing', 'Tag', 'Best'])
+        for move in self.moves:
+            table.add_row([move.ply, move.color.title(), f"{move.move[0]}-{move.move[1]}", f"{move.after:+.2f}",
+                           f"{-move.swing:+.2f}" if move.swing > 0 else '', move.tag.upper(),
+                           f"{move.best[0]}-{move.best[1]}" if move.tag and move.best else ''])
+        summary = {color: [len([m for m in moves if m.color == color]) for moves in (self.blunders, self.mistakes)]
+                   for color in ('white', 'black')}
+        return (f"{table}\n" + ', '.join(f"{color.title()}: {b} blunder(s), {m} mistake(s)" for color, (b, m) in summary.items())
+                + f" [{self.positions} positions in {self.seconds:.1f}s on {self.workers} process(es)]")
+
+
+def review_game(moves: Iterable[tuple], fen: str = STARTING_FEN, depth: int = REVIEW_DEPTH,
+                workers: Optional[int] = None) -> GameReview:
+    """
+    ### Search Every Position of a Finished Game and Tag its Blunders and Mistakes
+
+    The game is replayed here. Its positions are searched in a process pool, one task per move, so the
+    throughput grows with the number of cores. A move is tagged by how much worse it scored than the best
+    move for the player who made it (`MISTAKE_SWING`, `BLUNDER_SWING`). The best move is never tagged.
+
+    #### Args:
+    - moves (Iterable[tuple]): `(from, to)` moves from `fen`, e.g. a `History`
+    - fen (str): Starting position. Defaults to `STARTING_FEN`.
+    - depth (int): Search depth per position, at least 2 (see `evaluate_move()`). Defaults to `REVIEW_DEPTH`.
+    - workers (int | None): Worker processes (`None` = one per CPU but one, `0` = no pool, everything in this process)
+
+    #### Returns:
+    - GameReview: The annotated moves and the throughput
+    """
+    moves, fens = _prepare(moves, fen, depth)
+    start = time.perf_counter()
+    if workers == 0:
+        results = [evaluate_move(position, move, depth) for position, move in zip(fens, moves)]
+    else:
+        workers = workers or _default_workers()
+        with _process_pool(workers) as pool:
+            results = list(pool.map(evaluate_move, fens, moves, repeat(depth)))
+    return _annotate(moves, fens, results, time.perf_counter() - start, workers or 1)
+
+def _prepare(moves: Iterable[tuple], fen: str, depth: int) -> tuple[list, list]:
+    """#### The moves and the FEN of the position before each of them"""
+    if depth < 2:
+        raise ValueError(f"Review depth must be at least 2, got {depth}")
+    moves = list(moves)
+    return moves, replay(moves, fen)[:-1]
+
+def _default_workers() -> int:
+    return max(1, (os.cpu_count() or 1) - 1)  # A core is left to the game going on
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    # Fresh interpreters: a forked worker could inherit a cache lock held by a thread of this process
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+def _annotate(moves: list, fens: list, results: list, seconds: float, workers: int) -> GameReview:
+    """#### `GameReview` of the `evaluate_move()` results of every move"""
+    white_to_move = ' w ' in fens[0] if fens else True
+    reviewed = []
+    for index, (move, (best_score, played, best)) in enumerate(zip(moves, results)):
+        color = 'white' if (index % 2 == 0) == white_to_move else 'black'
+        sign = 1 if color == 'white' else -1  # Scores are turned to White's point of view
+        before, after = (sign * max(-EVAL_CAP, min(EVAL_CAP, score)) for score in (best_score, played))
+        swing = sign * (before - after)
+        tag = '' if move == best else 'blunder' if swing >= BLUNDER_SWING else 'mistake' if swing >= MISTAKE_SWING else ''
+        reviewed.append(MoveReview(index + 1, color, move, before, after, swing, tag, best))
+    return GameReview(reviewed, len(fens), seconds, workers)
+
+def write_review(review: GameReview, path: str):
+    """#### Append the report of a game to `path`, under a time stamp"""
+    with open(path, '+a') as file:
+        file.write(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] {len(review.moves)} moves\n{review.report()}\n")
+
+def review_in_background(moves: Iterable[tuple], history_path: str, fen: str = STARTING_FEN,
+                         depth: int = REVIEW_DEPTH, workers: Optional[int] = None) -> Future:
+    """
+    ### `review_game()` + `write_review()` off the Interactive Loop
+
+    Returns at once: the game is replayed here, its moves are queued on a process pool kept for the next games
+    (`workers` is read by the first call only), and the report is appended to `review_path(history_path)` when
+    the last one is done. Nothing waits for it on this thread, and work already queued is finished before
+    the interpreter exits.
+
+    #### Returns:
+    - Future: Resolves to the `GameReview` once the report is written
+    """
+    global _review_pool, _review_workers
+    moves, fens = _prepare(moves, fen, depth)  # Copied now: the history is cleared by the next game
+    if _review_pool is None:
+        _review_workers = workers or _default_workers()
+        _review_pool = _process_pool(_review_workers)
+    start = time.perf_counter()
+    review = Future()
+    tasks = [_review_pool.submit(evaluate_move, position, move, depth) for position, move in zip(fens, moves)]
+    pending, lock = [len(tasks)], threading.Lock()
+
+    def task_done(_):
+        with lock:
+            pending[0] -= 1
+            if pending[0]:
+                return
+        try:  # Last move reviewed (on the pool's thread)
+            result = _annotate(moves, fens, [task.result() for task in tasks], time.perf_counter() - start, _review_workers)
+            write_review(result, review_path(history_path))
+            review.set_result(result)
+        except Exception as error:
+            review.set_exception(error)
+
+    if not tasks:
+        review.set_result(GameReview([], 0, 0.0, 0))
+    for task in tasks:
+        task.add_done_callback(task_done)
+    return review
+
+# Examples Usage
+if __name__ == '__main__':
+    game = [('e2', 'e4'), ('e7', 'e5'), ('f1', 'c4'), ('b8', 'c6'), ('d1', 'h5'), ('g8', 'f6'), ('h5', 'f7')]
+    review = review_game(game)
+    print(review.report()) # Ng8-f6 is tagged as a blunder (Qxf7# follows), best move ...Qe7 or ...g6
+    for workers in (0, 1, None): # Throughput grows with the number of processes (the pool costs its start-up)
+        print(f"workers={workers}: {review_game(game, workers=workers).positions_per_second:.1f} positions/s")
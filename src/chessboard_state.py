@@ -0,0 +1,103 @@
+from typing import Literal, Optional
+
+# Castling rights bitmask
+WHITE_KINGSIDE  = 1
+WHITE_QUEENSIDE = 2
+BLACK_KINGSIDE  = 4
+BLACK_QUEENSIDE = 8
+ALL_CASTLING    = WHITE_KINGSIDE | WHITE_QUEENSIDE | BLACK_KINGSIDE | BLACK_QUEENSIDE
+
+CASTLING_LETTERS = {'K': WHITE_KINGSIDE, 'Q': WHITE_QUEENSIDE, 'k': BLACK_KINGSIDE, 'q': BLACK_QUEENSIDE}
+CASTLING_RIGHTS = {
+    ('white', 'K'): WHITE_KINGSIDE, ('white', 'Q'): WHITE_QUEENSIDE,
+    ('black', 'K'): BLACK_KINGSIDE, ('black', 'Q'): BLACK_QUEENSIDE,
+}
+# Rights that are lost for good once a piece leaves (or is captured on) one of these squares
+CASTLING_SQUARE_MASKS = {
+    'e1': WHITE_KINGSIDE | WHITE_QUEENSIDE, 'h1': WHITE_KINGSIDE, 'a1': WHITE_QUEENSIDE,
+    'e8': BLACK_KINGSIDE | BLACK_QUEENSIDE, 'h8': BLACK_KINGSIDE, 'a8': BLACK_QUEENSIDE,
+}
+
+class BoardState:
+    """
+    ### Game-State Record of a Chessboard
+
+    #### Holds everything about a position that is not the piece placement (except the side to move) :-
+    - `castling [int]`: Castling rights bitmask (`WHITE_KINGSIDE | BLACK_QUEENSIDE | ...`)
+    - `en_passant [str | None]`: En passant target square (e.g. `'e3'`), the square *behind* a pawn that just made a double step
+    - `halfmove_clock [int]`: Plies since the last capture or pawn move (50-move rule)
+    - `fullmove_number [int]`: Starts at 1, incremented after Black's move
+
+    ##### Methods :-
+    - `update(...)`: Apply one move in O(1) [replaces the per-move `reset_pawns` board scan]
+    - `can_castle(color, side)`: Whether the right is still available
+    - `copy()`: Cheap copy, used to save and restore the state (search, undo)
+    """
+    __slots__ = ('castling', 'en_passant', 'halfmove_clock', 'fullmove_number')
+
+    def __init__(self, castling: int = ALL_CASTLING, en_passant: Optional[str] = None,
+                 halfmove_clock: int = 0, fullmove_number: int = 1):
+        self.castling = castling
+        self.en_passant = en_passant
+        self.halfmove_clock = halfmove_clock
+        self.fullmove_number = fullmove_number
+
+    @classmethod
+    def from_fen_fields(cls, castling: str, en_passant: str, halfmove_clock: int = 0, fullmove_number: int = 1) -> 'BoardState':
+        rights = 0
+        for letter in castling.strip('-'):
+            rights |= CASTLING_LETTERS[letter]
+        return cls(rights, None if en_passant == '-' else en_passant, halfmove_clock, fullmove_number)
+
+    @property
+    def castling_fen(self) -> str:
+        """#### Castling rights as the FEN field (`'KQkq'`, `'Kq'`, `'-'`, ...)"""
+        return ''.join(letter for letter, bit in CASTLING_LETTERS.items() if self.castling & bit) or '-'
+
+    def can_castle(self, color: Literal['white', 'black'], side: Literal['K', 'Q']) -> bool:
+        return bool(self.castling & CASTLING_RIGHTS[(color, side)])
+
+    def update(self, frm: str, to: str, moved_ident: str, moved_color: Literal['white', 'black'], is_capture: bool):
+        """
+        #### Apply one (already validated) move to the record
+
+        #### Args:
+        - frm, to (str): Plain squares of the move (no decorations or promotion choice)
+        - moved_ident (str): `ident` of the moving piece (e.g. 'Pawn')
+        - moved_color (str): Color of the moving piece
+        - is_capture (bool): Whether the move captured a piece (en passant included)
+        """
+        self.castling &= ~(CASTLING_SQUARE_MASKS.get(frm, 0) | CASTLING_SQUARE_MASKS.get(to, 0))
+
+        if moved_ident == 'Pawn' and abs(int(to[1]) - int(frm[1])) == 2:
+            self.en_passant = f"{frm[0]}{(int(frm[1]) + int(to[1])) // 2}"
+        else:
+            self.en_passant = None
+
+        if moved_ident == 'Pawn' or is_capture:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+        if moved_color == 'black':
+            self.fullmove_number += 1
+
+    def copy(self) -> 'BoardState':
+        return BoardState(self.castling, self.en_passant, self.halfmove_clock, self.fullmove_number)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, BoardState) and all(getattr(self, s) == getattr(other, s) for s in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"BoardState(castling={self.castling_fen!r}, en_passant={self.en_passant!r}, " \
+               f"halfmove_clock={self.halfmove_clock}, fullmove_number={self.fullmove_number})"
+
+# Examples Usage
+if __name__ == '__main__':
+    state = BoardState()
+    state.update('e2', 'e4', 'Pawn', 'white', False)
+    print(state) # -> BoardState(castling='KQkq', en_passant='e3', halfmove_clock=0, fullmove_number=1)
+
+    saved = state.copy()
+    state.update('h8', 'h6', 'Rook', 'black', False)
+    print(state) # -> BoardState(castling='KQq', en_passant=None, halfmove_clock=1, fullmove_number=2)
+    print(saved) # Untouched copy
@@ -0,0 +1,208 @@
+from chessboard_     import ChessBoard
+from chessboard_bot  import ChessBot
+from chessboard_mcts import MCTSBot
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools       import combinations
+from typing          import NamedTuple, Optional
+import argparse
+import json
+import math
+import time
+
+# Balanced positions after the first moves of common openings (standard FEN)
+OPENING_SUITE = [
+    "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",           # Open Game
+    "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",           # Sicilian Defence
+    "rnbqkbnr/pppp1ppp/4p3/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",           # French Defence
+    "rnbqkbnr/pp1ppppp/2p5/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",           # Caro-Kann Defence
+    "rnbqkbnr/ppp1pppp/8/3p4/3P4/8/PPP1PPPP/RNBQKBNR w KQkq - 0 2",           # Closed Game
+    "rnbqkb1r/pppppppp/5n2/8/3P4/8/PPP1PPPP/RNBQKBNR w KQkq - 1 2",           # Indian Defence
+    "rnbqkbnr/ppp1pppp/8/3p4/2PP4/8/PP2PPPP/RNBQKBNR b KQkq - 0 2",           # Queen's Gambit
+    "rnbqkbnr/pppppppp/8/8/2P5/8/PP1PPPPP/RNBQKBNR b KQkq - 0 1",             # English Opening
+    "r1bqkbnr/pppp1ppp/2n5/1B2p3/4P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3",      # Ruy Lopez
+    "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3",      # Italian Game
+]
+MAX_PLIES = 200  # Games still running after this many plies are adjudicated as draws
+ENGINES = {ChessBot.name: ChessBot, MCTSBot.name: MCTSBot}  # Engine types, by `EngineConfig.engine`
+
+
+class EngineConfig(NamedTuple):
+    """
+    ### One Player of a Tournament
+    - `name [str]`: Label used in the results
+    - `options [dict | None]`: Keyword arguments of the engine (e.g. `{'depth': 2, 'max_nodes': 400}`, `{'playouts': 300}`),
+      None for the engine's defaults
+    - `engine [str= 'alphabeta']`: Engine type, a key of `ENGINES` (`'alphabeta'` = `ChessBot`, `'mcts'` = `MCTSBot`)
+    """
+    name: str
+    options: Optional[dict] = None
+    engine: str = ChessBot.name
+
+    def create(self) -> ChessBot | MCTSBot:
+        if self.engine not in ENGINES:
+            raise ValueError(f"Unknown engine {self.engine!r}, expected one of {sorted(ENGINES)}")
+        return ENGINES[self.engine](**(self.options or {}))
+
+
+def adjudicate(board: ChessBoard) -> tuple[str, str] | None:
+    """
+    #### Result of a finished game, or `None` while it goes on
+    #### Returns:
+    - tuple[str, str]: (`'1-0'`, `'0-1'` or `'1/2-1/2'`, reason)
+    """
+    running, message = board.check_board()
+    if not running:
+        lowered = message.lower()
+        if 'draw' in lowered:
+            return '1/2-1/2', message
+        return ('0-1' if 'black' in lowered else '1-0'), message
+    if board.state.halfmove_clock >= 100:
+        return '1/2-1/2', '50-move rule'
+    return None
+
+
+def play_game(white: EngineConfig, black: EngineConfig, opening_fen: str, max_plies: int = MAX_PLIES) -> dict:
+    """
+    ### Play One Headless Game between two engine configurations
+    #### Returns:
+    - dict: `white`, `black`, `opening`, `result`, `reason`, `plies`, `moves`, `nodes`, `seconds`
+    """
+    start = time.perf_counter()
+    board = ChessBoard(opening_fen, have_history=False, have_score_board=False)
+    bots = {'white': white.create(), 'black': black.create()}
+    moves, nodes = [], 0
+
+    try:
+        outcome = adjudicate(board)
+        while outcome is None and len(moves) < max_plies:
+            result = bots[board.player_turn].search(board)
+            nodes += result.nodes
+            board + result.move
+            board.change_player_turn()
+            moves.append(''.join(result.move).replace(' =', '').lower())
+            outcome = adjudicate(board)
+    finally:
+        for bot in bots.values():
+            if hasattr(bot, 'close'):
+                bot.close()  # E.g. the process pool of an `MCTSBot` with workers
+
+    result, reason = outcome or ('1/2-1/2', f'Adjudicated after {max_plies} plies')
+    return {'white': white.name, 'black': black.name, 'opening': opening_fen, 'result': result,
+            'reason': reason, 'plies': len(moves), 'moves': moves, 'nodes': nodes,
+            'seconds': round(time.perf_counter() - start, 3)}
+
+
+def elo_difference(wins: int, draws: int, losses: int) -> tuple[float, float]:
+    """
+    #### Elo difference implied by a score, with its 95% error bar
+    #### Returns:
+    - tuple[float, float]: (Elo difference, ± margin). Infinite when one side scored 0% or 100%.
+    """
+    games = wins + draws + losses
+    if not games:
+        return 0.0, math.inf
+    score = (wins + draws / 2) / games
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    stderr = math.sqrt(variance / games)
+
+    def elo(p: float) -> float:
+        if p <= 0: return -math.inf
+        if p >= 1: return math.inf
+        return -400 * math.log10(1 / p - 1)
+
+    low, high = elo(score - 1.96 * stderr), elo(score + 1.96 * stderr)
+    return elo(score), (high - low) / 2
+
+
+class TournamentReport(NamedTuple):
+    """
+    ### Summary of `run_tournament()`
+    - `standings [dict]`: `{(engine_a, engine_b): (wins_a, draws, losses_a)}` for every pair
+    - `games [int]`, `seconds [float]`: Played games and wall time
+    """
+    standings: dict
+    games: int
+    seconds: float
+
+    @property
+    def games_per_hour(self) -> float:
+        return self.games / self.seconds * 3600 if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        lines = []
+        for (a, b), (wins, draws, losses) in self.standings.items():
+            diff, margin = elo_difference(wins, draws, losses)
+            lines.append(f"{a} vs {b}: +{wins} ={draws} -{losses}  Elo {diff:+.1f} ± {margin:.1f}")
+        lines.append(f"{self.games} games in {self.seconds:.1f}s ({self.games_per_hour:.0f} games/hour)")
+        return '\n'.join(lines)
+
+
+def run_tournament(engines: list[EngineConfig], openings: list[str] = OPENING_SUITE, rounds: int = 1,
+                   workers: int | None = None, results_path: str = 'tournament_results.jsonl',
+                   max_plies: int = MAX_PLIES) -> TournamentReport:
+    """
+    ### Round-Robin Tournament over a Process Pool
+
+    Every pair of engines plays every opening `rounds` times with both colors. Games run in parallel
+    worker processes, and each finished game is appended to `results_path` (one JSON object per line)
+    as soon as it is done, so an interrupted tournament keeps its results.
+
+    #### Args:
+    - engines (list[EngineConfig]): At least two configurations
+    - openings (list[str]): FEN of each starting position. Defaults to `OPENING_SUITE`.
+    - rounds (int): Repetitions of the whole schedule
+    - workers (int | None): Worker processes (`None` = one per CPU)
+    - results_path (str): JSON-lines file the results are streamed to
+    - max_plies (int): Plies before a game is adjudicated as a draw
+
+    #### Returns:
+    - TournamentReport: Win/draw/loss and Elo difference of every pair, plus throughput
+    """
+    schedule = [(first, second, fen) for _ in range(rounds) for a, b in combinations(engines, 2)
+                for fen in openings for first, second in ((a, b), (b, a))]
+    standings = {(a.name, b.name): [0, 0, 0] for a, b in combinations(engines, 2)}
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool, open(results_path, 'a') as out:
+        futures = [pool.submit(play_game, white, black, fen, max_plies) for white, black, fen in schedule]
+        for future in as_completed(futures):
+            game = future.result()
+            out.write(json.dumps(game) + '\n')
+            out.flush()
+
+            pair = (game['white'], game['black']) if (game['white'], game['black']) in standings else (game['black'], game['white'])
+            points = {'1-0': 1.0, '0-1': 0.0}.get(game['result'], 0.5)
+            if pair[0] == game['black']:
+                points = 1 - points
+            standings[pair][0 if points == 1 else 1 if points == 0.5 else 2] += 1
+
+    return TournamentReport({pair: tuple(wdl) for pair, wdl in standings.items()}, len(schedule), time.perf_counter() - start)
+
+
+def parse_engine(spec: str) -> EngineConfig:
+    """#### `'name:key=value,key=value'` -> `EngineConfig` (e.g. `'deep:depth=3,max_nodes=2000'`, `'uct:engine=mcts,playouts=300'`)"""
+    name, _, params = spec.partition(':')
+    options, engine = {}, ChessBot.name
+    for item in filter(None, params.split(',')):
+        key, value = item.split('=')
+        if key == 'engine':
+            engine = value
+            continue
+        options[key] = True if value == 'true' else False if value == 'false' else float(value) if '.' in value else int(value)
+    return EngineConfig(name, options, engine)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Headless self-play tournament between bot configurations.')
+    parser.add_argument('--engine', action='append', type=parse_engine,
+                        help="Engine as 'name:key=value,...' (give at least two), e.g. 'd2:depth=2,max_nodes=300' "
+                             "or 'uct:engine=mcts,playouts=300'")
+    parser.add_argument('--rounds', type=int, default=1)
+    parser.add_argument('--openings', type=int, default=len(OPENING_SUITE), help='Number of openings of the suite to use')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-plies', type=int, default=MAX_PLIES)
+    parser.add_argument('--out', default='tournament_results.jsonl')
+    args = parser.parse_args()
+
+    engines = args.engine or [EngineConfig('depth1', {'depth': 1}), EngineConfig('depth2', {'depth': 2, 'max_nodes': 300})]
+    print(run_tournament(engines, OPENING_SUITE[:args.openings], args.rounds, args.workers, args.out, args.max_plies))
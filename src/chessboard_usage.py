@@ -1,7 +1,8 @@
 from chessboard_ import *
 
-# Initialize the chessboard
-board = ChessBoard()
+if __name__ == '__main__': # Needed by the worker processes of the post-game review (`review=True`)
+    # Initialize the chessboard
+    board = ChessBoard()
 
-# Launch the interactive chess game
-board.launch_chess_game()
+    # Launch the interactive chess game
+    board.launch_chess_game()
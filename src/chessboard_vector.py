@@ -0,0 +1,178 @@
+from chessboard_pieces import *
+from typing            import Iterable
+import numpy as np
+
+# Compact square codes: 0 = empty, +1..+6 = white P N B R Q K, -1..-6 = black (index 0 = a8, 63 = h1)
+PIECE_CODES = {'Pawn': 1, 'Knight': 2, 'Bishop': 3, 'Rook': 4, 'Queen': 5, 'King': 6}
+_LETTER_CODES = {'P': 1, 'N': 2, 'B': 3, 'R': 4, 'Q': 5, 'K': 6}
+_PIECES_BY_CODE = (Empty, Pawn, Knight, Bishop, Rook, Queen, King)
+
+def _value_table() -> np.ndarray:
+    """
+    #### `(13, 64)` table of `cap_score + PIECE_SQUARE_TABLES` indexed by `[code + 6, square]`
+    Black rows use the vertically mirrored tables (as `repr_piece.eval_position` does) and are negated,
+    so the score of a position is a single gather and sum.
+    """
+    table = np.zeros((13, 64))
+    for ident, code in PIECE_CODES.items():
+        pst = np.array(PIECE_SQUARE_TABLES[ident], dtype=float)
+        value = _PIECES_BY_CODE[code].cap_score
+        table[6 + code] = (value + pst).ravel()
+        table[6 - code] = -(value + pst[::-1]).ravel()
+    return table
+
+VALUE_TABLE = _value_table()
+_SQUARES = np.arange(64)
+
+# (row, column) shifts on the (8, 8) grid, row 0 = rank 8 (so one rank up is row - 1)
+_LEAPS = {
+    PIECE_CODES['Knight']: [(-dn, dc) for dc, dn in KNIGHT_OFFSETS],
+    PIECE_CODES['King']: [(-dn, dc) for dc, dn in KING_OFFSETS],
+}
+_PAWN_CAPTURES = {1: [(-1, -1), (-1, 1)], -1: [(1, -1), (1, 1)]}  # By sign of the code (White pawns go up)
+_RAYS = {
+    (PIECE_CODES['Rook'], PIECE_CODES['Queen']): [(-dn, dc) for dc, dn in ORTHOGONAL_DIRECTIONS],
+    (PIECE_CODES['Bishop'], PIECE_CODES['Queen']): [(-dn, dc) for dc, dn in DIAGONAL_DIRECTIONS],
+}
+
+def _shift_slices(dr: int, dc: int) -> tuple:
+    """#### `(destination, source)` slices moving every square of an `(N, 8, 8)` array by `(dr, dc)`, off-board squares dropped"""
+    def axis(d: int) -> tuple[slice, slice]:
+        return (slice(d, 8), slice(0, 8 - d)) if d >= 0 else (slice(0, 8 + d), slice(-d, 8))
+    (row_dst, row_src), (col_dst, col_src) = axis(dr), axis(dc)
+    return (slice(None), row_dst, col_dst), (slice(None), row_src, col_src)
+
+_SHIFTS = {shift: _shift_slices(*shift) for shifts in (*_LEAPS.values(), *_PAWN_CAPTURES.values(), *_RAYS.values()) for shift in shifts}
+
+def _shift(mask: np.ndarray, shift: tuple[int, int]) -> np.ndarray:
+    destination, source = _SHIFTS[shift]
+    moved = np.zeros_like(mask)
+    moved[destination] = mask[source]
+    return moved
+
+def encode_placement(placement: str, white_uppercase: bool = True) -> np.ndarray:
+    """
+    #### `(64,)` int8 codes of a placement field
+    - white_uppercase (bool): True for standard FEN, False for this project's board notation (uppercase = Black)
+    """
+    codes = np.zeros(64, dtype=np.int8)
+    square = 0
+    for char in placement:
+        if char.isdigit():
+            square += int(char)
+        elif char != '/':
+            code = _LETTER_CODES[char.upper()]
+            codes[square] = code if char.isupper() == white_uppercase else -code
+            square += 1
+    return codes
+
+def encode_board(board) -> np.ndarray:
+    """#### `(64,)` int8 codes of a `ChessBoard`/`MiniChessboard` (anything with 8 rows of pieces in `.board`)"""
+    return np.array([0 if isinstance(piece, Empty) else PIECE_CODES[piece.ident] * (1 if piece.color == 'white' else -1)
+                     for row in board.board for piece in row], dtype=np.int8)
+
+def encode_positions(positions: Iterable) -> np.ndarray:
+    """
+    ### Encode Many Positions as an `(N, 64)` int8 Array
+
+    #### Each position may be :-
+    - `FEN` (str with spaces): only the placement field is used
+    - `Board notation` (str without spaces): this project's notation, as in `ChessBoard.board_notation`
+    - `Board` object: see `encode_board()`
+    """
+    encoded = []
+    for position in positions:
+        if isinstance(position, str):
+            fen = ' ' in position.strip()
+            encoded.append(encode_placement(position.split()[0], white_uppercase=fen))
+        else:
+            encoded.append(encode_board(position))
+    return np.array(encoded, dtype=np.int8).reshape(-1, 64)
+
+def evaluate_batch(codes: np.ndarray) -> np.ndarray:
+    """
+    ### Vectorized Static Evaluation
+    #### Same score as `chessboard_bot.evaluate_pieces()` (material + piece-square tables, no pawn structure, White's point of view),
+    #### for all positions in one pass.
+    #### Args:
+    - codes (np.ndarray): `(N, 64)` (or `(N, 8, 8)`) int8 array from `encode_positions()`
+    #### Returns:
+    - np.ndarray: `(N,)` float scores, in pawns
+    """
+    codes = np.asarray(codes).reshape(-1, 64)
+    return VALUE_TABLE[codes + 6, _SQUARES].sum(axis=1)
+
+def attack_maps(codes: np.ndarray) -> np.ndarray:
+    """
+    ### Batched Pseudo-Legal Attack Counts
+    #### For every square, the number of pieces of each color attacking it. Sliders stop at the first
+    #### piece of either color (which is attacked), pawns only attack diagonally, pins and checks are ignored.
+    #### The squares with a non-zero count are exactly `MiniChessboard.get_pseudo_legal_mvs(color)`.
+    #### Args:
+    - codes (np.ndarray): `(N, 64)` or `(N, 8, 8)` int8 array from `encode_positions()`
+    #### Returns:
+    - np.ndarray: `(N, 2, 8, 8)` int8 counts, index 0 = White, 1 = Black (row 0 = rank 8)
+    """
+    board = np.asarray(codes).reshape(-1, 8, 8)
+    empty = board == 0
+    attacks = np.zeros((board.shape[0], 2, 8, 8), dtype=np.int8)
+
+    for side, sign in ((0, 1), (1, -1)):
+        counts = attacks[:, side]
+        for code, shifts in (*_LEAPS.items(), (PIECE_CODES['Pawn'], _PAWN_CAPTURES[sign])):
+            pieces = board == sign * code
+            for shift in shifts:
+                counts += _shift(pieces, shift)
+        for kinds, shifts in _RAYS.items():
+            sliders = (board == sign * kinds[0]) | (board == sign * kinds[1])
+            for shift in shifts:
+                ray = sliders
+                for _ in range(7):
+                    ray = _shift(ray, shift)
+                    counts += ray
+                    ray = ray & empty  # The ray stops on the first occupied square
+    return attacks
+
+def mobility(codes: np.ndarray, attacks: np.ndarray = None) -> np.ndarray:
+    """
+    #### Pseudo-legal mobility: attacked squares not occupied by a piece of the same color, summed over the pieces
+    #### Returns:
+    - np.ndarray: `(N, 2)` counts, column 0 = White, 1 = Black
+    """
+    board = np.asarray(codes).reshape(-1, 8, 8)
+    if attacks is None:
+        attacks = attack_maps(board)
+    free = np.stack((board <= 0, board >= 0), axis=1)  # Empty or enemy squares, per color
+    return (attacks * free).sum(axis=(2, 3), dtype=np.int32)
+
+# Examples Usage
+if __name__ == '__main__':
+    from chessboard_           import ChessBoard
+    from chessboard_bot        import evaluate_pieces
+    from chessboard_tournament import OPENING_SUITE
+    import time
+
+    fens = OPENING_SUITE * 1000
+    start = time.perf_counter()
+    codes = encode_positions(fens)
+    encoded = time.perf_counter()
+    scores = evaluate_batch(codes)
+    done = time.perf_counter()
+    print(f"{len(fens)} positions: encoded in {encoded - start:.3f}s, evaluated in {done - encoded:.4f}s")
+
+    boards = [ChessBoard(fen, have_history=False, have_score_board=False) for fen in OPENING_SUITE]
+    start = time.perf_counter()
+    for _ in range(1000):
+        reference = [evaluate_pieces(board) for board in boards]
+    print(f"{len(fens)} positions one by one with evaluate_pieces(): {time.perf_counter() - start:.3f}s")
+    print(np.allclose(scores[:len(boards)], reference)) # -> True
+
+    # Attack maps and mobility of all positions at once, checked against `MiniChessboard`
+    from chessboard_mini import MiniChessboard
+    start = time.perf_counter()
+    attacks = attack_maps(codes)
+    moves = mobility(codes, attacks)
+    print(f"Attack maps + mobility: {(time.perf_counter() - start) / len(fens) * 1e6:.1f} µs per position")
+    mini = MiniChessboard.from_fen(OPENING_SUITE[0])
+    attacked = {f"{chr(ord('a') + col)}{8 - row}" for row, col in zip(*np.nonzero(attacks[0, 1]))}
+    print(attacked == mini.get_pseudo_legal_mvs('black'), moves[0]) # -> True [29 29]
@@ -0,0 +1,28 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from chessboard_fen  import parse_fen
+
+
+class ParseFenTest(unittest.TestCase):
+    def test_pawns_on_the_first_or_last_rank(self):
+        for fen in ('P6k/8/8/8/8/8/8/K7 w - - 0 1', '7k/8/8/8/8/8/8/K6p w - - 0 1'):
+            with self.assertRaises(ValueError):
+                parse_fen(fen)
+
+    def test_en_passant_square(self):
+        parse_fen('rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1')
+        parse_fen('rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3')
+        for fen in ('rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e3 0 1',   # Rank of the wrong side
+                    '4k3/8/8/8/3p4/8/8/4K3 b - e3 0 1',                              # No pawn behind it
+                    'rnbqkbnr/ppp1pppp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3',  # Start square not empty
+                    '4k3/8/8/8/3pP3/8/8/4K3 b - e4 0 1'):
+            with self.assertRaises(ValueError, msg=fen):
+                parse_fen(fen)
+
+
+if __name__ == '__main__':
+    unittest.main()
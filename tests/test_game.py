@@ -0,0 +1,28 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from chessboard_game  import GameState
+
+
+class ApplyTest(unittest.TestCase):
+    def test_promotion_choice(self):
+        game = GameState('8/P6k/8/8/8/8/8/K7 w - - 0 1')
+        self.assertFalse(game.apply(('a7', 'a8=K')).ok)
+        result = game.apply(('a7', 'a8n'))
+        self.assertEqual((result.ok, result.move), (True, ('a7', 'a8 =N')))
+
+    def test_choice_on_a_move_that_does_not_promote(self):
+        game = GameState()
+        for move in (('e2', 'e4=Q'), ('e2', 'e4q'), ('g1', 'f3 =N')):
+            result = game.apply(move)
+            self.assertFalse(result.ok, move)
+            self.assertIn('not a promotion', result.error)
+        self.assertEqual(game.fen, 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1')
+        self.assertTrue(game.apply(('e2', 'e4')).ok)
+
+
+if __name__ == '__main__':
+    unittest.main()
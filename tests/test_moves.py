@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from chessboard_      import ChessBoard
+from chessboard_move  import move_to_uci
+
+
+class EnPassantTest(unittest.TestCase):
+    def board(self, fen: str, en_passant: str = None) -> ChessBoard:
+        board = ChessBoard(fen, have_history=False, have_score_board=False)
+        if en_passant:
+            board.state.en_passant = en_passant  # Inconsistent on purpose: `parse_fen()` rejects such a FEN
+        return board
+
+    def moves(self, board: ChessBoard) -> list[str]:
+        return [move_to_uci(move) for move in board.generate_moves(board.player_turn)]
+
+    def test_needs_the_pawn_that_made_the_double_step(self):
+        self.assertIn('d4e3', self.moves(self.board('4k3/8/8/8/3pP3/8/8/4K3 b - e3 0 1')))
+        self.assertNotIn('d4e3', self.moves(self.board('4k3/8/8/8/3p4/8/8/4K3 b - - 0 1', en_passant='e3')))
+
+    def test_generation_agrees_with_legal_move_code(self):
+        for board in (self.board('4k3/8/8/8/3pP3/8/8/4K3 b - e3 0 1'),
+                      self.board('4k3/8/8/8/3p4/8/8/4K3 b - - 0 1', en_passant='e3'),
+                      self.board('rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3')):
+            generated = set(board.generate_moves(board.player_turn))
+            checked = {board.legal_move_code(frm + rank, to + to_rank)
+                       for frm in 'abcdefgh' for rank in '12345678' for to in 'abcdefgh' for to_rank in '12345678'}
+            self.assertEqual(generated, checked - {None}, board.fen)
+
+
+if __name__ == '__main__':
+    unittest.main()
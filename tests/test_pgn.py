@@ -0,0 +1,30 @@
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from chessboard_pgn  import iter_games, replay_games
+
+
+class IterGamesTest(unittest.TestCase):
+    def games(self, text: str) -> list:
+        return list(iter_games(io.StringIO(text)))
+
+    def test_multi_line_comment(self):
+        games = self.games('[Event "a"]\n\n1. e4 {a long\n[comment] here\n\n} e5 2. Nf3 1-0\n\n[Event "b"]\n\n1. d4 *\n')
+        self.assertEqual([(game.moves, game.result) for game in games], [(['e4', 'e5', 'Nf3'], '1-0'), (['d4'], '*')])
+        self.assertEqual(games[0].headers, {'Event': 'a'})
+
+    def test_semicolon_comment_ends_with_its_line(self):
+        games = self.games('1. e4 ; {not opened\n1... e5 {closed} 2. Nf3 ; x\n1-0\n')
+        self.assertEqual([(game.moves, game.result) for game in games], [(['e4', 'e5', 'Nf3'], '1-0')])
+
+    def test_replay_games(self):
+        report = replay_games(io.StringIO('1. e4 {x\n[y]} e5 2. Qxx9 *\n\n[Event "b"]\n\n1. d4 d5 *\n'))
+        self.assertEqual((report.games, report.moves, report.failed), (2, 2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
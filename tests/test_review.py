@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from chessboard_        import ChessBoard
+from chessboard_review  import replay, review_game
+
+
+class ReviewFromFenTest(unittest.TestCase):
+    FEN = '4k3/8/8/8/8/8/8/3K4 w - - 0 1'
+
+    def play(self, moves: list) -> ChessBoard:
+        board = ChessBoard(self.FEN, have_score_board=False)
+        board.history.clear()  # `History` is shared by the boards of a process
+        for move in moves:
+            board + move
+            board.change_player_turn()
+        return board
+
+    def test_start_fen_is_recorded(self):
+        self.assertEqual(ChessBoard(self.FEN).start_fen, self.FEN)
+        self.assertEqual(ChessBoard().start_fen, 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1')
+
+    def test_review_game_started_from_a_fen(self):
+        board = self.play([('d1', 'd2'), ('e8', 'e7')])
+        with self.assertRaises(ValueError):  # The moves cannot be replayed from the standard position
+            replay(board.history)
+        review = review_game(board.history, fen=board.start_fen, depth=2, workers=0)
+        self.assertEqual([move.move for move in review.moves], [('d1', 'd2'), ('e8', 'e7')])
+        self.assertEqual([move.color for move in review.moves], ['white', 'black'])
+
+
+if __name__ == '__main__':
+    unittest.main()